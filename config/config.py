@@ -54,9 +54,14 @@ DEFAULTS = {
     "pill": {"POSITION": {"x": "center", "y": "bottom"}},
     "network": {"wifi": {"enabled": True}},
     "bluetooth": {"enabled": False},
+    "workspaces": {"previews": {"enabled": False}},
     "top_bar": {"POSITION": "top", "HEIGHT": 32, "SPACING": 8},
     "top_pill": {"POSITION": {"x": "center", "y": "top"}},
     "bindings": {"i3": {}, "modules": {}},
+    "debug": {
+        "frame_timing": {"enabled": False, "overlay": True},
+        "watchdog": {"enabled": False, "threshold_ms": 50},
+    },
 }
 
 
@@ -13,7 +13,7 @@ from config.bindings import (
 )
 from utils.colors import get_css_variable, hex_to_rgb01
 
-from fabric.i3.widgets import get_i3_connection
+from services.i3_service import I3Service
 # from fabric.i3.service import I3MessageType, I3Error
 
 CONFIG_DIR = Path.home() / ".config/i3"
@@ -25,15 +25,8 @@ GENERAL_CONF_PATH = CONFIG_GLOB_PATH / "general.conf"
 
 
 def _reload_i3():
-    try:
-        i3_resp = get_i3_connection().send_command("reload")
-        success = all(
-            r.get("success", False) for r in i3_resp.reply if isinstance(r, dict)
-        )
-        if not success:
-            logger.error("i3 config failed to reload: {}", i3_resp.reply)
-    except Exception as e:
-        logger.error("Error reloading i3 config: {}", e)
+    if not I3Service().command("reload"):
+        logger.error("i3 config failed to reload")
 
 
 # Temporary workaround until my rounded-corners i3 patch is ready and picom shadows work as expected.
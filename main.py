@@ -15,6 +15,9 @@ from modules.core.top.bar import TopBar
 from modules.core.top.pill import TopPill
 from modules.core.bottom.pill import Pill
 from modules.wallpaper import WallpaperService
+from services.theme_colors import ThemeColors
+from services.frame_timing import FrameTimings
+from services.main_loop_watchdog import MainLoopWatchdog
 from modules.core.bottom.dock.bar import DockBar
 from modules.transient_window import TransientWindow
 from modules.core.bottom.shell_window_manager import ShellWindowManager
@@ -73,6 +76,20 @@ if __name__ == "__main__":
 
     config._ensure_directories()
 
+    # opt-in jank hunting; started before any module schedules callbacks
+    # dump with: fabric-cli exec zenith "frame_timings.dump()"
+    frame_timings = None
+    if config.debug.frame_timing.enabled:
+        frame_timings = FrameTimings()
+        frame_timings.start()
+
+    # stack samples of main loop stalls, ranked by call site
+    # dump with: fabric-cli exec zenith "watchdog.dump()"
+    watchdog = None
+    if config.debug.watchdog.enabled:
+        watchdog = MainLoopWatchdog()
+        watchdog.start(config.debug.watchdog.threshold_ms)
+
     # resolve colors fallback
     colors_path = get_relative_path("./styles/colors.css")
     default_path = get_relative_path("./styles/colors.default.css")
@@ -100,6 +117,14 @@ if __name__ == "__main__":
     if config.corners.enabled:
         corners = Corners(config.corners.props.radius)
 
+    frame_timing_overlay = None
+    if frame_timings is not None:
+        from modules.frame_timing_overlay import FrameTimingOverlay
+
+        frame_timing_overlay = FrameTimingOverlay(
+            visible=config.debug.frame_timing.overlay
+        )
+
     app_kwargs = {
         "pill": pill,
         "dockBar": dockBar,
@@ -132,6 +157,7 @@ if __name__ == "__main__":
                 ),
             },
         )
+        ThemeColors().reload()
         # reloads i3wm
         generate_i3_border_theme_config(reload=True)
 
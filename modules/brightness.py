@@ -8,7 +8,6 @@ from widgets.material_label import MaterialIconLabel
 from widgets.animated_scale import AnimatedScale, AnimatedCircularScale
 
 import icons
-import subprocess
 
 import gi
 
@@ -16,21 +15,27 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import Gdk  # noqa: E402
 
 
-def supports_backlight():
-    try:
-        output = (
-            subprocess.check_output(["brightnessctl", "-l"]).decode("utf-8").lower()
-        )
-        return "backlight" in output
-    except Exception:
-        return False
+def device_exists(service_instance, device: str | None) -> bool:
+    # device=None follows whatever primary the service picked, backlight or DDC
+    if device is None:
+        return service_instance.get_primary_device() is not None
+    return device in {d.name for d in service_instance.get_devices()}
+
 
+def connect_brightness_signal(service_instance, device: str | None, callback):
+    # device=None follows the primary output, otherwise filter per-device updates
+    if device is None:
+        return service_instance.connect("value-changed", callback)
 
-BACKLIGHT_SUPPORTED = supports_backlight()
+    def on_device_value_changed(source, changed_device, new_value, max_value):
+        if changed_device == device:
+            callback(source, new_value, max_value)
+
+    return service_instance.connect("device-value-changed", on_device_value_changed)
 
 
 class BrightnessSlider(AnimatedScale):
-    def __init__(self, device: str, service_instance, **kwargs):
+    def __init__(self, service_instance, device: str | None = None, **kwargs):
         super().__init__(
             name="control-slider",
             orientation="h" if not config.VERTICAL else "v",
@@ -46,21 +51,26 @@ class BrightnessSlider(AnimatedScale):
         self.current = 0
         self.max = 0
         self.percentage = 0
-        self.exist = BACKLIGHT_SUPPORTED
+        self.exist = False
         self.hide_timer = None
         self.hover_counter = 0
         self.add_style_class("brightness")
         self.update_from_user = False
         self.ui_updating = False
         self.init_brightness()
-        self.service_instance.connect("value-changed", self.update_brightness_slider)
+        connect_brightness_signal(
+            self.service_instance, self.device, self.update_brightness_slider
+        )
+        self.service_instance.connect("devices-changed", self.init_brightness)
         self.connect("change-value", self.set_brightness)
 
-    def init_brightness(self):
+    def init_brightness(self, *_):
+        # a DDC primary can turn up after the widget, once detection finishes
+        self.exist = device_exists(self.service_instance, self.device)
         if self.exist:
-            self.current = self.service_instance.get_brightness()
-            self.max = self.service_instance.get_max_brightness()
-            self.percentage = self.current / self.max
+            self.current = self.service_instance.get_brightness(self.device)
+            self.max = self.service_instance.get_max_brightness(self.device)
+            self.percentage = self.current / self.max if self.max > 0 else 0
             self.update_brightness_slider(None, self.current, self.max)
 
     def update_brightness_slider(self, source, new_value, max_value):
@@ -79,11 +89,11 @@ class BrightnessSlider(AnimatedScale):
     def set_brightness(self, source, scroll_type, value):
         self.update_from_user = True
         new_value = int(value * 100)
-        self.service_instance.set_brightness(new_value)
+        self.service_instance.set_brightness(new_value, self.device)
 
 
 class BrightnessSmall(Box):
-    def __init__(self, device: str, service_instance, **kwargs):
+    def __init__(self, service_instance, device: str | None = None, **kwargs):
         super().__init__(name="button-bar-brightness", **kwargs)
         # self.brightness = Brightness.get_initial()
         # if self.brightness.screen_brightness == -1:
@@ -94,7 +104,7 @@ class BrightnessSmall(Box):
         self.current = 0
         self.max = 0
         self.percentage = 0
-        self.exist = BACKLIGHT_SUPPORTED
+        self.exist = False
 
         self.brightness_label = MaterialIconLabel(
             name="brightness-label",
@@ -123,24 +133,31 @@ class BrightnessSmall(Box):
         self.add(self.event_box)
         self.add_events(Gdk.EventMask.SCROLL_MASK | Gdk.EventMask.SMOOTH_SCROLL_MASK)
 
-        self.service_instance.connect("value-changed", self.on_brightness_changed)
+        connect_brightness_signal(
+            self.service_instance, self.device, self.on_brightness_changed
+        )
+        self.service_instance.connect("devices-changed", self.init_brightness)
         self.init_brightness()
 
-    def init_brightness(self):
+    def init_brightness(self, *_):
+        # a DDC primary can turn up after the widget, once detection finishes
+        self.exist = device_exists(self.service_instance, self.device)
         if self.exist:
-            self.current = self.service_instance.get_brightness()
-            self.max = self.service_instance.get_max_brightness()
-            self.percentage = self.current / self.max
+            self.current = self.service_instance.get_brightness(self.device)
+            self.max = self.service_instance.get_max_brightness(self.device)
+            self.percentage = self.current / self.max if self.max > 0 else 0
             self.on_brightness_changed(self, self.current, self.max)
 
     def on_scroll(self, widget, event):
         match event.direction:
             case 0:
-                self.service_instance.increment_brightness()
+                self.service_instance.increment_brightness(self.device)
             case 1:
-                self.service_instance.decrement_brightness()
+                self.service_instance.decrement_brightness(self.device)
 
     def on_brightness_changed(self, source, new_value, max_value):
+        if max_value <= 0:
+            return
         self.percentage = 100 * new_value / max_value
         self.progress_bar.animate_value(self.percentage / 100)
 
@@ -151,7 +168,9 @@ class BrightnessSmall(Box):
 
 
 class BrightnessMaterial3(AnimatedScale):
-    def __init__(self, device: str, service_instance, orientation="h", **kwargs):
+    def __init__(
+        self, service_instance, device: str | None = None, orientation="h", **kwargs
+    ):
         super().__init__(
             name="control-slider-mui",
             orientation=orientation,
@@ -167,21 +186,26 @@ class BrightnessMaterial3(AnimatedScale):
         self.current = 0
         self.max = 0
         self.percentage = 0
-        self.exist = BACKLIGHT_SUPPORTED
+        self.exist = False
         self.add_style_class("brightness")
         self.update_from_user = False
         self.ui_updating = False
-        self.service_instance.connect("value-changed", self.update_brightness_slider)
+        connect_brightness_signal(
+            self.service_instance, self.device, self.update_brightness_slider
+        )
+        self.service_instance.connect("devices-changed", self.init_brightness)
         self.connect("change-value", self.set_brightness)
 
         # init
         self.init_brightness()
 
-    def init_brightness(self):
+    def init_brightness(self, *_):
+        # a DDC primary can turn up after the widget, once detection finishes
+        self.exist = device_exists(self.service_instance, self.device)
         if self.exist:
-            self.current = self.service_instance.get_brightness()
-            self.max = self.service_instance.get_max_brightness()
-            self.percentage = self.current / self.max
+            self.current = self.service_instance.get_brightness(self.device)
+            self.max = self.service_instance.get_max_brightness(self.device)
+            self.percentage = self.current / self.max if self.max > 0 else 0
             self.update_brightness_slider(None, self.current, self.max)
 
     def update_brightness_slider(self, source, new_value, max_value):
@@ -200,4 +224,4 @@ class BrightnessMaterial3(AnimatedScale):
     def set_brightness(self, source, scroll_type, value):
         self.update_from_user = True
         new_value = int(value * 100)
-        self.service_instance.set_brightness(new_value)
+        self.service_instance.set_brightness(new_value, self.device)
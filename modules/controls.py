@@ -71,7 +71,6 @@ class ControlsManager:
     def _init_controls_box(self):
         self.popup_slider_vol = self.volume_manager.mui_slider
         self.popup_slider_brightness = BrightnessMaterial3(
-            device="intel_backlight",
             service_instance=self.brightness_manager.service,
             orientation="v",
         )
@@ -88,19 +87,32 @@ class ControlsManager:
             )
         )
 
+        self.popup_slider_container = Box(
+            name="control-slider-mui-container",
+            spacing=7,
+            children=[
+                self.popup_slider_mic,
+                self.popup_slider_vol,
+                self.popup_slider_brightness,
+            ],
+        )
+
         self.popup_win = SharedPopupWindow()
         self.popup_win.add_child(
             pointing_widget=self.vol_brightness_box,
-            child=Box(
-                name="control-slider-mui-container",
-                spacing=7,
-                children=[
-                    self.popup_slider_mic,
-                    self.popup_slider_vol,
-                    self.popup_slider_brightness,
-                ],
-            ),
+            child=self.popup_slider_container,
+        )
+
+        self.brightness_manager.service.connect(
+            "devices-changed", self._sync_output_sliders
         )
+        self._sync_output_sliders()
+
+    def _sync_output_sliders(self, *_):
+        # one slider per extra output (other backlights, DDC monitors)
+        for slider in self.brightness_manager.get_output_sliders():
+            if slider.get_parent() is None:
+                self.popup_slider_container.add(slider)
 
     # getters
     def get_controls_box(self):
@@ -150,22 +162,17 @@ class BrightnessManager:
                 name="brightness",
                 transition_duration=250,
                 transition_type=transition,
-                child=BrightnessSlider(
-                    device="intel_backlight", service_instance=self.service
-                ),
+                child=BrightnessSlider(service_instance=self.service),
                 child_revealed=False,
             )
         )
 
-        self.brightness_slider_mui = BrightnessMaterial3(
-            device="intel_backlight", service_instance=self.service
-        )
+        self.brightness_slider_mui = BrightnessMaterial3(service_instance=self.service)
 
-        self.brightness_small = BrightnessSmall(
-            device="intel_backlight", service_instance=self.service
-        )
+        self.brightness_small = BrightnessSmall(service_instance=self.service)
 
         self.brightness_revealer_set = [self.brightness_revealer]
+        self.output_sliders: dict[str, BrightnessMaterial3] = {}
 
     def _connect_signals(self):
         self.service.connect("value-changed", self._on_brightness_changed)
@@ -177,6 +184,19 @@ class BrightnessManager:
         self.brightness_small.init_brightness()
         self.brightness_slider_mui.init_brightness()
 
+    def get_output_sliders(self) -> list[BrightnessMaterial3]:
+        primary = self.service.get_primary_device()
+        for device in self.service.get_devices():
+            if device.name == primary or device.name in self.output_sliders:
+                continue
+            self.output_sliders[device.name] = BrightnessMaterial3(
+                service_instance=self.service,
+                device=device.name,
+                orientation="v",
+                tooltip_text=device.label,
+            )
+        return list(self.output_sliders.values())
+
 
 class VolumeManager:
     _instance = None
@@ -3,12 +3,12 @@ from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.datetime import DateTime
 from fabric.widgets.x11 import X11Window as Window
-from i3ipc import Connection
 
 from modules.systray import SystemTray
 from modules.workspaces.workspaces import Workspaces
 from modules.metrics.metrics import MetricsSmall, Battery
 from modules.core.bottom.dock.v0.dock_modules import DockModuleOverlay
+from services.i3_service import I3Service
 
 import config.info as info
 import icons
@@ -38,7 +38,7 @@ class DockBar(Window):
             **kwargs,
         )
         self.bool = False
-        self.i3 = Connection()
+        self.i3 = I3Service()
         if info.VERTICAL:
             self.i3.command("gaps left all set 44px")
             self.i3.command("gaps bottom all set 3px")
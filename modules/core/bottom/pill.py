@@ -7,6 +7,7 @@ from fabric.utils.helpers import exec_shell_command_async
 from widgets.clipping_box import ClippingBox
 from widgets.elastic.elastic_stack import ElasticStack
 from widgets.overrides import PatchedX11Window as Window
+from services.i3_service import I3Service
 from services.power_profiles import power_profiles_service
 
 from modules.dashboard import Dashboard
@@ -130,10 +131,10 @@ class Pill(Window, Service):
         self.stack.set_bounce(self._animations_enabled)
 
     def focus_pill(self):
-        exec_shell_command_async(f'i3-msg [window_role="^{self.WIN_ROLE}$"] focus')
+        I3Service().run(f'[window_role="^{self.WIN_ROLE}$"] focus')
 
     def unfocus_pill(self):
-        exec_shell_command_async("i3-msg focus mode_toggle")
+        I3Service().run("focus mode_toggle")
 
     def lift_pill(self):
         if self._dock_is_visible and (
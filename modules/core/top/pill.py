@@ -8,6 +8,7 @@ from widgets.clipping_box import ClippingBox
 from widgets.material_label import MaterialIconLabel
 from widgets.elastic.elastic_stack import ElasticStack
 from widgets.overrides import PatchedX11Window as Window
+from services.i3_service import I3Service
 
 from modules.notifications.notification import NotificationManager
 
@@ -113,10 +114,10 @@ class TopPill(Window, Service):
         self.connect("delete-event", self.on_delete_event)
 
     def focus_pill(self):
-        exec_shell_command_async(f'i3-msg [window_role="^{self.WIN_ROLE}$"] focus')
+        I3Service().run(f'[window_role="^{self.WIN_ROLE}$"] focus')
 
     def unfocus_pill(self):
-        exec_shell_command_async("i3-msg focus mode_toggle")
+        I3Service().run("focus mode_toggle")
 
     def lift_pill(self):
         if not self.is_lift_enable:
@@ -1,14 +1,23 @@
 from fabric.widgets.box import Box
 from fabric.widgets.shapes import Corner
 
+from widgets.layer_cache import LayerCache
 from widgets.overrides import PatchedX11Window as Window
 
 
+class CachedCorner(LayerCache, Corner):
+    # the shape never changes, composite it instead of re-clipping every expose
+    def do_draw(self, cr):
+        self.paint_layer(
+            cr, "corner", lambda layer_cr, *_: Corner.do_draw(self, layer_cr)
+        )
+
+
 class MyCorner(Box):
     def __init__(self, corner, radius: int):
         super().__init__(
             name="corner-container",
-            children=Corner(
+            children=CachedCorner(
                 name="corner",
                 orientation=corner,
                 size=radius,
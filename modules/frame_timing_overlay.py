@@ -0,0 +1,77 @@
+from fabric.widgets.box import Box
+from fabric.widgets.label import Label
+
+from widgets.overrides import PatchedX11Window as Window
+
+from services.visibility import VisibilityTracker
+from services.frame_timing import FrameTimings, FRAME_BUDGET
+
+REFRESH_INTERVAL = 500  # ms
+TOP_ROWS = 5
+
+
+class FrameTimingOverlay(Window):
+    """Click-through corner readout of `FrameTimings`, for spotting jank live."""
+
+    def __init__(self, visible: bool = True):
+        super().__init__(
+            name="frame-timing-overlay",
+            layer="top",
+            geometry="top-right",
+            type_hint="notification",
+            focusable=False,
+            pass_through=True,
+            visible=False,
+        )
+        self.timings = FrameTimings()
+
+        self.label = Label(
+            name="frame-timing-label",
+            style="font-family: monospace; font-size: 11px;",
+            h_align="start",
+            justification="left",
+        )
+        self.children = Box(
+            style="padding: 8px; background-color: rgba(0, 0, 0, 0.7);",
+            children=self.label,
+        )
+
+        VisibilityTracker().add_timeout(self.label, REFRESH_INTERVAL, self._refresh)
+        self.set_visible(visible)
+
+    def toggle(self) -> None:
+        self.set_visible(not self.get_visible())
+
+    def _refresh(self) -> bool:
+        if not self.timings.running:
+            self.label.set_label("frame timings off")
+            return True
+
+        report = self.timings.report(top=TOP_ROWS)
+        lines = [f"budget {FRAME_BUDGET:.0f} ms    window  fps  p95  max  over"]
+        for window in report["windows"]:
+            frame = window["frame"]
+            if not frame["count"]:
+                continue
+            lines.append(
+                f"{window['window'][:28]:<28} {window['fps']:>4.0f}"
+                f" {frame['p95_ms']:>4.1f} {frame['max_ms']:>4.0f}"
+                f" {frame['over_budget']:>5}"
+            )
+
+        for title, rows in (("draw", report["draws"]), ("stall", report["callbacks"])):
+            if rows:
+                lines.append(f"slowest {title}s (total / max ms)")
+                lines.extend(
+                    f"  {row['name'][-40:]:<40} {row['total_ms']:>7.0f}"
+                    f" {row['max_ms']:>5.0f}"
+                    for row in rows
+                )
+
+        for event in self.timings.recent_events(3):
+            lines.append(
+                f"! {event['kind']} {event['ms']:.0f} ms {event['source'][-40:]}"
+            )
+
+        self.label.set_label("\n".join(lines))
+        return True
@@ -11,6 +11,7 @@ from widgets.animated_scale import AnimatedScale
 from widgets.popup_window import SharedPopupWindow
 from widgets.material_label import MaterialIconLabel
 from services.metrics import MetricsProvider
+from services.visibility import VisibilityTracker
 
 import icons as icons
 from config.config import config
@@ -72,7 +73,10 @@ class MetricsSmall(Button):
 
         self.connect("enter-notify-event", self.on_mouse_enter)
         self.connect("leave-notify-event", self.on_mouse_leave)
-        self.service.connect("metrics-changed", self.update_metrics)
+        # nothing to show while the bar is hidden; catch up when it returns
+        visibility = VisibilityTracker()
+        visibility.connect(self, self.service, "metrics-changed", self.update_metrics)
+        visibility.watch(self, self._on_visibility_changed)
 
         self.popup_win = SharedPopupWindow()
         self.popup_win.add_child(pointing_widget=self, child=Metrics())
@@ -107,6 +111,10 @@ class MetricsSmall(Button):
         # self.hide_timer = None
         return False
 
+    def _on_visibility_changed(self, visible: bool):
+        if visible:
+            self.update_metrics(self.service, *self.service.get_metrics())
+
     def update_metrics(self, source, cpu, mem, disk):
         self.cpu.update(cpu, config.VERTICAL)
         self.ram.update(mem, config.VERTICAL)
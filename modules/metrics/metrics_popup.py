@@ -9,6 +9,7 @@ from widgets.clipping_box import ClippingBox
 from widgets.graphs import AnimatedBarGraph, CircularGraph
 from widgets.material_label import MaterialIconLabel, MaterialFontLabel
 from services.metrics import MetricsProvider
+from services.visibility import VisibilityTracker
 
 import icons as icons
 
@@ -33,11 +34,17 @@ class Metrics(Box):
         self._build_layout()
 
         self.cpu_name_label.set_label(self.service.cpu_brand)
-        GLib.timeout_add_seconds(1, self._update_ui)
-        GLib.timeout_add_seconds(
-            1,
+
+        # history keeps filling while the popup is closed, the rest waits
+        GLib.timeout_add_seconds(1, self._record_history)
+        visibility = VisibilityTracker()
+        visibility.add_timeout(self, 1000, self._update_ui)
+        visibility.add_timeout(
+            self.cpu_circular_graph,
+            1000,
             lambda: self.cpu_circular_graph._update_targets(psutil.cpu_percent(percpu=True)),
         )
+        visibility.watch(self, lambda visible: visible and self._update_ui())
 
     def _build_widgets(self):
         self.cpu_graph = AnimatedBarGraph(bar_width=4, color="#3498db", history_seconds=HISTORY_DEF)
@@ -209,11 +216,14 @@ class Metrics(Box):
             ),
         ]
 
-    def _update_ui(self) -> bool:
-        cpu, mem, disk = self.service.get_metrics()
-
+    def _record_history(self) -> bool:
+        cpu, mem, _ = self.service.get_metrics()
         self.cpu_graph.add_value(cpu)
         self.mem_graph.add_value(mem)
+        return True
+
+    def _update_ui(self) -> bool:
+        cpu, mem, disk = self.service.get_metrics()
 
         self.cpu_label.set_label(f"{cpu:.0f}%")
         self.disk_label.set_label(f"{disk:.0f}%")
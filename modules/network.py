@@ -282,6 +282,7 @@ class WifiButton(EventBox):
         ap: dict,
         network_service: NetworkService,
         on_connect: Callable[[str, Optional[str]], None],
+        is_saved: Optional[bool] = None,
         **kwargs,
     ):
         self.ap = ap
@@ -297,7 +298,11 @@ class WifiButton(EventBox):
         self.strength = self.ap.get("strength", 0)
         self.secured = self.ap.get("secured", False)
         self.active = self.ap.get("active", False)
-        self.is_saved = self.ssid in self.nm.get_saved_networks()
+        self.is_saved = (
+            is_saved
+            if is_saved is not None
+            else self.ssid in self.nm.get_saved_networks()
+        )
 
         self._build_ui()
 
@@ -320,10 +325,11 @@ class WifiButton(EventBox):
             name="ap-label", label="Connecting...", h_align="start"
         )
 
-        children = [
-            MaterialIconLabel(icon_text=self._get_wifi_icon(), h_expand=False),
-            self.label_box,
-        ]
+        self.wifi_icon = MaterialIconLabel(
+            icon_text=self._get_wifi_icon(), h_expand=False
+        )
+
+        children = [self.wifi_icon, self.label_box]
 
         if self.is_saved and not self.active:
             children.append(
@@ -356,6 +362,27 @@ class WifiButton(EventBox):
         self.content = Box(name="ap-button", spacing=10, children=children)
         self.children = self.content
 
+    def update_ap(self, ap: dict) -> None:
+        """Patch the row in place; only a change in state rebuilds its content."""
+        self.ap = ap
+        active = ap.get("active", False)
+        secured = ap.get("secured", False)
+        strength = ap.get("strength", 0)
+
+        if (active, secured) != (self.active, self.secured):
+            self.active, self.secured, self.strength = active, secured, strength
+            self.is_saved = self.ssid in self.nm.get_saved_networks()
+            self._build_ui()
+            if active:
+                self.add_style_class("active")
+            else:
+                self.remove_style_class("active")
+            return
+
+        if strength != self.strength:
+            self.strength = strength
+            self.wifi_icon.set_icon(self._get_wifi_icon())
+
     def _get_wifi_icon(self) -> str:
         if self.strength > 80:
             return icons.wifi_4.symbol()
@@ -628,6 +655,11 @@ class EthernetButton(EventBox):
 
 
 class NetworkListManager:
+    """
+    Keeps one WifiButton per SSID and patches rows from the service's deltas
+    instead of rebuilding the whole list on every scan.
+    """
+
     def __init__(
         self,
         active_container: Box,
@@ -640,55 +672,96 @@ class NetworkListManager:
         self.nm = network_service
         self.on_connect = on_connect
 
+        self._rows: dict[str, WifiButton] = {}
+        self._empty_label: Optional[Label] = None
+
     def update(self, wifi_list: list[dict]) -> None:
+        """Full resync from a snapshot of the network list."""
         self._clear()
+        self.apply(wifi_list, [], [])
 
-        if not wifi_list:
-            self._show_empty_state()
-            return
+    def apply(self, added: list[dict], removed: list[str], updated: list[dict]) -> None:
+        for ssid in removed:
+            if (row := self._rows.pop(ssid, None)) is not None:
+                row.destroy()
 
-        active_networks = []
-        available_networks = []
+        saved = set(self.nm.get_saved_networks()) if added else set()
+
+        for network in added + updated:
+            ssid = network.get("ssid")
+            if not ssid:
+                continue
 
-        for network in wifi_list:
-            if not network.get("ssid"):
+            row = self._rows.get(ssid)
+            if row is not None:
+                row.update_ap(network)
+                self._place(row)
                 continue
 
             try:
-                button = add_hover_cursor(
+                row = add_hover_cursor(
                     widget=WifiButton(
-                        ap=network, network_service=self.nm, on_connect=self.on_connect
+                        ap=network,
+                        network_service=self.nm,
+                        on_connect=self.on_connect,
+                        is_saved=ssid in saved,
                     )
                 )
+            except Exception as e:
+                logger.error(f"Error creating button for {ssid}: {e}")
+                continue
 
-                if network.get("active", False):
-                    active_networks.append(button)
-                else:
-                    available_networks.append(button)
+            self._rows[ssid] = row
+            self._place(row)
 
-            except Exception as e:
-                logger.error(
-                    f"Error creating button for {network.get('ssid', 'Unknown')}: {e}"
-                )
+        self._sort_available()
+        self._update_empty_state()
 
-        for button in active_networks:
-            self.active_container.add(button)
+    def _place(self, row: WifiButton) -> None:
+        target = self.active_container if row.active else self.available_container
+        parent = row.get_parent()
+        if parent is target:
+            return
+        if parent is not None:
+            parent.remove(row)
+        target.add(row)
+
+    def _sort_available(self) -> None:
+        rows = sorted(
+            (row for row in self._rows.values() if not row.active),
+            key=lambda row: row.strength,
+            reverse=True,
+        )
+        current = [
+            child
+            for child in self.available_container.get_children()
+            if child is not self._empty_label
+        ]
+        if current == rows:
+            return
+        for index, row in enumerate(rows):
+            self.available_container.reorder_child(row, index)
+
+    def _update_empty_state(self) -> None:
+        if self._rows:
+            if self._empty_label is not None:
+                self._empty_label.destroy()
+                self._empty_label = None
+            return
 
-        available_networks.sort(key=lambda btn: btn.ap.get("strength", 0), reverse=True)
-        for button in available_networks:
-            self.available_container.add(button)
+        if self._empty_label is None:
+            self._empty_label = Label(
+                label="No networks found", style_classes=["dim-label"], h_align="center"
+            )
+            self.available_container.add(self._empty_label)
 
     def _clear(self) -> None:
+        self._rows.clear()
+        self._empty_label = None
         for container in [self.active_container, self.available_container]:
             for child in container.get_children():
                 child.destroy()
 
-    def _show_empty_state(self) -> None:
-        empty_label = Label(
-            label="No networks found", style_classes=["dim-label"], h_align="center"
-        )
-        self.available_container.add(empty_label)
-
 
 class Network(TileSimpleWithMenu):
     STATUS_LABELS = {
@@ -724,7 +797,7 @@ class Network(TileSimpleWithMenu):
 
         self.wifi_dev = self.nm.get_wifi_device()
         if self.wifi_dev:
-            self.wifi_dev.connect("ap-change", self._on_ap_list_change)
+            self.wifi_dev.connect("networks-changed", self._on_networks_changed)
             self.wifi_dev.connect("connection-result", self._on_connection_result)
 
         self._primary_device_singal_id = None
@@ -789,6 +862,8 @@ class Network(TileSimpleWithMenu):
             self.nm.get_wifi_device(),
             self._handle_network_connect,
         )
+        if self.wifi_dev:
+            self.list_manager.update(self.wifi_dev.get_networks())
 
         self.password_dialog: Optional[PasswordDialog] = None
 
@@ -958,10 +1033,15 @@ class Network(TileSimpleWithMenu):
             switch.set_active(not enabled)
             self.wifi_toggle.handler_unblock(self.wifi_handler_id)
 
-    def _on_ap_list_change(self, source: NetworkService) -> None:
+    def _on_networks_changed(
+        self,
+        source: WifiDevice,
+        added: list[dict],
+        removed: list[str],
+        updated: list[dict],
+    ) -> None:
         try:
-            wifi_list = self.wifi_dev.get_networks()
-            self.list_manager.update(wifi_list)
+            self.list_manager.apply(added, removed, updated)
         except Exception as e:
             logger.error(f"Error updating access point list: {e}")
             self.list_manager._clear()
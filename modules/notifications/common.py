@@ -12,6 +12,10 @@ class NotificationConfig:
     TRANSITION_DURATION = 250
     REVEALER_TRANSITION_TYPE = "slide-down"
     MAX_ACTIVE_NOTIFS = 2
+    INGEST_WINDOW = 100  # ms to collect a burst before handling it
+    MAX_BATCHES_PER_FRAME = 4
+    HISTORY_INITIAL_GROUPS = 5
+    HISTORY_PAGE_GROUPS = 3
     WINDOW_MIN_HEIGHT = 10
     WINDOW_MIN_WIDTH = 364
     WINDOW_MAX_HEIGHT = 700
@@ -0,0 +1,332 @@
+import os
+import json
+import time
+import queue
+import threading
+from loguru import logger
+from datetime import datetime
+from dataclasses import dataclass, asdict
+
+from fabric.core.service import Service, Signal
+from fabric.notifications.service import Notification
+
+from config.info import CACHE_DIR
+
+from .common import NotificationConfig
+
+from gi.repository import GdkPixbuf, GLib
+
+HISTORY_DIR = os.path.join(CACHE_DIR, "notifications")
+HISTORY_FILE = os.path.join(HISTORY_DIR, "history.jsonl")
+
+
+@dataclass
+class HistoryRecord:
+    id: int
+    app: str
+    icon: str
+    summary: str
+    body: str
+    urgency: int
+    created: float
+    image: str | None = None  # path the sender pointed at, never a copy
+
+
+class HistoryNotification(Service):
+    """
+    Stands in for a `Notification` when a record is restored from the log, so
+    the grouped widgets can treat live and restored notifications alike.
+    """
+
+    @Signal
+    def closed(self, reason: object) -> None: ...
+
+    def __init__(self, record: HistoryRecord, history: "NotificationHistory"):
+        super().__init__()
+        self.record = record
+        self._history = history
+
+        # negative ids never collide with the ones handed out over D-Bus
+        self.id = -record.id
+        self.app_name = record.app
+        self.app_icon = record.icon
+        self.summary = record.summary
+        self.body = record.body
+        self.urgency = record.urgency
+        self.actions = []
+        self.history_id = record.id
+        self.history_timestamp = datetime.fromtimestamp(record.created)
+        self._image_pixbuf: GdkPixbuf.Pixbuf | None = None
+        self._image_loaded = False
+
+    @property
+    def image_pixbuf(self) -> GdkPixbuf.Pixbuf | None:
+        # decoded once; the shape picker, group icon and image store all ask
+        if not self._image_loaded:
+            self._image_loaded = True
+            self._image_pixbuf = self._load_image()
+        return self._image_pixbuf
+
+    def _load_image(self) -> GdkPixbuf.Pixbuf | None:
+        path = self.record.image
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                path, NotificationConfig.IMAGE_SIZE * 2, -1, True
+            )
+        except GLib.Error:
+            return None
+
+    def close(self):
+        self._history.forget(self.record.id)
+        self.closed("dismissed-by-user")
+
+
+class _Writer:
+    """One thread running file jobs strictly in the order they were queued."""
+
+    def __init__(self):
+        self._jobs: queue.Queue = queue.Queue()
+        threading.Thread(target=self._run, name="notif-history", daemon=True).start()
+
+    def submit(self, job, *args) -> None:
+        self._jobs.put((job, args))
+
+    def wait(self) -> None:
+        self._jobs.join()
+
+    def _run(self) -> None:
+        while True:
+            job, args = self._jobs.get()
+            try:
+                job(*args)
+            finally:
+                self._jobs.task_done()
+
+
+class NotificationHistory:
+    """
+    Append-only log of the notifications currently kept in the panel.
+
+    Every add/forget is one compact JSON line, appended in batches off the main
+    thread. Once the log grows past its bounds it is rewritten in the
+    background with only the live records, newest `MAX_RECORDS` kept. Appends
+    and rewrites share one ordered writer, so an append queued before a
+    rewrite can never land after it.
+    """
+
+    _instance = None
+
+    MAX_RECORDS = 500
+    MAX_LOG_BYTES = 512 * 1024
+    FLUSH_INTERVAL = 1000  # ms
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self._records: dict[int, HistoryRecord] = {}
+        self._by_app: dict[str, list[int]] = {}  # ids, oldest first
+        self._pending: list[str] = []
+        self._flush_id: int | None = None
+        self._loaded = False
+        self._compacting = False
+        self._recompact = False
+        self._log_lines = 0
+        self._writer = _Writer()
+        self._clear_on_load = False
+        self._closed = False
+
+    # --- loading ---
+
+    def load(self, callback) -> None:
+        """Read the log on a thread, then call `callback()` on the main loop."""
+        threading.Thread(
+            target=self._read_log, args=(callback,), name="notif-history", daemon=True
+        ).start()
+
+    def _read_log(self, callback) -> None:
+        records: dict[int, HistoryRecord] = {}
+        lines = 0
+        try:
+            with open(HISTORY_FILE) as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                        if entry.pop("op") == "add":
+                            records[entry["id"]] = HistoryRecord(**entry)
+                        else:
+                            records.pop(entry["id"], None)
+                    except (ValueError, KeyError, TypeError):
+                        continue  # torn write, skip it
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"[Notifications] Failed to read history: {e}")
+
+        GLib.idle_add(self._on_loaded, records, lines, callback)
+
+    def _on_loaded(self, records: dict[int, HistoryRecord], lines: int, callback):
+        if self._clear_on_load:
+            records.clear()
+
+        # anything recorded while loading is newer than the log
+        records.update(self._records)
+        self._records = dict(sorted(records.items(), key=lambda r: r[1].created))
+        self._by_app.clear()
+        for record in self._records.values():
+            self._by_app.setdefault(record.app, []).append(record.id)
+
+        self._log_lines = lines
+        self._loaded = True
+        self._trim()
+        if self._clear_on_load:
+            self._compact()
+        else:
+            self._schedule_flush()
+        callback()
+        return False
+
+    # --- queries ---
+
+    def apps_by_recency(self) -> list[str]:
+        return sorted(
+            self._by_app,
+            key=lambda app: self._records[self._by_app[app][-1]].created,
+            reverse=True,
+        )
+
+    def records_for(self, app: str) -> list[HistoryRecord]:
+        return [self._records[i] for i in self._by_app.get(app, [])]
+
+    # --- writes ---
+
+    def record(self, notification: Notification) -> int:
+        record = HistoryRecord(
+            id=time.time_ns(),
+            app=notification.app_name or "",
+            icon=notification.app_icon or "",
+            summary=notification.summary or "",
+            body=notification.body or "",
+            urgency=notification.urgency,
+            created=time.time(),
+            image=getattr(notification, "image_file", None) or None,
+        )
+        self._records[record.id] = record
+        self._by_app.setdefault(record.app, []).append(record.id)
+        self._append({"op": "add", **asdict(record)})
+        self._trim()
+        return record.id
+
+    def forget(self, record_id: int) -> None:
+        record = self._records.pop(record_id, None)
+        if record is None:
+            return
+        ids = self._by_app.get(record.app, [])
+        if record_id in ids:
+            ids.remove(record_id)
+        if not ids:
+            self._by_app.pop(record.app, None)
+        self._append({"op": "del", "id": record_id})
+
+    def clear(self) -> None:
+        if self._closed:
+            return
+        self._records.clear()
+        self._by_app.clear()
+        if self._loaded:
+            self._compact()
+        else:
+            self._clear_on_load = True
+
+    def close(self) -> None:
+        """Write out what is pending and stop recording, e.g. on shutdown."""
+        if self._flush_id is not None:
+            GLib.source_remove(self._flush_id)
+            self._flush_id = None
+        if self._loaded and self._pending:
+            lines, self._pending = self._pending, []
+            self._writer.submit(self._write, lines)
+        self._writer.wait()
+        self._closed = True
+
+    def _trim(self) -> None:
+        if not self._loaded:
+            return
+        # records are kept in insertion order, oldest first
+        excess = len(self._records) - self.MAX_RECORDS
+        for record_id in list(self._records)[: max(0, excess)]:
+            self.forget(record_id)
+
+    def _append(self, entry: dict) -> None:
+        if self._closed:
+            return
+        self._pending.append(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        # nothing is written before the old log is read, it would be replayed
+        if not self._loaded or not self._pending or self._flush_id is not None:
+            return
+        self._flush_id = GLib.timeout_add(self.FLUSH_INTERVAL, self._flush)
+
+    def _flush(self) -> bool:
+        self._flush_id = None
+        lines, self._pending = self._pending, []
+        self._log_lines += len(lines)
+
+        if self._log_lines > 2 * len(self._records) + 64 and not self._compacting:
+            self._compact()
+        else:
+            self._writer.submit(self._write, lines)
+        return False
+
+    def _write(self, lines: list[str]) -> None:
+        try:
+            os.makedirs(HISTORY_DIR, exist_ok=True)
+            with open(HISTORY_FILE, "a") as f:
+                f.writelines(lines)
+            if os.path.getsize(HISTORY_FILE) > self.MAX_LOG_BYTES:
+                GLib.idle_add(lambda: self._compact() or False)
+        except OSError as e:
+            logger.warning(f"[Notifications] Failed to write history: {e}")
+
+    # --- compaction ---
+
+    def _compact(self) -> None:
+        if self._compacting:
+            self._recompact = True
+            return
+        self._compacting = True
+
+        # the snapshot already covers every line still pending
+        self._pending.clear()
+        lines = [
+            json.dumps({"op": "add", **asdict(r)}, separators=(",", ":")) + "\n"
+            for r in self._records.values()
+        ]
+        self._log_lines = len(lines)
+        self._writer.submit(self._rewrite, lines)
+
+    def _rewrite(self, lines: list[str]) -> None:
+        tmp = HISTORY_FILE + ".tmp"
+        try:
+            os.makedirs(HISTORY_DIR, exist_ok=True)
+            with open(tmp, "w") as f:
+                f.writelines(lines)
+            os.replace(tmp, HISTORY_FILE)
+        except OSError as e:
+            logger.warning(f"[Notifications] Failed to compact history: {e}")
+        GLib.idle_add(self._on_compacted)
+
+    def _on_compacted(self) -> bool:
+        self._compacting = False
+        if self._recompact:
+            self._recompact = False
+            self._compact()
+        return False
@@ -1,22 +1,93 @@
 import os
 import re
 import json
+import threading
 from loguru import logger
 
+from fabric.utils.helpers import monitor_file
+
 import gi
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import GLib, Gtk
 
 
-#TODO WIP
-
-
 CACHE_DIR = str(GLib.get_user_cache_dir()) + "/fabric"
 ICON_CACHE_FILE = CACHE_DIR + "/icons.json"
 if not os.path.exists(CACHE_DIR):
     os.makedirs(CACHE_DIR)
 
+CACHE_WRITE_DELAY = 2  # seconds, new entries are written out together
+REINDEX_DELAY = 1000  # ms, package installs touch many files at once
+
+
+def _normalize(name: str) -> str:
+    return "".join(name.lower().split())
+
+
+def _applications_dirs() -> list[str]:
+    # user dir first so local overrides win
+    dirs = [GLib.get_user_data_dir(), *GLib.get_system_data_dirs()]
+    return [os.path.join(d, "applications") for d in dict.fromkeys(dirs)]
+
+
+def _read_desktop_entry(path: str) -> dict[str, str]:
+    entry = {}
+    in_desktop_entry = False
+    with open(path, errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line == "[Desktop Entry]":
+                in_desktop_entry = True
+                continue
+            if line.startswith("["):
+                if in_desktop_entry:
+                    break
+                continue
+            if in_desktop_entry and "=" in line:
+                key, _, value = line.partition("=")
+                entry.setdefault(key.strip(), value.strip())
+    return entry
+
+
+def _build_index() -> dict[str, str]:
+    """
+    Map every name an app may announce itself with to its icon: desktop id,
+    its last reverse-DNS component, StartupWMClass, executable and Name.
+    """
+    index: dict[str, str] = {}
+    for apps_dir in _applications_dirs():
+        for root, _, files in os.walk(apps_dir):
+            for file in files:
+                if not file.endswith(".desktop"):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    entry = _read_desktop_entry(path)
+                except OSError:
+                    continue
+
+                icon = entry.get("Icon")
+                if not icon:
+                    continue
+
+                # desktop file id, e.g. kde/okular.desktop -> kde-okular
+                desktop_id = os.path.relpath(path, apps_dir)[:-8].replace("/", "-")
+                exec_name = entry.get("Exec", "").split(" ", 1)[0]
+
+                for key in (
+                    desktop_id,
+                    desktop_id.rsplit(".", 1)[-1],
+                    entry.get("StartupWMClass", ""),
+                    os.path.basename(exec_name),
+                    entry.get("Name", ""),
+                ):
+                    if key:
+                        # earlier dirs take precedence
+                        index.setdefault(_normalize(key), icon)
+    return index
+
+
 class IconResolver:
     def __init__(self):
         if os.path.exists(ICON_CACHE_FILE):
@@ -29,53 +100,108 @@ class IconResolver:
         else:
             self._icon_dict = {}
 
+        self._index: dict[str, str] | None = None
+        self._reindex_id: int | None = None
+        self._write_id: int | None = None
+        self._write_lock = threading.Lock()
+
+        self._monitors = []
+        for apps_dir in _applications_dirs():
+            if os.path.isdir(apps_dir):
+                monitor = monitor_file(apps_dir)
+                monitor.connect("changed", self._on_applications_changed)
+                self._monitors.append(monitor)
+
+        self._reindex()
+
     def get_icon(self, app_id: str) -> str:
         if app_id in self._icon_dict:
             return self._icon_dict[app_id]
+
+        if self._index is None:
+            # still indexing; let the icon theme try the raw name for now
+            return app_id
+
         new_icon = self._compositor_find_icon(app_id)
         logger.info(f"[ICONS] found new icon: '{new_icon}' for app id: '{app_id}', storing...")
         self._store_new_icon(app_id, new_icon)
         return new_icon
 
-    def _store_new_icon(self, app_id: str, icon: str) -> None:
-        self._icon_dict[app_id] = icon
-        with open(ICON_CACHE_FILE, "w") as f:
-            json.dump(self._icon_dict, f)
-
-    def _get_icon_from_desktop_file(self, desktop_file_path: str) -> str:
-        in_desktop_entry = False
-        with open(desktop_file_path) as f:
-            for line in f:
-                line = line.strip()
-                if line == "[Desktop Entry]":
-                    in_desktop_entry = True
-                    continue
-                if line.startswith("["):
-                    in_desktop_entry = False
-                    continue
-                if in_desktop_entry and line.startswith("Icon="):
-                    return line[5:].strip()
-        return "application-x-symbolic"
-
-    def _get_desktop_file(self, app_id: str) -> str | None:
-        data_dirs = GLib.get_system_data_dirs()
-        for data_dir in data_dirs:
-            data_dir = data_dir + "/applications/"
-            if os.path.exists(data_dir):
-                files = os.listdir(data_dir)
-                matching = [s for s in files if "".join(app_id.lower().split()) in s.lower()]
-                if matching:
-                    return data_dir + matching[0]
-                for word in list(filter(None, re.split(r"-|\.|_|\s", app_id))):
-                    matching = [s for s in files if word.lower() in s.lower()]
-                    if matching:
-                        return data_dir + matching[0]
-        return None
+    # --- index ---
+
+    def _reindex(self) -> bool:
+        self._reindex_id = None
+        threading.Thread(
+            target=lambda: GLib.idle_add(self._on_indexed, _build_index()),
+            name="icon-index",
+            daemon=True,
+        ).start()
+        return False
+
+    def _on_indexed(self, index: dict[str, str]) -> bool:
+        self._index = index
+        # misses may resolve now that new apps are installed
+        misses = [k for k, v in self._icon_dict.items() if v == k]
+        for app_id in misses:
+            del self._icon_dict[app_id]
+        if misses:
+            self._schedule_write()
+        return False
+
+    def _on_applications_changed(self, *_):
+        if self._reindex_id is None:
+            self._reindex_id = GLib.timeout_add(REINDEX_DELAY, self._reindex)
 
     def _compositor_find_icon(self, app_id: str) -> str:
-        desktop_file = self._get_desktop_file(app_id)
-        if desktop_file:
-            return self._get_icon_from_desktop_file(desktop_file)
+        key = _normalize(app_id)
+        if icon := self._index.get(key):
+            return icon
+
+        for word in filter(None, re.split(r"-|\.|_|\s", app_id)):
+            if icon := self._index.get(word.lower()):
+                return icon
+
         # return app_id as-is — Gtk.Image.new_from_icon_name will handle
         # it gracefully at render time when the main loop is running
-        return app_id
\ No newline at end of file
+        return app_id
+
+    # --- cache file ---
+
+    def _store_new_icon(self, app_id: str, icon: str) -> None:
+        self._icon_dict[app_id] = icon
+        self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        if self._write_id is None:
+            self._write_id = GLib.timeout_add_seconds(
+                CACHE_WRITE_DELAY, self._write_cache
+            )
+
+    def _write_cache(self) -> bool:
+        self._write_id = None
+        snapshot = dict(self._icon_dict)
+        threading.Thread(
+            target=self._write_cache_file, args=(snapshot,), name="icon-cache", daemon=True
+        ).start()
+        return False
+
+    def _write_cache_file(self, icons: dict[str, str]) -> None:
+        with self._write_lock:
+            tmp = ICON_CACHE_FILE + ".tmp"
+            try:
+                with open(tmp, "w") as f:
+                    json.dump(icons, f)
+                os.replace(tmp, ICON_CACHE_FILE)
+            except OSError as e:
+                logger.warning(f"[ICONS] Failed to write cache: {e}")
+
+
+_icon_resolver: IconResolver | None = None
+
+
+def get_icon_resolver() -> IconResolver:
+    """Shared resolver, so the desktop files are indexed once per shell."""
+    global _icon_resolver
+    if _icon_resolver is None:
+        _icon_resolver = IconResolver()
+    return _icon_resolver
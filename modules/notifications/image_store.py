@@ -0,0 +1,132 @@
+from typing import cast
+from loguru import logger
+
+import cairo
+from fabric.widgets.box import Box
+from fabric.notifications.service import Notification
+
+from widgets.clipping_box import ClippingBox
+
+from .common import NotificationConfig
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gdk, GdkPixbuf, GLib, Gtk
+
+
+class _Entry:
+    __slots__ = ("surface", "refs")
+
+    def __init__(self, surface: cairo.ImageSurface):
+        self.surface = surface
+        self.refs = 0
+
+
+class NotificationImageStore:
+    """
+    Refcounted, in-memory notification images keyed by notification id.
+
+    The popup and its grouped copy in the history share one surface. The last
+    release frees it on the next idle, so the popup -> group handoff doesn't
+    rebuild the image in between.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self._entries: dict[int, _Entry] = {}
+
+    def acquire(
+        self, notification: Notification, scale: int = 1
+    ) -> cairo.ImageSurface | None:
+        entry = self._entries.get(notification.id)
+        if entry is None:
+            surface = self._create_surface(notification, scale)
+            if surface is None:
+                return None
+            entry = self._entries[notification.id] = _Entry(surface)
+
+        entry.refs += 1
+        return entry.surface
+
+    def release(self, notification_id: int) -> None:
+        entry = self._entries.get(notification_id)
+        if entry is None:
+            return
+        entry.refs -= 1
+        if entry.refs <= 0:
+            GLib.idle_add(self._free, notification_id)
+
+    def _free(self, notification_id: int) -> bool:
+        entry = self._entries.get(notification_id)
+        if entry is not None and entry.refs <= 0:
+            del self._entries[notification_id]
+        return False
+
+    @staticmethod
+    def _create_surface(
+        notification: Notification, scale: int
+    ) -> cairo.ImageSurface | None:
+        try:
+            pixbuf = notification.image_pixbuf
+            if not pixbuf:
+                return None
+
+            # centered square crop, like `background-size: cover`
+            width, height = pixbuf.get_width(), pixbuf.get_height()
+            side = min(width, height)
+            square = pixbuf.new_subpixbuf(
+                (width - side) // 2, (height - side) // 2, side, side
+            )
+
+            size = NotificationConfig.IMAGE_SIZE * scale
+            scaled = square.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
+            return Gdk.cairo_surface_create_from_pixbuf(scaled or square, scale, None)
+        except Exception as e:
+            logger.error(f"Failed to create notification image: {e}")
+            return None
+
+
+class NotificationImageBox(Box):
+    """
+    Paints a shared notification surface over the CSS background, scaled to
+    the current allocation so the contract/expand transition needs no re-render.
+    """
+
+    def __init__(self, surface: cairo.ImageSurface | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self._surface = surface
+
+    def do_draw(self, cr: cairo.Context):
+        if self._surface is None:
+            return Box.do_draw(self, cr)
+
+        width, height = self.get_allocated_width(), self.get_allocated_height()
+        context = self.get_style_context()
+
+        cr.save()
+        Gtk.render_background(context, cr, 0, 0, width, height)
+
+        ClippingBox.render_shape(
+            cr,
+            width,
+            height,
+            cast(
+                int, context.get_property("border-radius", self.get_state_flags())
+            ),
+        )
+        cr.clip()
+
+        size = NotificationConfig.IMAGE_SIZE
+        cr.scale(width / size, height / size)
+        cr.set_source_surface(self._surface, 0, 0)
+        cr.paint()
+        cr.restore()
+        return True
@@ -1,5 +1,7 @@
 import time
+import bisect
 import random
+from collections import deque
 from loguru import logger
 from typing import Callable
 from datetime import datetime
@@ -51,17 +53,19 @@ from widgets.clipping_box import ClippingBox
 from widgets.rounded_image import RoundedImage
 from widgets.material_label import MaterialIconLabel
 from widgets.shapes.expressive.morphing_shapes import ExpressiveShape
-from utils.helpers import format_accel_to_keybind
+from utils.helpers import format_accel_to_keybind, toggle_class
 import icons
 from config.config import config
 
 from .notification_group import NotificationGroup
+from .image_store import NotificationImageStore
+from .history import HistoryNotification, NotificationHistory
 from .common import NotificationConfig, NotificationNotifier
 
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import GdkPixbuf, Gdk, GLib  # noqa: E402
+from gi.repository import Gdk, GLib, Gtk  # noqa: E402
 
 
 class NotificationTile(TileSimple):
@@ -144,54 +148,23 @@ class ActiveNotificationWidget(EventBox):
         super().__init__(**kwargs)
 
         self._notification = notification
-        self._notification.shape = None
         self._timeout_callback = timeout_callback
         self._on_close_callback = on_close_callback
         self._on_press_connection = None
         self._closed_connection = None
         self._timeout_repeater_id = None
-        self._scaled_pixbuf = None
+        self._image = None
+        self.coalesced = 0  # earlier notifications folded into this popup
         self.timestamp = datetime.now()
         self.urgency = notification.urgency
 
-        body_container = Box(name="notification-box", orientation="v", spacing=10)
+        self.body_container = Box(
+            name="notification-box", orientation="v", spacing=10
+        )
         content_box = Box(spacing=10)
 
-        try:
-            if image_pixbuf := self._notification.image_pixbuf:
-                self._scaled_pixbuf = image_pixbuf.scale_simple(
-                    NotificationConfig.IMAGE_SIZE,
-                    NotificationConfig.IMAGE_SIZE,
-                    GdkPixbuf.InterpType.BILINEAR,
-                )
-                content_box.add(
-                    RoundedImage(
-                        v_align="start",
-                        pixbuf=self._scaled_pixbuf,
-                        style="border-radius:16px;",
-                    )
-                )
-            else:
-                self._notification.shape = random.choice(self._SHAPES)
-                content_box.add(
-                    Box(
-                        name="img-expander",
-                        style_classes="expand",
-                        v_align="start",
-                        children=ExpressiveShape(shape=self._notification.shape),
-                    )
-                )
-        except Exception as e:
-            logger.error(f"Failed to resolve image_pixbuff: {e}")
-            self._notification.shape = random.choice(self._SHAPES)
-            content_box.add(
-                Box(
-                    name="img-expander",
-                    style_classes="expand",
-                    v_align="start",
-                    children=ExpressiveShape(shape=self._notification.shape),
-                )
-            )
+        self._image_slot = Box(v_align="start")
+        content_box.add(self._image_slot)
 
         # TODO: implement real Revealer with animations and Pango pixel length(?)
         self.revealer_btn_label = MaterialIconLabel(
@@ -204,16 +177,6 @@ class ActiveNotificationWidget(EventBox):
             on_clicked=self._on_notification_expanded,
         )
 
-        match self.urgency:
-            case 0 | 1:
-                body_container.add_style_class("normal")
-                self.revealer_btn.add_style_class("normal")
-            case 2:
-                body_container.add_style_class("critical")
-                self.revealer_btn.add_style_class("critical")
-            case _:
-                logger.warning(f"Unknown notification urgency level {self.urgency}")
-
         self.notif_body_label = Label(
             label=self._notification.body,
             line_wrap="word-char",
@@ -224,6 +187,27 @@ class ActiveNotificationWidget(EventBox):
         )
         self.notif_body_label.set_lines(NotificationConfig.LINE_LIMIT)
 
+        self._summary_label = Label(
+            label=self._notification.summary,
+            h_align="start",
+            v_expand=True,
+            style_classes="summary",
+            ellipsization="end",
+            max_chars_width=27,
+        )
+        self._timestamp_label = Label(
+            h_expand=True,
+            label=self.timestamp.strftime("%H:%M"),
+            h_align="start",
+            style_classes="timestamp",
+        )
+        self._count_label = Label(
+            style_classes=["notif-group-count"],
+            label="",
+            visible=False,
+        )
+        self._count_label.set_no_show_all(True)
+
         content_box.add(
             Box(
                 spacing=4,
@@ -248,23 +232,12 @@ class ActiveNotificationWidget(EventBox):
                                         style_classes=["notif-dot-separator"],
                                         v_align="center",
                                     ),
-                                    Label(
-                                        h_expand=True,
-                                        label=self.timestamp.strftime("%H:%M"),
-                                        h_align="start",
-                                        style_classes="timestamp",
-                                    ),
+                                    self._timestamp_label,
+                                    self._count_label,
                                     self.revealer_btn,
                                 ],
                             ),
-                            Label(
-                                label=self._notification.summary,
-                                h_align="start",
-                                v_expand=True,
-                                style_classes="summary",
-                                ellipsization="end",
-                                max_chars_width=27,
-                            ),
+                            self._summary_label,
                             self.notif_body_label,
                         ],
                         h_expand=True,
@@ -286,7 +259,9 @@ class ActiveNotificationWidget(EventBox):
                                     icon_text=icons.close.symbol(),
                                 ),
                                 tooltip_text="Close",
-                                style_classes="critical" if self.urgency == 2 else "",
+                                style_classes=(
+                                    "critical" if self.urgency == 2 else ""
+                                ),
                                 on_clicked=lambda *_: self._notification.close(),
                             ),
                             Box(),
@@ -298,46 +273,120 @@ class ActiveNotificationWidget(EventBox):
                 )
             ),
         )
-        body_container.add(content_box)
+        self.body_container.add(content_box)
 
-        if actions := self._notification.actions:
-            body_container.add(
-                Box(
-                    spacing=4,
-                    orientation="h",
-                    children=[
-                        Button(
-                            style_classes="action-button",
-                            h_expand=True,
-                            v_expand=True,
-                            label=action.label,
-                            on_clicked=lambda *_, action=action: action.invoke(),
-                        )
-                        for action in actions
-                    ],
-                )
-            )
-        self.add(body_container)
+        self._actions_box = Box(spacing=4, orientation="h")
+        self._actions_box.set_no_show_all(True)
+        self.body_container.add(self._actions_box)
+        self.add(self.body_container)
+
+        self._show_notification(notification)
 
         self._on_press_connection = self.connect(
             "button-press-event", lambda *_: timeout_callback(self)
         )
 
-        self._closed_connection = self._notification.connect(
+    @classmethod
+    def ensure_shape(cls, notification: Notification) -> None:
+        """Pick the placeholder shape used when a notification has no image."""
+        if not hasattr(notification, "shape"):
+            notification.shape = (
+                None if notification.image_pixbuf else random.choice(cls._SHAPES)
+            )
+
+    def absorb(self, notification: Notification, count: int) -> Notification:
+        """
+        Show `notification` in place of the current one, as the latest of a
+        burst from the same app. Returns the notification it replaced.
+        """
+        previous = self._notification
+        self._release()
+        self.timestamp = datetime.now()
+
+        self._notification = notification
+        self._summary_label.set_label(notification.summary)
+        self.notif_body_label.set_label(notification.body)
+        self._timestamp_label.set_label(self.timestamp.strftime("%H:%M"))
+        self.set_coalesced(self.coalesced + count)
+
+        self._show_notification(notification)
+        return previous
+
+    def set_coalesced(self, count: int) -> None:
+        self.coalesced = count
+        self._count_label.set_label(f"+{count}")
+        self._count_label.set_visible(count > 0)
+
+    def _show_notification(self, notification: Notification) -> None:
+        self.urgency = notification.urgency
+        match self.urgency:
+            case 0 | 1:
+                toggle_class(self.body_container, "critical", "normal")
+                toggle_class(self.revealer_btn, "critical", "normal")
+            case 2:
+                toggle_class(self.body_container, "normal", "critical")
+                toggle_class(self.revealer_btn, "normal", "critical")
+            case _:
+                logger.warning(f"Unknown notification urgency level {self.urgency}")
+
+        for child in self._image_slot.get_children():
+            child.destroy()
+        self._image_slot.add(self._build_image(notification))
+
+        for child in self._actions_box.get_children():
+            child.destroy()
+        for action in notification.actions:
+            self._actions_box.add(
+                Button(
+                    style_classes="action-button",
+                    h_expand=True,
+                    v_expand=True,
+                    label=action.label,
+                    on_clicked=lambda *_, action=action: action.invoke(),
+                )
+            )
+        self._actions_box.set_visible(bool(notification.actions))
+        self._actions_box.show_all()
+        self._image_slot.show_all()
+
+        self._closed_connection = notification.connect(
             "closed", self._on_notification_closed
         )
 
         # GLib.timeout_add() wrapper
+        if self._timeout_repeater_id is not None:
+            GLib.source_remove(self._timeout_repeater_id)
         self._timeout_repeater_id = (
             invoke_repeater(
                 NotificationConfig.TIMEOUT,
-                lambda: timeout_callback(self),
+                lambda: self._timeout_callback(self),
                 initial_call=False,
             )
             if self.urgency in [0, 1]
             else None
         )
 
+    def _build_image(self, notification: Notification) -> Box:
+        notification.shape = None
+        try:
+            self._image = NotificationImageStore().acquire(
+                notification, self.get_scale_factor()
+            )
+            if self._image is not None:
+                image = RoundedImage(v_align="start", style="border-radius:16px;")
+                image.set_from_surface(self._image)
+                return image
+        except Exception as e:
+            logger.error(f"Failed to resolve image_pixbuff: {e}")
+
+        notification.shape = random.choice(self._SHAPES)
+        return Box(
+            name="img-expander",
+            style_classes="expand",
+            v_align="start",
+            children=ExpressiveShape(shape=notification.shape),
+        )
+
     def _on_notification_expanded(self, *_):
         self.revealer_btn_label.set_angle(
             90
@@ -377,14 +426,20 @@ class ActiveNotificationWidget(EventBox):
             self.disconnect(self._on_press_connection)
             self._on_press_connection = None
 
+        self._release()
+
+        logger.debug("NotificationWidget cleaned up")
+
+    def _release(self) -> None:
+        # detach from the notification currently shown
         if self._closed_connection and self._notification:
             self._notification.disconnect(self._closed_connection)
             self._closed_connection = None
 
-        # clear pixbuf reference
-        self._scaled_pixbuf = None
-
-        logger.debug("NotificationWidget cleaned up")
+        # drop our share of the image
+        if self._image is not None:
+            NotificationImageStore().release(self._notification.id)
+            self._image = None
 
 
 class NotificationManager:
@@ -396,6 +451,10 @@ class NotificationManager:
         self.last_hover_time = 0
         self._notification_service = None
         self._active_notifications = []
+        self._pending_ids: list[int] = []
+        self._ingest_queue: deque[tuple[str, list[Notification]]] = deque()
+        self._ingest_source_id = None
+        self._drain_source_id = None
         self._is_open = False  # single source of truth for panel visibility
 
         try:
@@ -408,6 +467,12 @@ class NotificationManager:
 
         self._notification_sig_emittor = NotificationNotifier()
 
+        self._history = NotificationHistory()
+        self._live_history_ids: set[int] = set()
+        self._unhydrated_apps: list[str] = []  # newest first
+        self._history_page_id = None
+        self._history.load(self._on_history_loaded)
+
         self.viewport = Box(
             orientation="v",
             size=2,
@@ -415,6 +480,10 @@ class NotificationManager:
             spacing=NotificationConfig.SPACING,
         )
         self._groups: dict[str, NotificationGroup] = {}  # keyed by app_name
+        # groups in viewport order with their sort keys, kept sorted
+        self._group_order: list[NotificationGroup] = []
+        self._group_order_keys: list[tuple] = []
+        self._group_keys: dict[NotificationGroup, tuple] = {}
         self.scrolled_window = ScrolledWindow(
             name="notification-scrolled-window",
             size=2,
@@ -426,6 +495,12 @@ class NotificationManager:
             ),
             child=self.viewport,
         )
+        # older history is paged in when scrolling up past the top
+        self.scrolled_window.connect("edge-overshot", self._on_history_edge)
+        self.scrolled_window.connect("edge-reached", self._on_history_edge)
+        self.scrolled_window.get_vadjustment().connect(
+            "changed", self._on_history_resized
+        )
 
         self.notification_content = ClippingBox(
             name="notification-window-container", children=self.scrolled_window
@@ -521,38 +596,91 @@ class NotificationManager:
         if not self._notification_service:
             return
 
-        try:
+        # bursts are collected for a short window and then handled per app
+        self._pending_ids.append(notification_id)
+        if self._ingest_source_id is None:
+            self._ingest_source_id = GLib.timeout_add(
+                NotificationConfig.INGEST_WINDOW, self._flush_pending
+            )
+
+    def _flush_pending(self) -> bool:
+        self._ingest_source_id = None
+        batches = self._take_pending()
+        if not batches:
+            return False
+
+        self._ingest_queue.extend(batches.items())
+        if self._drain_source_id is None:
+            self._drain_source_id = GLib.idle_add(self._drain_ingest_queue)
+        return False
+
+    def _take_pending(self) -> dict[str, list[Notification]]:
+        ids, self._pending_ids = self._pending_ids, []
+
+        batches: dict[str, list[Notification]] = {}
+        for notification_id in ids:
             notification = self._notification_service.get_notification_from_id(
                 notification_id
             )
             if not notification:
                 logger.warning(f"Failed to get notification with ID: {notification_id}")
-                return
+                continue
+            self._track_history(notification)
+            batches.setdefault(notification.app_name, []).append(notification)
+        return batches
+
+    def _drain_ingest_queue(self) -> bool:
+        # a few apps per main loop iteration so a burst can't eat a whole frame
+        for _ in range(NotificationConfig.MAX_BATCHES_PER_FRAME):
+            if not self._ingest_queue:
+                break
+            app_name, notifications = self._ingest_queue.popleft()
+            try:
+                self._ingest(app_name, notifications)
+            except Exception as e:
+                logger.error(f"Failed to handle notification: {e}")
 
-            notification_widget = ActiveNotificationWidget(
-                notification=notification,
-                timeout_callback=self._move_to_revealer,
-                on_close_callback=self.close_active_notification,
-            )
+        self._update_ui_state()
+        if self._ingest_queue:
+            return True
+        self._drain_source_id = None
+        return False
 
-            if config.SILENT or self._is_open:
-                self._move_to_revealer(notification_widget=notification_widget)
-            else:
-                if (
-                    len(self._active_notifications)
-                    >= NotificationConfig.MAX_ACTIVE_NOTIFS
-                ):
-                    active_children = self.active_notifications_box.get_children()
-                    self._move_to_revealer(active_children[len(active_children) - 1])
-                self._active_notifications.append(notification_widget)
-                self.active_notifications_box.pack_end(
-                    notification_widget, True, None, 0
-                )
+    def _ingest(self, app_name: str, notifications: list[Notification]) -> None:
+        *older, latest = notifications
 
-            self._update_ui_state()
+        if config.SILENT or self._is_open:
+            self._add_to_group(app_name, notifications)
+            return
 
-        except Exception as e:
-            logger.error(f"Failed to handle notification: {e}")
+        # an app that already has a popup keeps it and only updates it in place
+        popup = next(
+            (
+                w
+                for w in self._active_notifications
+                if w._notification.app_name == app_name
+            ),
+            None,
+        )
+        if popup is not None:
+            replaced = popup.absorb(latest, len(notifications))
+            self._add_to_group(app_name, [replaced, *older])
+            return
+
+        if older:
+            self._add_to_group(app_name, older)
+
+        if len(self._active_notifications) >= NotificationConfig.MAX_ACTIVE_NOTIFS:
+            self._move_to_revealer(self._active_notifications[0])
+
+        notification_widget = ActiveNotificationWidget(
+            notification=latest,
+            timeout_callback=self._move_to_revealer,
+            on_close_callback=self.close_active_notification,
+        )
+        notification_widget.set_coalesced(len(older))
+        self._active_notifications.append(notification_widget)
+        self.active_notifications_box.pack_end(notification_widget, True, None, 0)
 
     def close_active_notification(self, notification_widget: ActiveNotificationWidget):
         if notification_widget in self._active_notifications:
@@ -571,40 +699,106 @@ class NotificationManager:
                 self._active_notifications.remove(notification_widget)
                 self.active_notifications_box.remove(notification_widget)
 
-            app_name = notification_widget._notification.app_name
+            notification = notification_widget._notification
+            self._add_to_group(notification.app_name, [notification])
 
-            if app_name not in self._groups:
-                group = NotificationGroup(
-                    app_name=app_name,
-                    on_empty=self._remove_group,
-                )
-                self._groups[app_name] = group
-                self.viewport.pack_end(group, True, None, 0)
-
-            self._groups[app_name].add_widget(notification_widget)
-            self._resort_viewport()
-
-            # mark unread
-            if not self.notification_history.get_mapped():
-                if notification_widget.urgency in (1, 2):
-                    if not self._notification_sig_emittor.has_unread:
-                        self._notification_sig_emittor.has_unread = True
-                    if (
-                        not self._notification_sig_emittor.has_urgent_unread
-                        and notification_widget.urgency == 2
-                    ):
-                        self._notification_sig_emittor.has_urgent_unread = True
+            # the group builds its own widget; this one is done
+            notification_widget.cleanup()
 
             self._update_ui_state()
 
         except Exception as e:
             logger.error(f"Failed to move notification to revealer: {e}")
 
+    def _add_to_group(
+        self,
+        app_name: str,
+        notifications: list[Notification | HistoryNotification],
+        mark_unread: bool = True,
+    ) -> None:
+        if not notifications:
+            return
+
+        for notification in notifications:
+            ActiveNotificationWidget.ensure_shape(notification)
+
+        if app_name not in self._groups:
+            group = NotificationGroup(
+                app_name=app_name,
+                on_empty=self._remove_group,
+                on_changed=self._reposition_group,
+            )
+            self._groups[app_name] = group
+            self.viewport.pack_end(group, True, None, 0)
+
+        self._groups[app_name].add_notifications(notifications)
+
+        # mark unread
+        if mark_unread and not self.notification_history.get_mapped():
+            urgency = max(n.urgency for n in notifications)
+            if urgency in (1, 2):
+                if not self._notification_sig_emittor.has_unread:
+                    self._notification_sig_emittor.has_unread = True
+                if (
+                    not self._notification_sig_emittor.has_urgent_unread
+                    and urgency == 2
+                ):
+                    self._notification_sig_emittor.has_urgent_unread = True
+
+    def _track_history(self, notification: Notification) -> None:
+        record_id = self._history.record(notification)
+        self._live_history_ids.add(record_id)
+        notification.connect("closed", lambda *_: self._forget_history(record_id))
+
+    def _forget_history(self, record_id: int) -> None:
+        self._live_history_ids.discard(record_id)
+        self._history.forget(record_id)
+
+    def _on_history_loaded(self) -> None:
+        self._unhydrated_apps = self._history.apps_by_recency()
+        self._hydrate_history(NotificationConfig.HISTORY_INITIAL_GROUPS)
+
+    def _hydrate_history(self, count: int) -> None:
+        apps = self._unhydrated_apps[:count]
+        del self._unhydrated_apps[:count]
+
+        for app_name in apps:
+            restored = [
+                HistoryNotification(record, self._history)
+                for record in self._history.records_for(app_name)
+                if record.id not in self._live_history_ids
+            ]
+            self._add_to_group(app_name, restored, mark_unread=False)
+
+    def _on_history_edge(self, scrolled_window, pos: Gtk.PositionType) -> None:
+        # reaching the top emits both edge signals, one page is enough
+        if (
+            pos == Gtk.PositionType.TOP
+            and self._unhydrated_apps
+            and self._history_page_id is None
+        ):
+            self._history_page_id = GLib.idle_add(self._hydrate_next_page)
+
+    def _on_history_resized(self, adjustment: Gtk.Adjustment) -> None:
+        # nothing to scroll yet, so keep filling the panel
+        if (
+            self._unhydrated_apps
+            and self._history_page_id is None
+            and adjustment.get_upper() <= adjustment.get_page_size()
+        ):
+            self._history_page_id = GLib.idle_add(self._hydrate_next_page)
+
+    def _hydrate_next_page(self) -> bool:
+        self._history_page_id = None
+        self._hydrate_history(NotificationConfig.HISTORY_PAGE_GROUPS)
+        return False
+
     def _remove_group(self, group: NotificationGroup) -> None:
         """Called by NotificationGroup when it becomes empty."""
         app_name = group.app_name
-        if app_name in self._groups:
+        if self._groups.get(app_name) is group:
             del self._groups[app_name]
+        self._unindex_group(group)
         if group.get_parent() is self.viewport:
             self.viewport.remove(group)
         self._update_ui_state()
@@ -613,15 +807,31 @@ class NotificationManager:
         # urgency DESC, latest timestamp DESC
         return (-group.max_urgency, -group.latest_timestamp.timestamp())
 
-    def _resort_viewport(self) -> None:
-        # urgency > recency
-        groups = list(self._groups.values())
-        groups.sort(key=self._group_sort_key)
+    def _reposition_group(self, group: NotificationGroup) -> None:
+        # urgency > recency; only the changed group moves
+        if self._groups.get(group.app_name) is not group:
+            return
 
-        for group in self.viewport.get_children():
-            self.viewport.remove(group)
-        for group in groups:
-            self.viewport.pack_end(group, True, None, 0)
+        old_index = self._unindex_group(group)
+        key = self._group_sort_key(group)
+        index = bisect.bisect_left(self._group_order_keys, key)
+        self._group_order_keys.insert(index, key)
+        self._group_order.insert(index, group)
+        self._group_keys[group] = key
+
+        if index != old_index and group.get_parent() is self.viewport:
+            self.viewport.reorder_child(group, index)
+
+    def _unindex_group(self, group: NotificationGroup) -> int | None:
+        key = self._group_keys.pop(group, None)
+        if key is None:
+            return None
+        index = bisect.bisect_left(self._group_order_keys, key)
+        while self._group_order[index] is not group:
+            index += 1
+        del self._group_order[index]
+        del self._group_order_keys[index]
+        return index
 
     def _update_ui_state(self):
         widget = self.clear_btn.get_children()[0]
@@ -666,6 +876,20 @@ class NotificationManager:
             logger.error(f"Failed to toggle notification stack: {e}")
 
     def close_all_notifications(self, *_) -> None:
+        # still inside the ingest window: resolve them so they get closed too
+        if self._ingest_source_id is not None:
+            GLib.source_remove(self._ingest_source_id)
+            self._ingest_source_id = None
+        self._ingest_queue.extend(self._take_pending().items())
+
+        for _, notifications in self._ingest_queue:
+            for notification in notifications:
+                try:
+                    notification.close()
+                except Exception:
+                    pass
+        self._ingest_queue.clear()
+
         # iterate over a COPY!!!
         for widget in self._active_notifications[:]:
             try:
@@ -684,7 +908,12 @@ class NotificationManager:
             group._dismiss_all()
 
         self._groups.clear()
+        self._group_order.clear()
+        self._group_order_keys.clear()
+        self._group_keys.clear()
         self._active_notifications.clear()
+        self._unhydrated_apps.clear()
+        self._history.clear()
         self._update_ui_state()
 
     def get_notifications_box(self):
@@ -706,5 +935,7 @@ class NotificationManager:
                 pass
             self._notification_service = None
 
+        # keep the history for the next session
+        self._history.close()
         self.close_all_notifications()
         super().destroy()
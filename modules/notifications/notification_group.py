@@ -1,12 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from .notification import ActiveNotificationWidget
-
-import os
-import tempfile
+import bisect
 from loguru import logger
 from typing import Callable
 from datetime import datetime
@@ -25,7 +19,8 @@ from widgets.shapes.expressive.morphing_shapes import ExpressiveShape
 from utils.helpers import toggle_class
 import icons
 
-from .icon_resolver import IconResolver
+from .icon_resolver import get_icon_resolver
+from .image_store import NotificationImageBox, NotificationImageStore
 from .common import NotificationConfig
 
 import gi
@@ -34,18 +29,8 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import GdkPixbuf, Gtk, GLib
 
 
-_icon_resolver: "IconResolver | None" = None
-
-
-def _get_icon_resolver() -> "IconResolver":
-    global _icon_resolver
-    if _icon_resolver is None:
-        _icon_resolver = IconResolver()
-    return _icon_resolver
-
-
 def _resolve_app_icon(notification, size: int = 28) -> Gtk.Widget:
-    resolver = _get_icon_resolver()
+    resolver = get_icon_resolver()
 
     # try app_icon string first (sometimes it's a valid named icon)
     for candidate in filter(
@@ -109,17 +94,26 @@ class NotificationWidget(Box):
         self._stack.set_transition_duration(NotificationConfig.TRANSITION_DURATION)
         return h
 
-    def __init__(self, notification: Notification, **kwargs):
+    def __init__(
+        self,
+        notification: Notification,
+        timestamp: datetime | None = None,
+        **kwargs,
+    ):
         super().__init__(name="notification-widget", **kwargs)
 
         self._notification = notification
         self._closed_connection = None
-        self._scaled_pixbuf = None
-        self.timestamp = datetime.now()
+        # restored history keeps the time it originally arrived
+        self.timestamp = timestamp or getattr(
+            notification, "history_timestamp", datetime.now()
+        )
         self.urgency = notification.urgency
         self.toggler = False
 
-        self._image_path = self._resolve_image_path(notification)
+        self._image = NotificationImageStore().acquire(
+            notification, self.get_scale_factor()
+        )
 
         self.image_box = self._build_image_box()
         self.collapsed_page = self._build_collapsed_page(notification)
@@ -201,12 +195,14 @@ class NotificationWidget(Box):
         )
 
     def _build_image_box(self) -> Box:
-        box = Box(name="img-expander", v_align="start", style_classes="contract")
-        if self._image_path is None:
-            if hasattr(self._notification, "shape"):
-                box.add(ExpressiveShape(shape=self._notification.shape))
-        else:
-            box.set_style(f'background-image: url("{self._image_path}")')
+        box = NotificationImageBox(
+            surface=self._image,
+            name="img-expander",
+            v_align="start",
+            style_classes="contract",
+        )
+        if self._image is None and hasattr(self._notification, "shape"):
+            box.add(ExpressiveShape(shape=self._notification.shape))
         return box
 
     def _build_collapsed_page(self, notification: Notification) -> Box:
@@ -389,32 +385,6 @@ class NotificationWidget(Box):
             )
             self._expanded_stack.set_visible_child(self._expanded_short)
 
-    def _resolve_image_path(self, notification) -> str | None:
-        try:
-            if pixbuf := self._notification.image_pixbuf:
-                scaled = pixbuf.scale_simple(
-                    NotificationConfig.IMAGE_SIZE,
-                    NotificationConfig.IMAGE_SIZE,
-                    GdkPixbuf.InterpType.BILINEAR,
-                )
-                pixbuf = scaled or pixbuf
-                tmp_dir = "/tmp/zenith-shell/notif-imgs"
-                os.makedirs(tmp_dir, exist_ok=True)
-                tmp = tempfile.NamedTemporaryFile(
-                    suffix=".png",
-                    delete=False,
-                    dir=tmp_dir,
-                    prefix=f"notif-{notification.id}-",
-                )
-                tmp.close()
-                pixbuf.savev(tmp.name, "png", [], [])
-                return tmp.name
-        except Exception:
-            logger.error("Couldn't resolve image path")
-            pass
-
-        return None
-
     def _on_notification_closed(self, *_):
         try:
             self.destroy()
@@ -431,22 +401,27 @@ class NotificationWidget(Box):
                 pass
             self._closed_connection = None
 
-        self._scaled_pixbuf = None
+        if self._image is not None:
+            NotificationImageStore().release(self._notification.id)
+            self._image = None
         logger.debug("NotificationWidget cleaned up")
 
 
 class NotificationGroup(AnimatedClippingBox):
+    # rows a collapsed group shows under its header
+    COLLAPSED_ROWS = 2
+
     @property
     def count(self) -> int:
-        return len(self._widgets)
+        return len(self._notifications)
 
     @property
     def max_urgency(self) -> int:
-        return max((w.urgency for w in self._widgets), default=0)
+        return max((n.urgency for n in self._notifications), default=0)
 
     @property
     def latest_timestamp(self) -> datetime:
-        return max((w.timestamp for w in self._widgets), default=datetime.min)
+        return max(self._timestamps.values(), default=datetime.min)
 
     @staticmethod
     def _set_widget_expand_style(widget: NotificationWidget, expanded: bool) -> None:
@@ -457,7 +432,11 @@ class NotificationGroup(AnimatedClippingBox):
         toggle_class(widget, remove_class, add_class)
 
     def __init__(
-        self, app_name: str, on_empty: Callable[["NotificationGroup"], None], **kwargs
+        self,
+        app_name: str,
+        on_empty: Callable[["NotificationGroup"], None],
+        on_changed: Callable[["NotificationGroup"], None] | None = None,
+        **kwargs,
     ):
         super().__init__(
             name="notif-group-container",
@@ -468,7 +447,14 @@ class NotificationGroup(AnimatedClippingBox):
 
         self.app_name = app_name
         self._on_empty = on_empty
-        self._widgets: list[NotificationWidget] = []
+        self._on_changed = on_changed  # urgency/recency may have moved
+        # every notification is kept as data, least important first (rows are
+        # shown the other way round); widgets only exist for rows on screen
+        self._notifications: list[Notification] = []
+        self._sort_keys: list[tuple[int, float]] = []
+        self._timestamps: dict[int, datetime] = {}
+        self._closed_handlers: dict[int, int] = {}
+        self._widgets: dict[int, NotificationWidget] = {}
         self._expanded = False  # start collapsed
         self._current_icon_source: str | None = None
 
@@ -574,49 +560,84 @@ class NotificationGroup(AnimatedClippingBox):
         # init collapsed state
         GLib.idle_add(lambda: self._toggle_expand(self._toggle_btn, self._expanded))
 
-    def add_widget(self, widget: ActiveNotificationWidget) -> None:
-        notif = widget._notification
-
+    def add_notifications(self, notifications: list[Notification]) -> None:
         def add():
-            # guard against duplicate notification ids
-            if any(w._notification.id == notif.id for w in self._widgets):
-                return
-            new_widget = NotificationWidget(notification=notif)
-            if self._expanded:
-                new_widget.set_expanded(True)
-                self._set_widget_expand_style(new_widget, True)
-            else:
-                new_widget.add_style_class("contract")
-            new_widget.connect("destroy", self._on_widget_destroyed)
-            self._widgets.append(new_widget)
-            self._resort()
-            self._rebuild_children_box()
-            self._sync_header()
-            self._refresh_height()
+            added = False
+            for notif in notifications:
+                # guard against duplicate notification ids
+                if notif.id in self._timestamps:
+                    continue
+                timestamp = getattr(notif, "history_timestamp", None) or datetime.now()
+                key = (notif.urgency, timestamp.timestamp())
+                index = bisect.bisect_right(self._sort_keys, key)
+                self._sort_keys.insert(index, key)
+                self._notifications.insert(index, notif)
+                self._timestamps[notif.id] = timestamp
+                self._closed_handlers[notif.id] = notif.connect(
+                    "closed", self._on_notification_closed
+                )
+                added = True
+
+            # one relayout for the whole batch
+            if added:
+                self._sync_widgets()
+                self._sync_header()
+                self._refresh_height()
+                if self._on_changed:
+                    self._on_changed(self)
 
         GLib.idle_add(add)
 
-    def remove_widget(self, widget: NotificationWidget) -> None:
-        if widget in self._widgets:
-            self._widgets.remove(widget)
-        if widget.get_parent() is self._children_box:
+    def _remove_notification(self, notification: Notification) -> None:
+        if self._timestamps.pop(notification.id, None) is None:
+            return
+        index = self._notifications.index(notification)
+        del self._notifications[index]
+        del self._sort_keys[index]
+
+        # the widget destroys itself on the same `closed` emission
+        widget = self._widgets.pop(notification.id, None)
+        if widget is not None and widget.get_parent() is self._children_box:
             self._children_box.remove(widget)
+
+        if not self._notifications:
+            self._on_empty(self)
+            return
+
+        self._sync_widgets()  # the next row may have moved into view
         self._sync_header()
         self._refresh_height()
-        if not self._widgets:
-            self._on_empty(self)
+        if self._on_changed:
+            self._on_changed(self)
 
-    def _resort(self) -> None:
-        self._widgets.sort(key=self._sort_key, reverse=True)
+    def _sync_widgets(self) -> None:
+        shown = (
+            self._notifications
+            if self._expanded
+            else self._notifications[-self.COLLAPSED_ROWS :]
+        )
+        for notif in shown:
+            if notif.id not in self._widgets:
+                self._insert_widget(notif)
 
-    def _sort_key(self, w: NotificationWidget):
-        return (-w.urgency, -w.timestamp.timestamp())
+    def _insert_widget(self, notif: Notification) -> None:
+        widget = NotificationWidget(
+            notification=notif, timestamp=self._timestamps[notif.id]
+        )
+        if self._expanded:
+            widget.set_expanded(True)
+            self._set_widget_expand_style(widget, True)
+        else:
+            widget.add_style_class("contract")
+        self._widgets[notif.id] = widget
 
-    def _rebuild_children_box(self) -> None:
-        for child in self._children_box.get_children():
-            self._children_box.remove(child)
-        for widget in self._widgets:
-            self._children_box.pack_end(widget, True, None, 0)
+        # rows run most important first, so its slot is the built rows above it
+        index = self._notifications.index(notif)
+        position = sum(
+            n.id in self._widgets for n in self._notifications[index + 1 :]
+        )
+        self._children_box.pack_start(widget, True, False, 0)
+        self._children_box.reorder_child(widget, position)
 
     def _sync_header(self) -> None:
         n = self.count
@@ -629,13 +650,9 @@ class NotificationGroup(AnimatedClippingBox):
         else:
             self._toggle_btn.remove_style_class("critical")
 
-        top = self._top_widget()
         self.timestamp_label.set_label(self.latest_timestamp.strftime("%H:%M"))
-        if top:
-            self._sync_icon(top._notification)
-
-    def _top_widget(self) -> NotificationWidget | None:
-        return self._widgets[0] if self._widgets else None
+        if self._notifications:
+            self._sync_icon(self._notifications[0])
 
     def _sync_icon(self, notification, size: int = 28) -> None:
         # keyed by notification id so repeated _sync_header calls
@@ -658,13 +675,15 @@ class NotificationGroup(AnimatedClippingBox):
 
     def _compute_collapsed_height(self) -> int:
         _, h = self._header.get_preferred_height()
-        for widget in self._widgets[-1:-3:-1]:
-            h += widget.collapsed_height
+        for notif in self._notifications[-self.COLLAPSED_ROWS :]:
+            widget = self._widgets.get(notif.id)
+            if widget is not None:
+                h += widget.collapsed_height
         return h
 
     def _compute_expanded_height(self) -> int:
         _, h = self._header.get_preferred_height()
-        for widget in self._widgets:
+        for widget in self._widgets.values():
             h += widget.expanded_height
         return h
 
@@ -679,33 +698,39 @@ class NotificationGroup(AnimatedClippingBox):
         self._expanded = state if state is not None else not self._expanded
         self._toggle_icon.set_angle(-90 if self._expanded else 90)
 
+        # rows built on expanding stay around, they're paid for already
+        self._sync_widgets()
+
         if self._expanded:
             self._children_box.remove_style_class("contract")
         else:
             self._children_box.add_style_class("contract")
 
-        for widget in self._widgets:
+        for widget in self._widgets.values():
             self._set_widget_expand_style(widget, self._expanded)
 
         self.time_revealer.set_reveal_child(not self._expanded)
 
         if self._expanded:
             target = self._compute_expanded_height()
-            for widget in self._widgets:
+            for widget in self._widgets.values():
                 widget.set_expanded(True)  # now kick off the real Stack transition
             self.expand(target)
         else:
             target = self._compute_collapsed_height()
-            for widget in self._widgets:
+            for widget in self._widgets.values():
                 widget.set_expanded(False)
             self.collapse(target)
 
     def _dismiss_all(self, *_) -> None:
-        for widget in self._widgets[:]:
+        for notif in self._notifications[:]:
             try:
-                widget._notification.close()
+                notif.close()
             except Exception:
                 pass
 
-    def _on_widget_destroyed(self, widget: NotificationWidget) -> None:
-        self.remove_widget(widget)
+    def _on_notification_closed(self, notification: Notification, *_) -> None:
+        handler_id = self._closed_handlers.pop(notification.id, None)
+        if handler_id is not None:
+            notification.disconnect(handler_id)
+        self._remove_notification(notification)
@@ -7,6 +7,7 @@ from fabric.widgets.button import Button
 from fabric.widgets.centerbox import CenterBox
 
 from widgets.overrides import Svg
+from widgets.artwork_box import ArtworkBox
 
 from modules.wiggle_bar import WigglyScale
 from modules.wallpaper import WallpaperService
@@ -25,7 +26,7 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import GLib
 
 
-class Player(Box):
+class Player(ArtworkBox):
     def __init__(self, player_service: PlayerService, **kwargs):
         super().__init__(style_classes="player", orientation="v", spacing=15, **kwargs)
 
@@ -40,13 +41,13 @@ class Player(Box):
         MAX_AUDIO_DEVICE_NAME_CHARS = 15
         self.duration = 0.0
         self._player_service = player_service
-        player = self._player_service._player
+        snapshot = self._player_service.get_snapshot()
         self._device_name = self._volume_service.get_current_device_name()
 
         def _set_initial_bg(
             service: WallpaperService, full_path: str, preview_path: str
         ):
-            self.set_style(f"background-image:url('{preview_path}')")
+            self.set_artwork(preview_path)
             return False
 
         self._wallpaper_signal_id = self._wallpaper_service.connect(
@@ -61,10 +62,10 @@ class Player(Box):
         )
 
         self.player_icon = Svg(
-            name=player.props.player_name,
+            name=snapshot.player_name,
             h_expand=True,
             style_classes="player-icon",
-            svg_string=getattr(svg, player.props.player_name, svg.disc),
+            svg_string=getattr(svg, snapshot.player_name, svg.disc),
         )
         self.audo_device_label = Label(
             label=self._device_name,
@@ -248,7 +249,7 @@ class Player(Box):
         # connect to service signals
         self._player_service.connect("pause", self.on_pause)
         self._player_service.connect("play", self.on_play)
-        self._player_service.connect("meta-change", self.on_metadata)
+        self._player_service.connect("snapshot-changed", self.on_snapshot)
         self._player_service.connect("shuffle-toggle", self.on_shuffle)
         self._player_service.connect("track-position", self.on_update_track_position)
         self._player_service.connect("theme-change", self._apply_theme)
@@ -259,8 +260,10 @@ class Player(Box):
         self.connect("destroy", self.on_destroy)
 
         # init metadata
-        self.on_metadata(
-            self._player_service, metadata=player.props.metadata, player=player
+        self.on_snapshot(self._player_service, snapshot)
+        clock = self._player_service.get_track_clock()
+        self.on_update_track_position(
+            self._player_service, clock.position, clock.length
         )
 
         # init artwork & theme
@@ -272,6 +275,8 @@ class Player(Box):
             self._apply_theme(self._player_service, current_theme)
 
     def on_update_track_position(self, sender, pos, dur):
+        # emitted only on resyncs; the bar extrapolates from the clock per frame
+        self.wiggly.set_clock(self._player_service.get_track_clock())
         if dur == 0:
             return
         self.duration = dur
@@ -290,11 +295,10 @@ class Player(Box):
         if self._player_service.can_seek:
             self._player_service._player.seek(-1 * seconds * 1000000)
 
-    def _update_track_info(self, metadata, keys):
-        if "xesam:artist" in keys and "xesam:title" in keys:
-            song_title = metadata["xesam:title"]
-            artist_list = metadata["xesam:artist"]
-            artist_name = artist_list[0] if artist_list else "Unknown Artist"
+    def _update_track_info(self, snapshot):
+        if snapshot.title:
+            song_title = snapshot.title
+            artist_name = snapshot.artist or "Unknown Artist"
 
             def _update_metadata_label():
                 self.song.set_label(song_title)
@@ -308,7 +312,7 @@ class Player(Box):
         if self._wallpaper_signal_id:
             self._wallpaper_service.disconnect(self._wallpaper_signal_id)
             self._wallpaper_signal_id = None
-        GLib.idle_add(lambda: self.set_style(f"background-image:url('{art_path}')"))
+        GLib.idle_add(lambda: self.set_artwork(art_path) or False)
 
     def _apply_theme(self, source, theme_json):
         primary_color = theme_json["colors"]["primary"]["dark"]["color"]
@@ -320,11 +324,8 @@ class Player(Box):
 
         GLib.idle_add(_apply)
 
-    def _update_playback_status(self):
-        if (
-            self._player_service._player.props.playback_status.value_name
-            == "PLAYERCTL_PLAYBACK_STATUS_PLAYING"
-        ):
+    def _update_playback_status(self, snapshot):
+        if snapshot.playing:
             self.on_play(self._player_service)
 
     def _update_shuffle_status(self, status):
@@ -343,30 +344,25 @@ class Player(Box):
     def on_audio_device_changed(self, source: VolumeService, device_name: str):
         self.audo_device_label.set_label(device_name)
 
-    def on_metadata(self, sender, metadata, player):
-        keys = metadata.keys()
-        self._update_track_info(metadata, keys)
-        self._update_playback_status()
-        self._update_shuffle_status(player.props.shuffle)
-        self._update_controls()
-
-    def _update_controls(self):
-        self.wiggly.set_sensitive(self._player_service.can_seek)
-        self.next_button.set_visible(self._player_service.can_go_next)
-        self.next_button.set_sensitive(self._player_service.can_go_next)
+    def on_snapshot(self, sender, snapshot):
+        self._update_track_info(snapshot)
+        self._update_playback_status(snapshot)
+        self._update_shuffle_status(snapshot.shuffle)
+        self._update_controls(snapshot)
+
+    def _update_controls(self, snapshot):
+        self.wiggly.set_sensitive(snapshot.can_seek)
+        self.next_button.set_visible(snapshot.can_go_next)
+        self.next_button.set_sensitive(snapshot.can_go_next)
         self.next_button.set_no_show_all(True)
-        self.play_pause_button.set_visible(
-            self._player_service.can_play or self._player_service.can_pause
-        )
-        self.play_pause_button.set_sensitive(
-            self._player_service.can_play or self._player_service.can_pause
-        )
+        self.play_pause_button.set_visible(snapshot.can_play or snapshot.can_pause)
+        self.play_pause_button.set_sensitive(snapshot.can_play or snapshot.can_pause)
         self.prev_button.set_no_show_all(True)
-        self.prev_button.set_visible(self._player_service.can_go_previous)
-        self.prev_button.set_sensitive(self._player_service.can_go_previous)
+        self.prev_button.set_visible(snapshot.can_go_previous)
+        self.prev_button.set_sensitive(snapshot.can_go_previous)
         self.play_pause_button.set_no_show_all(True)
-        self.shuffle_button.set_visible(self._player_service.can_shuffle)
-        self.shuffle_button.set_sensitive(self._player_service.can_shuffle)
+        self.shuffle_button.set_visible(snapshot.can_shuffle)
+        self.shuffle_button.set_sensitive(snapshot.can_shuffle)
         self.shuffle_button.set_no_show_all(True)
 
     def _set_pause_ui(self):
@@ -379,9 +375,7 @@ class Player(Box):
     def on_pause(self, sender):
         GLib.idle_add(self._set_pause_ui)
 
-        self.wiggly._dragging = True
-        self.wiggly.update_amplitude(True)
-        self.wiggly.pause = True
+        self.wiggly.set_paused(True)
 
     def _set_play_ui(self):
         child = self.play_pause_button.get_child()
@@ -393,9 +387,7 @@ class Player(Box):
     def on_play(self, sender):
         GLib.idle_add(self._set_play_ui)
 
-        self.wiggly.pause = False
-        self.wiggly._dragging = False
-        self.wiggly.update_amplitude(False)
+        self.wiggly.set_paused(False)
 
     def on_shuffle(self, sender, player, status):
         logger.debug(f"Shuffle callback status: {status}")
@@ -413,10 +405,7 @@ class Player(Box):
         if not (self._player_service.can_play or self._player_service.can_play):
             return
 
-        is_playing = (
-            self._player_service._player.props.playback_status.value_name
-            == "PLAYERCTL_PLAYBACK_STATUS_PLAYING"
-        )
+        is_playing = self._player_service.get_snapshot().playing
 
         if is_playing:
             GLib.idle_add(self._set_pause_ui)
@@ -437,22 +426,21 @@ class Player(Box):
         if not self._player_service.can_shuffle:
             return
 
-        if not self._player_service._player.props.shuffle:
+        snapshot = self._player_service.get_snapshot()
+        if not snapshot.shuffle:
             self._player_service._player.set_shuffle(True)
-            logger.debug(
-                f"Setting to true: {self._player_service._player.props.player_name}"
-            )
+            logger.debug(f"Setting to true: {snapshot.player_name}")
         else:
             self._player_service._player.set_shuffle(False)
 
     def on_destroy(self, *_):
         logger.debug(
-            f"Player UI destroyed for {self._player_service._player.props.player_name}"
+            f"Player UI destroyed for {self._player_service.get_snapshot().player_name}"
         )
         # service cleanup is handled by PlayerManager
 
 
-class Placeholder(Box):
+class Placeholder(ArtworkBox):
     def __init__(self, **kwargs):
         super().__init__(style_classes="player", **kwargs)
 
@@ -461,7 +449,7 @@ class Placeholder(Box):
         def _set_initial_bg(
             service: WallpaperService, full_path: str, preview_path: str | None
         ):
-            self.set_style(f"background-image:url('{preview_path}')")
+            self.set_artwork(preview_path)
             return False
 
         self._wallpaper_signal_id = self._wallpaper_service.connect(
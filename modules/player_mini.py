@@ -1,17 +1,12 @@
-from __future__ import annotations
-
-from typing import TYPE_CHECKING
-
 from fabric.widgets.box import Box
 from fabric.widgets.label import Label
 from fabric.widgets.stack import Stack
 from fabric.widgets.button import Button
 from fabric.widgets.eventbox import EventBox
 from fabric.widgets.centerbox import CenterBox
-if TYPE_CHECKING:
-    from fabric.widgets.widget import Widget
 
 from widgets.overrides import Svg
+from widgets.artwork_box import ArtworkBox
 from widgets.material_label import MaterialIconLabel
 
 from modules.wallpaper import WallpaperService
@@ -30,21 +25,21 @@ gi.require_version("Gtk", "3.0")
 from gi.repository import GLib  # noqa: E402
 
 
-def apply_filter_to_player_art(widget: Widget, art_url: str):
-    widget.set_style(
-        f"background-image: url('{ROOT_DIR}/svg/player/player_grad.svg'),\
-                            url('{art_url}') ;"
-    )
+PLAYER_GRADIENT = f"{ROOT_DIR}/svg/player/player_grad.svg"
+
+
+def apply_filter_to_player_art(widget: ArtworkBox, art_url: str):
+    widget.set_artwork(art_url, overlay=PLAYER_GRADIENT)
 
 
-class PlayerMini(Box):
+class PlayerMini(ArtworkBox):
     def __init__(self, player_service: PlayerService, **kwargs):
         super().__init__(style_classes="player-mini", **kwargs)
 
         self._wallpaper_service = WallpaperService()
 
         self._player_service = player_service
-        player = self._player_service._player
+        snapshot = self._player_service.get_snapshot()
         self._wallpaper_signal_id = None
 
         def _set_initial_bg(
@@ -68,10 +63,10 @@ class PlayerMini(Box):
             self.remove_style_class("vertical")
 
         self.player_name = Svg(
-            name=player.props.player_name,
+            name=snapshot.player_name,
             h_expand=True,
             style_classes=["player-icon", "mini"],
-            svg_string=getattr(svg, player.props.player_name, svg.disc),
+            svg_string=getattr(svg, snapshot.player_name, svg.disc),
         )
 
         self.song = Label(
@@ -146,9 +141,8 @@ class PlayerMini(Box):
         #     children=self.wiggly,
         # )
 
-        self.album_cover = Box(style_classes="album-image")
-        self.album_cover.set_style(
-            f"background-image:url('{CACHE_DIR}/walls/low_rez.png')"
+        self.album_cover = ArtworkBox(
+            style_classes="album-image", artwork=f"{CACHE_DIR}/walls/low_rez.png"
         )
 
         self.children = [
@@ -200,7 +194,7 @@ class PlayerMini(Box):
         # connect to service signals
         self._player_service.connect("pause", self.on_pause)
         self._player_service.connect("play", self.on_play)
-        self._player_service.connect("meta-change", self.on_metadata)
+        self._player_service.connect("snapshot-changed", self.on_snapshot)
         # self._player_service.connect("shuffle-toggle", self.on_shuffle)
         # self._player_service.connect("track-position", self.on_update_track_position)
         self._player_service.connect("artwork-change", self._apply_artwork)
@@ -209,9 +203,7 @@ class PlayerMini(Box):
         self.connect("destroy", self.on_destroy)
 
         # init metadata
-        self.on_metadata(
-            self._player_service, metadata=player.props.metadata, player=player
-        )
+        self.on_snapshot(self._player_service, snapshot)
 
         # init artwork
         current_artwork = self._player_service.get_artwork()
@@ -245,18 +237,16 @@ class PlayerMini(Box):
             self._wallpaper_signal_id = None
 
         def _apply():
-            self.album_cover.set_style(f"background-image:url('{art_path}')")
+            self.album_cover.set_artwork(art_path)
             apply_filter_to_player_art(self, blurred_art_path)
             return False
 
         GLib.idle_add(_apply)
 
-    def on_metadata(self, sender, metadata, player):
-        keys = metadata.keys()
-        if "xesam:artist" in keys and "xesam:title" in keys:
-            song_title = metadata["xesam:title"]
-            artist_list = metadata["xesam:artist"]
-            artist_name = artist_list[0] if artist_list else "Unknown Artist"
+    def on_snapshot(self, sender, snapshot):
+        if snapshot.title:
+            song_title = snapshot.title
+            artist_name = snapshot.artist or "Unknown Artist"
 
             def _update_metadata_labels():
                 self.song.set_label(song_title)
@@ -268,23 +258,18 @@ class PlayerMini(Box):
         # self.on_shuffle(sender, player, player.props.shuffle)
 
         def _update_playback_status():
-            if (
-                player.props.playback_status.value_name
-                == "PLAYERCTL_PLAYBACK_STATUS_PLAYING"
-            ):
+            if snapshot.playing:
                 self.on_play(self._player_service)
             return False
 
         GLib.idle_add(_update_playback_status)
-        GLib.idle_add(self._update_controls)
+        GLib.idle_add(self._update_controls, snapshot)
 
-    def _update_controls(self):
-        # self.wiggly.set_sensitive(self._player_service.can_seek)
-        self.next_button.set_sensitive(self._player_service.can_go_next)
-        self.play_pause_button.set_sensitive(
-            self._player_service.can_play or self._player_service.can_pause
-        )
-        self.prev_button.set_sensitive(self._player_service.can_go_previous)
+    def _update_controls(self, snapshot):
+        # self.wiggly.set_sensitive(snapshot.can_seek)
+        self.next_button.set_sensitive(snapshot.can_go_next)
+        self.play_pause_button.set_sensitive(snapshot.can_play or snapshot.can_pause)
+        self.prev_button.set_sensitive(snapshot.can_go_previous)
         # self.shuffle_button.set_visible(self._player_service.can_shuffle)
         # self.shuffle_button.set_sensitive(self._player_service.can_shuffle)
 
@@ -336,10 +321,7 @@ class PlayerMini(Box):
         if not (self._player_service.can_play or self._player_service.can_pause):
             return
 
-        is_playing = (
-            self._player_service._player.props.playback_status.value_name
-            == "PLAYERCTL_PLAYBACK_STATUS_PLAYING"
-        )
+        is_playing = self._player_service.get_snapshot().playing
 
         def _set_play_ui():
             self.play_pause_button.get_child().set_icon(icons.pause_material.symbol())
@@ -375,24 +357,24 @@ class PlayerMini(Box):
     def on_destroy(self, *_):
         """Cleanup widget on destroy"""
         logger.debug(
-            f"PlayerMini UI destroyed for {self._player_service._player.props.player_name}"
+            f"PlayerMini UI destroyed for {self._player_service.get_snapshot().player_name}"
         )
         # service cleanup is handled by PlayerManager
 
 
-class PlaceholderMini(Box):
+class PlaceholderMini(ArtworkBox):
     def __init__(self, **kwargs):
         super().__init__(style_classes="player-mini", **kwargs)
 
         self._wallpaper_service = WallpaperService()
 
-        self.album_cover = Box(style_classes="album-image")
+        self.album_cover = ArtworkBox(style_classes="album-image")
 
         def _set_initial_bg(
             service: WallpaperService, full_path: str, preview_path: str
         ):
             apply_filter_to_player_art(self, preview_path)
-            self.album_cover.set_style(f"background-image:url('{preview_path}')")
+            self.album_cover.set_artwork(preview_path)
             return False
 
         self._wallpaper_signal_id = self._wallpaper_service.connect(
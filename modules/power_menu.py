@@ -5,6 +5,7 @@ from fabric.widgets.button import Button
 from fabric.utils.helpers import exec_shell_command_async
 
 from widgets.material_label import MaterialIconLabel
+from services.i3_service import I3Service
 from utils.lock import lock_screen
 
 import icons
@@ -62,7 +63,7 @@ class PowerMenu(Box):
     def logout(self, *_):
         print("Logging out...")
         self.close_power_menu()
-        exec_shell_command_async("i3-msg exit")
+        I3Service().run("exit")
 
     def reboot(self, *_):
         print("Rebooting...")
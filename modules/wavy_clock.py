@@ -3,8 +3,8 @@ import math
 import cairo
 import datetime
 
-from config.info import ROOT_DIR
-from utils.colors import get_css_variable, hex_to_rgb01
+from services.theme_colors import ThemeColors
+from utils.wave import ring_wave
 
 import gi
 
@@ -19,6 +19,7 @@ class WavyClock(Gtk.DrawingArea):
         self.connect("draw", self.on_draw)
 
         GLib.timeout_add_seconds(1, self.on_tick)
+        ThemeColors().redraw_on_change(self)
 
         self.show()
 
@@ -37,24 +38,22 @@ class WavyClock(Gtk.DrawingArea):
 
         # wavy outer circle
         ctx.set_line_width(4)
-        angle_step = 2 * math.pi / 500
-        ctx.move_to(
-            cx + (base_radius + amplitude * math.sin(frequency * 0)) * math.cos(0),
-            cy + (base_radius + amplitude * math.sin(frequency * 0)) * math.sin(0),
+        # static outline, replayed from the cache after the first draw
+        ring_wave(
+            ctx,
+            cx,
+            cy,
+            base_radius,
+            0,
+            math.tau,
+            amplitude,
+            frequency,
+            steps=500,
+            cache=True,
         )
 
-        angle = 0
-        while angle <= math.tau:
-            r = base_radius + amplitude * math.sin(frequency * angle)
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            ctx.line_to(x, y)
-            angle += angle_step
-
-        hex_color = get_css_variable(
-            f"{ROOT_DIR}/styles/colors.css", "--primary"
-        )
-        r, g, b = hex_to_rgb01(hex_color)
+        colors = ThemeColors()
+        r, g, b = colors.get("--primary")
         ctx.set_source_rgb(r, g, b)
 
         ctx.close_path()
@@ -80,11 +79,7 @@ class WavyClock(Gtk.DrawingArea):
         ctx.set_line_cap(cairo.LINE_CAP_ROUND)  # rounded line ends
 
         # hour hand
-        hr_r, hr_g, hr_b = hex_to_rgb01(
-            get_css_variable(
-                f"{ROOT_DIR}/styles/colors.css", "--on-primary"
-            )
-        )
+        hr_r, hr_g, hr_b = colors.get("--on-primary")
         ctx.set_line_width(dot_radius*2)
         ctx.set_source_rgba(hr_r, hr_g, hr_b, 0.6)
         ctx.move_to(cx, cy)
@@ -110,9 +105,6 @@ class WavyClock(Gtk.DrawingArea):
         y = cy + second_orbit * math.sin(second_angle)
 
         ctx.arc(x, y, dot_radius, 0, math.tau)
-        hex_color = get_css_variable(
-            f"{ROOT_DIR}/styles/colors.css", "--tertiary"
-        )
-        r, g, b = hex_to_rgb01(hex_color)
+        r, g, b = colors.get("--tertiary")
         ctx.set_source_rgba(r, g, b)
         ctx.fill()
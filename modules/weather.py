@@ -44,9 +44,8 @@ from svg.weather.dark import (
     # partly_cloudy_night,
     strong_thunderstorms,
 )
-from config.info import ROOT_DIR
 from utils.cursor import add_hover_cursor
-from utils.colors import get_css_variable, hex_to_rgb01
+from services.theme_colors import ThemeColors
 
 import gi
 
@@ -382,6 +381,7 @@ class WeatherPill(Gtk.DrawingArea):
         self.service = WeatherService()
         self._current_data = self.service.current_data
         self.service.connect("value-changed", self.on_weather_update)
+        ThemeColors().redraw_on_change(self)
 
         self.show()
 
@@ -397,8 +397,7 @@ class WeatherPill(Gtk.DrawingArea):
 
     def _get_color(self, css_var: str) -> Tuple[float, float, float]:
         """Get RGB color from CSS variable."""
-        hex_color = get_css_variable(f"{ROOT_DIR}/styles/colors.css", css_var)
-        return hex_to_rgb01(hex_color)
+        return ThemeColors().get(css_var)
 
     def _draw_circle(self, ctx: cairo.Context, cx: float, cy: float, radius: float):
         ctx.arc(cx, cy, radius, 0, 2 * math.pi)
@@ -4,13 +4,21 @@ from typing import Tuple
 
 from fabric.core.service import Service, Signal, Property
 
-from config.info import ROOT_DIR
-from utils.colors import get_css_variable, hex_to_rgb01
+from services.theme_colors import ThemeColors
+from utils.wave import sine_wave
+from services.visibility import VisibilityTracker
 
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, GLib
+
+PHASE_SPEED = 3.0  # rad/s
+AMPLITUDE_DURATION = 0.16  # s
+MAX_FRAME_GAP = 0.25  # s, don't jump the wave after a stall or a hidden stretch
+FREQUENCY = 0.3
+SLIDER_DIAMETER = 6
+STROKE_WIDTH = 2
 
 
 class WigglyScale(Gtk.DrawingArea, Service):
@@ -33,7 +41,12 @@ class WigglyScale(Gtk.DrawingArea, Service):
         self.amplitude = 2
         self._dragging = False
         self.pause = False
-        self.speed = 0.05
+        self.speed = PHASE_SPEED
+        self._last_frame_time = None
+        self._amplitude_tick = None
+        self._tick: int | None = None
+        self._wave_right = 0  # right edge of the last partial redraw
+        self.clock = None  # TrackClock, extrapolated every frame
 
         self.set_size_request(-1, 20)
         self.connect("draw", self.on_draw)
@@ -49,31 +62,61 @@ class WigglyScale(Gtk.DrawingArea, Service):
         self.connect("motion-notify-event", self.on_motion)
         self.connect("button-release-event", self.on_button_release)
 
-        self.add_tick_callback(self.update)  # matches screen refresh rate
+        # matches screen refresh rate, and stops while the bar is off screen
+        self._start_ticking()
 
         self.show_all()
 
-    def animate_amplitude_to(self, *_):
-        if abs(self.amplitude - self.amplitude_target) < 0.01:
-            self.amplitude = self.amplitude_target
-            self.queue_draw()
+    def _start_ticking(self):
+        if self._tick is None:
+            self._tick = VisibilityTracker().add_tick_callback(self, self.update)
+
+    def _stop_ticking(self):
+        VisibilityTracker().unwatch(self._tick)
+        self._tick = None
+
+    def set_paused(self, paused: bool):
+        self.pause = paused
+        self._dragging = paused
+        self.update_amplitude(paused)
+        if not paused:
+            self._last_frame_time = None  # don't jump over the paused stretch
+            self._start_ticking()
+
+    def animate_amplitude_to(self, widget, frame_clock):
+        now = frame_clock.get_frame_time() / 1_000_000
+        progress = min(1.0, max(0.0, now - self.amplitude_start) / AMPLITUDE_DURATION)
+        self.amplitude = self.amplitude_from + (
+            self.amplitude_target - self.amplitude_from
+        ) * progress
+        self.queue_draw()
+
+        if progress >= 1.0:
+            self._amplitude_tick = None
+            # flat and frozen now, nothing left to draw each frame
+            if self.pause:
+                self._stop_ticking()
             return False
-        else:
-            self.amplitude += self.amplitude_step
-            self.queue_draw()
-            return True
+        return True
 
     def update_amplitude(self, decrease):
-        if decrease:
-            self.amplitude_target = 0
-            self.amplitude_step = (0 - self.amplitude) / 10.0
-        else:
-            self.amplitude_target = 2
-            self.amplitude_step = (2 - self.amplitude) / 10.0
-
-        self.add_tick_callback(
-            self.animate_amplitude_to
-        )  # animation stops when False is returned btw
+        self.amplitude_from = self.amplitude
+        self.amplitude_target = 0 if decrease else 2
+        self.amplitude_start = GLib.get_monotonic_time() / 1_000_000
+
+        # a running animation just picks up the new target
+        if self._amplitude_tick is None:
+            self._amplitude_tick = self.add_tick_callback(
+                self.animate_amplitude_to
+            )  # animation stops when False is returned btw
+
+    def _advance_phase(self, frame_clock) -> None:
+        # by elapsed time, so the wave moves at the same speed at any refresh rate
+        now = frame_clock.get_frame_time() / 1_000_000
+        if self._last_frame_time is not None:
+            elapsed = min(now - self._last_frame_time, MAX_FRAME_GAP)
+            self.phase = (self.phase + self.speed * elapsed) % math.tau
+        self._last_frame_time = now
 
     def update_value_from_x(self, x):
         width = self.get_allocated_width()
@@ -90,6 +133,9 @@ class WigglyScale(Gtk.DrawingArea, Service):
     def update_value_from_signal(self, new_value):
         self.value = min(1.0, new_value)
 
+    def set_clock(self, clock):
+        self.clock = clock
+
     def on_motion(self, widget, event):
         if self.dragging and not self.pause:
             self.update_value_from_x(event.x)
@@ -105,19 +151,33 @@ class WigglyScale(Gtk.DrawingArea, Service):
             self.update_amplitude(False)
         return True
 
-    def update(self, *_):
+    def update(self, widget, frame_clock):
         if self.dragging == False:
-            self.phase += self.speed
-            self.queue_draw()
+            if self.clock is not None:
+                now = frame_clock.get_frame_time() / 1_000_000
+                self.value = min(1.0, self.clock.fraction_at(now))
+            self._advance_phase(frame_clock)
+            self._queue_wave_draw()
+        else:
+            self._last_frame_time = None
         return True
 
+    def _queue_wave_draw(self):
+        # only the wave and slider move; the flat tail past them is unchanged
+        alloc_width = self.get_allocated_width()
+        right = int(alloc_width * self.value) + SLIDER_DIAMETER + STROKE_WIDTH
+        # cover the previous slider too, in case the value went backwards
+        area = min(alloc_width, max(right, self._wave_right))
+        self._wave_right = right
+        self.queue_draw_area(0, 0, area, self.get_allocated_height())
+
     def on_draw(self, widget, cr):
         alloc_width = self.get_allocated_width()
         height = self.get_allocated_height()
         center_y = height / 2
-        frequency = 0.3
-        slider_diameter = 6
-        stroke_width = 2
+        frequency = FREQUENCY
+        slider_diameter = SLIDER_DIAMETER
+        stroke_width = STROKE_WIDTH
 
         width = int(alloc_width * self.value) - slider_diameter + 1
 
@@ -128,15 +188,15 @@ class WigglyScale(Gtk.DrawingArea, Service):
         last_x = 0  # fallback values in case the slider gets dragged out of range
         last_y = 0
 
-        init_x = stroke_width
         init_y = center_y + self.amplitude * math.sin(
             (stroke_width * frequency) + self.phase
         )
         cr.move_to(stroke_width, init_y)
-        for x in range(stroke_width, width):
-            y = center_y + self.amplitude * math.sin((x * frequency) + self.phase)
-            cr.line_to(x, y)
-            last_x, last_y = x, y
+        last = sine_wave(
+            cr, stroke_width, width, center_y, self.amplitude, frequency, self.phase
+        )
+        if last is not None:
+            last_x, last_y = last
 
         cr.stroke()
 
@@ -196,7 +256,9 @@ class WigglyArrow(Gtk.DrawingArea, Service):
         self.amplitude = 2
         self._dragging = False
         self.pause = False
-        self.speed = 0.05
+        self.speed = PHASE_SPEED
+        self._last_frame_time = None
+        self._amplitude_tick = None
 
         self.dark = dark
         self._override_color: Tuple[float, float, float] | None = override_color
@@ -215,31 +277,42 @@ class WigglyArrow(Gtk.DrawingArea, Service):
         # self.connect("motion-notify-event", self.on_motion)
         # self.connect("button-release-event", self.on_button_release)
 
-        self.add_tick_callback(self.update)  # matches screen refresh rate
+        # matches screen refresh rate, and stops while the bar is off screen
+        VisibilityTracker().add_tick_callback(self, self.update)
 
         self.show_all()
 
-    def animate_amplitude_to(self, *_):
-        if abs(self.amplitude - self.amplitude_target) < 0.01:
-            self.amplitude = self.amplitude_target
-            self.queue_draw()
+    def animate_amplitude_to(self, widget, frame_clock):
+        now = frame_clock.get_frame_time() / 1_000_000
+        progress = min(1.0, max(0.0, now - self.amplitude_start) / AMPLITUDE_DURATION)
+        self.amplitude = self.amplitude_from + (
+            self.amplitude_target - self.amplitude_from
+        ) * progress
+        self.queue_draw()
+
+        if progress >= 1.0:
+            self._amplitude_tick = None
             return False
-        else:
-            self.amplitude += self.amplitude_step
-            self.queue_draw()
-            return True
+        return True
 
     def update_amplitude(self, decrease):
-        if decrease:
-            self.amplitude_target = 0
-            self.amplitude_step = (0 - self.amplitude) / 10.0
-        else:
-            self.amplitude_target = 2
-            self.amplitude_step = (2 - self.amplitude) / 10.0
-
-        self.add_tick_callback(
-            self.animate_amplitude_to
-        )  # animation stops when False is returned btw
+        self.amplitude_from = self.amplitude
+        self.amplitude_target = 0 if decrease else 2
+        self.amplitude_start = GLib.get_monotonic_time() / 1_000_000
+
+        # a running animation just picks up the new target
+        if self._amplitude_tick is None:
+            self._amplitude_tick = self.add_tick_callback(
+                self.animate_amplitude_to
+            )  # animation stops when False is returned btw
+
+    def _advance_phase(self, frame_clock) -> None:
+        # by elapsed time, so the wave moves at the same speed at any refresh rate
+        now = frame_clock.get_frame_time() / 1_000_000
+        if self._last_frame_time is not None:
+            elapsed = min(now - self._last_frame_time, MAX_FRAME_GAP)
+            self.phase = (self.phase + self.speed * elapsed) % math.tau
+        self._last_frame_time = now
 
     def update_value_from_x(self, x):
         width = self.get_allocated_width()
@@ -271,10 +344,12 @@ class WigglyArrow(Gtk.DrawingArea, Service):
             self.update_amplitude(False)
         return True
 
-    def update(self, *_):
+    def update(self, widget, frame_clock):
         if self.dragging == False:
-            self.phase += self.speed
+            self._advance_phase(frame_clock)
             self.queue_draw()
+        else:
+            self._last_frame_time = None
         return True
 
     def on_draw(self, widget, cr):
@@ -282,9 +357,9 @@ class WigglyArrow(Gtk.DrawingArea, Service):
         height = self.get_allocated_height()
         center_y = height / 2
 
-        frequency = 0.3
-        slider_diameter = 6
-        stroke_width = 2
+        frequency = FREQUENCY
+        slider_diameter = SLIDER_DIAMETER
+        stroke_width = STROKE_WIDTH
         arc_radius = slider_diameter / 2
 
         width = int(alloc_width * self.value) - slider_diameter + 1
@@ -305,10 +380,11 @@ class WigglyArrow(Gtk.DrawingArea, Service):
         settle_start_x = max(init_x, width - settle_len)
 
         # ---- pure sine section ----
-        for x in range(init_x, settle_start_x):
-            y = center_y + self.amplitude * math.sin((x * frequency) + self.phase)
-            cr.line_to(x, y)
-            last_x, last_y = x, y
+        last = sine_wave(
+            cr, init_x, settle_start_x, center_y, self.amplitude, frequency, self.phase
+        )
+        if last is not None:
+            last_x, last_y = last
 
         # ---- settling arc (no crossing x-axis, flat ending) ----
         settle_steps = width - settle_start_x - int(arc_radius)
@@ -356,11 +432,7 @@ class WigglyArrow(Gtk.DrawingArea, Service):
         if self._override_color is not None:
             return self._override_color
 
-        hex_color = get_css_variable(
-            f"{ROOT_DIR}/styles/colors.css",
-            "--on-primary" if self.dark else "--primary",
-        )
-        return hex_to_rgb01(hex_color)
+        return ThemeColors().get("--on-primary" if self.dark else "--primary")
 
     def set_color(self, rgb: Tuple[float, float, float] | None, redraw: bool = True):
         """Override the shape color and optionally trigger a redraw."""
@@ -0,0 +1,200 @@
+import threading
+from loguru import logger
+from PIL import Image
+
+try:
+    from Xlib import X
+    from Xlib.display import Display
+
+    XLIB_AVAILABLE = True
+
+except ImportError:
+    XLIB_AVAILABLE = False
+
+from fabric.widgets.box import Box
+from fabric.widgets.label import Label
+from fabric.utils.helpers import truncate
+
+from modules.notifications.icon_resolver import get_icon_resolver
+from services.i3_service import I3Service, WorkspaceEvent
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import GdkPixbuf, GLib, Gtk
+
+THUMBNAIL_WIDTH = 240
+CAPTURE_DELAY = 600  # ms, let windows settle after a switch
+MAX_ROWS = 6
+
+
+def window_icon_name(con: dict) -> str:
+    props = con.get("window_properties") or {}
+    app = props.get("class") or props.get("instance") or ""
+    return get_icon_resolver().get_icon(app) if app else "application-x-executable"
+
+
+class _Grabber:
+    """
+    Grabs and scales screen areas on its own thread and X connection, so the
+    XGetImage round trip never runs on the main loop. Only the latest request
+    is kept; one still waiting when a newer one arrives is dropped.
+    """
+
+    def __init__(self, on_grabbed):
+        self._on_grabbed = on_grabbed
+        self._pending: tuple[int, dict] | None = None
+        self._cond = threading.Condition()
+        threading.Thread(target=self._run, name="ws-thumbnail", daemon=True).start()
+
+    def submit(self, num: int, rect: dict):
+        with self._cond:
+            self._pending = (num, rect)
+            self._cond.notify()
+
+    def _run(self):
+        try:
+            display = Display()
+        except Exception as e:
+            logger.warning(f"[Workspaces] No X connection for thumbnails: {e}")
+            return
+        root = display.screen().root
+
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                (num, rect), self._pending = self._pending, None
+
+            try:
+                data = self._grab(root, rect)
+            except Exception as e:
+                logger.warning(f"[Workspaces] Failed to capture workspace: {e}")
+                continue
+            GLib.idle_add(self._on_grabbed, num, *data)
+
+    @staticmethod
+    def _grab(root, rect: dict) -> tuple[bytes, int, int]:
+        width, height = rect["width"], rect["height"]
+        image = root.get_image(
+            rect["x"], rect["y"], width, height, X.ZPixmap, 0xFFFFFFFF
+        )
+        # 24/32 bit visuals come back as little-endian BGRX
+        frame = Image.frombytes("RGB", (width, height), image.data, "raw", "BGRX")
+        thumb_height = max(1, height * THUMBNAIL_WIDTH // width)
+        frame = frame.resize((THUMBNAIL_WIDTH, thumb_height), Image.Resampling.BILINEAR)
+        return frame.tobytes(), THUMBNAIL_WIDTH, thumb_height
+
+
+class WorkspaceThumbnails:
+    """
+    Low resolution snapshots of workspaces, one per workspace number.
+
+    A workspace is grabbed a moment after it gains focus, so by the time it is
+    left its snapshot is already cached. Window title or layout changes don't
+    trigger grabs. The grab itself happens off the main loop (see `_Grabber`)
+    and needs python-xlib; without it there are no thumbnails.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self._thumbnails: dict[int, GdkPixbuf.Pixbuf] = {}
+        self._capture_id: int | None = None
+
+        if not XLIB_AVAILABLE:
+            logger.warning("[Workspaces] Install python-xlib for workspace thumbnails.")
+            return
+        self._grabber = _Grabber(self._store)
+
+        self.i3 = I3Service()
+        self.i3.subscribe("workspace", self._on_workspace_focus, changes=["focus"])
+        self.i3.subscribe("workspace", self._on_workspace_empty, changes=["empty"])
+
+    def get(self, num: int) -> GdkPixbuf.Pixbuf | None:
+        return self._thumbnails.get(num)
+
+    def _on_workspace_focus(self, _: WorkspaceEvent):
+        if self._capture_id is not None:
+            GLib.source_remove(self._capture_id)
+        self._capture_id = GLib.timeout_add(CAPTURE_DELAY, self._capture)
+
+    def _on_workspace_empty(self, event: WorkspaceEvent):
+        self._thumbnails.pop((event.current or {}).get("num"), None)
+
+    def _capture(self) -> bool:
+        self._capture_id = None
+        workspace = self.i3.get_focused_workspace()
+        if workspace and workspace.get("rect"):
+            self._grabber.submit(workspace["num"], workspace["rect"])
+        return False
+
+    def _store(self, num: int, data: bytes, width: int, height: int) -> bool:
+        self._thumbnails[num] = GdkPixbuf.Pixbuf.new_from_bytes(
+            GLib.Bytes.new(data),
+            GdkPixbuf.Colorspace.RGB,
+            False,
+            8,
+            width,
+            height,
+            width * 3,
+        )
+        return False
+
+
+class WorkspacePreview(Box):
+    """Tooltip body listing a workspace's windows, with its thumbnail if any."""
+
+    def __init__(
+        self,
+        num: int,
+        windows: list[dict],
+        thumbnail: GdkPixbuf.Pixbuf | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            name="workspace-preview", orientation="v", spacing=6, **kwargs
+        )
+
+        count = len(windows)
+        self.add(
+            Label(
+                name="workspace-preview-title",
+                label=f"Workspace {num} · {count} window{'s' if count != 1 else ''}",
+                h_align="start",
+            )
+        )
+
+        if thumbnail is not None:
+            image = Gtk.Image.new_from_pixbuf(thumbnail)
+            image.set_name("workspace-preview-thumbnail")
+            self.add(image)
+
+        for con in windows[:MAX_ROWS]:
+            icon = Gtk.Image.new_from_icon_name(
+                window_icon_name(con), Gtk.IconSize.INVALID
+            )
+            icon.set_pixel_size(16)
+            self.add(
+                Box(
+                    spacing=8,
+                    children=[
+                        icon,
+                        Label(
+                            label=truncate(con.get("name") or "", 42),
+                            h_align="start",
+                        ),
+                    ],
+                )
+            )
+
+        if count > MAX_ROWS:
+            self.add(Label(label=f"+{count - MAX_ROWS} more", h_align="start"))
+
+        self.show_all()
@@ -1,10 +1,9 @@
+import math
 import cairo
 from typing import Literal
-from random import randrange
+from random import choice
 from collections.abc import Iterable
 
-from expressive_shapes.morph.bezier_morph import Morph
-from expressive_shapes.geometry.rounded_polygon import RoundedPolygon
 from expressive_shapes.shapes.shape_presets import (
     organic_blob,
     pill,
@@ -47,6 +46,12 @@ from fabric.widgets.box import Box
 from fabric.utils.helpers import FormattedString
 from fabric.i3.widgets import WorkspaceButton as FabricWorkspaceButton
 
+from services.animation_scheduler import AnimationScheduler
+from widgets.shapes.expressive.morph_cache import MorphCache
+from utils.easing import material_emphasized
+
+from .preview import WorkspacePreview, WorkspaceThumbnails
+
 import gi
 
 gi.require_version("Gtk", "3.0")
@@ -103,99 +108,75 @@ class WorkspaceShapeMorph(Gtk.DrawingArea):
             ((0.10 + P, 0.90 - P), FULL_ROUND),
         ]
         self.current_idx = 0
+        self.morph_path = None
+        self._awaiting_morph = False
 
         self.progress = 0.0
-        self.animation_speed = 0.082
-        self.pause_frames = 20
-        self.pause_counter = 0
-        self.glib_id = None
+        self.duration = 0.2  # seconds for a full morph
+        self.anim_id = None
+        self._direction = True
+        self._last_time = 0.0
 
+        # every pair this button can morph through, matched off the main loop
+        MorphCache().prefetch((self._non_active_shape, s) for s in self.active_shapes)
         self._prepare_next_morph()
 
         self.connect("draw", self.on_draw)
         self.show_all()
 
     def _prepare_next_morph(self):
-        self.current_idx = randrange(len(self.active_shapes))
-
-        poly_start = self.create_rounded_polygon(self._non_active_shape)
-        poly_end = self.create_rounded_polygon(self.active_shapes[self.current_idx])
-
-        self.mappings = Morph.match(poly_start, poly_end)
-
-    @staticmethod
-    def _cubic_bezier(x1, y1, x2, y2):
-        def _sample_x(t):
-            return 3.0 * x1 * t * (1 - t) ** 2 + 3.0 * x2 * t**2 * (1 - t) + t**3
-
-        def _sample_y(t):
-            return 3.0 * y1 * t * (1 - t) ** 2 + 3.0 * y2 * t**2 * (1 - t) + t**3
-
-        def _dx_dt(t):
-            return (
-                3.0 * x1 * (1 - t) ** 2
-                + 6.0 * (x2 - x1) * t * (1 - t)
-                + 3.0 * (1 - x2) * t**2
-            )
-
-        def easing(x):
-            if x <= 0.0:
-                return 0.0
-            if x >= 1.0:
-                return 1.0
-
-            # Newton-Raphson: solve _sample_x(t) = x for t
-            t = x  # initial guess
-            for _ in range(8):
-                dx = _dx_dt(t)
-                if abs(dx) < 1e-12:
-                    break
-                t -= (_sample_x(t) - x) / dx
-                t = max(0.0, min(1.0, t))
-
-            # Bisection fallback if Newton didn't converge
-            if abs(_sample_x(t) - x) > 1e-6:
-                lo, hi = 0.0, 1.0
-                for _ in range(20):
-                    t = (lo + hi) / 2.0
-                    if _sample_x(t) < x:
-                        lo = t
-                    else:
-                        hi = t
-
-            return _sample_y(t)
-
-        return easing
-
-    def material_easing(self, t):
-        if not hasattr(self, "_m3_ease_in"):
-            self._m3_ease_in = self._cubic_bezier(0.05, 0.0, 0.133333, 0.06)
-            self._m3_ease_out = self._cubic_bezier(0.208333, 0.82, 0.25, 1.0)
-
-        if t < 0.4:
-            return self._m3_ease_in(t / 0.4) * 0.2
-        else:
-            return 0.2 + self._m3_ease_out((t - 0.4) / 0.6) * 0.8
+        # only pick among pairs already matched, never match on the main loop
+        cache = MorphCache()
+        ready = [
+            i
+            for i, shape in enumerate(self.active_shapes)
+            if cache.has(self._non_active_shape, shape)
+        ]
+        if not ready:
+            # cold cache: wait for the first prefetched pair
+            if self.morph_path is None and not self._awaiting_morph:
+                self._awaiting_morph = True
+                cache.notify_ready(
+                    self._non_active_shape,
+                    self.active_shapes[0],
+                    self._on_first_morph_ready,
+                )
+            return
+
+        self.current_idx = choice(ready)
+        self.morph_path = cache.get_path(
+            self._non_active_shape, self.active_shapes[self.current_idx]
+        )
+
+    def _on_first_morph_ready(self):
+        self._awaiting_morph = False
+        if self.morph_path is None:
+            self._prepare_next_morph()
+            self.queue_draw()
 
-    def update_animation(self, positive_direction: bool = True):
-        self.progress += self.animation_speed * (+1 if positive_direction else -1)
+    def update_animation(self, frame_time: float) -> bool:
+        # advance by elapsed time; a late frame skips ahead instead of lagging
+        step = max(0.0, frame_time - self._last_time) / self.duration
+        self._last_time = frame_time
+        self.progress += step * (+1 if self._direction else -1)
 
         if self.progress >= 1.0 or self.progress <= 0.0:
             self.progress = max(0.0, min(1.0, self.progress))  # clamp
-            self.glib_id = None
+            self.anim_id = None
             return False
 
-        self.queue_draw()
         return True
-    
+
     def _safely_start_animation(self, direction: bool):
-        if self.glib_id is not None:
-            GLib.source_remove(self.glib_id)
-        self.glib_id = GLib.timeout_add(16, self.update_animation, direction)  # ~60 fps
+        # ticked and redrawn by the shared scheduler, in step with the frame clock
+        self._direction = direction
+        if self.anim_id is None:
+            self._last_time = GLib.get_monotonic_time() / 1_000_000
+            self.anim_id = AnimationScheduler().add(self.update_animation, self)
 
     def morph_active(self):
         # already in active state
-        if self.glib_id is None and self.progress >= 1:
+        if self.anim_id is None and self.progress >= 1:
             return
 
         if self.progress <= 0:
@@ -208,7 +189,7 @@ class WorkspaceShapeMorph(Gtk.DrawingArea):
 
     def morph_deactivate(self):
         # already in deactive state
-        if self.glib_id is None and self.progress <= 0:
+        if self.anim_id is None and self.progress <= 0:
             return
 
         if self.progress > 1:
@@ -217,15 +198,6 @@ class WorkspaceShapeMorph(Gtk.DrawingArea):
         # morph to 0.0
         self._safely_start_animation(False)
 
-    def create_rounded_polygon(self, unit_data):
-        verts = []
-        per_vertex = []
-        for (ux, uy), rounding_preset in unit_data:
-            verts.extend([ux, uy])
-            per_vertex.append(rounding_preset)
-
-        return RoundedPolygon.create(vertices=verts, per_vertex_rounding=per_vertex)
-
     def on_draw(self, widget, ctx: cairo.Context):
         width = self.get_allocated_width()
         height = self.get_allocated_height()
@@ -241,17 +213,15 @@ class WorkspaceShapeMorph(Gtk.DrawingArea):
         scale_factor = side
         ctx.scale(scale_factor, scale_factor)
 
-        alpha = self.material_easing(self.progress)
+        alpha = material_emphasized(self.progress)
 
-        curves = Morph.as_cubics(self.mappings, alpha)
-        if not curves:
+        if not self.morph_path:
+            # the resting circle, until a morph has been matched
+            ctx.arc(0.5, 0.5, 0.12, 0, math.tau)
+            ctx.fill()
             return False
 
-        ctx.move_to(curves[0].p0.x, curves[0].p0.y)
-        for c in curves:
-            ctx.curve_to(c.p1.x, c.p1.y, c.p2.x, c.p2.y, c.p3.x, c.p3.y)
-
-        ctx.close_path()
+        self.morph_path.append_to(ctx, alpha)
         ctx.set_line_width(0)
         ctx.stroke_preserve()
         ctx.fill()
@@ -306,6 +276,13 @@ class WorkspaceButton(FabricWorkspaceButton):
         self.morphing_shape = WorkspaceShapeMorph()
         self.morphing_shape.morph_deactivate()
 
+        self._windows: list[dict] = []
+        self._windows_key: tuple = ()
+        self._thumbnails: WorkspaceThumbnails | None = None
+        # tooltip body, rebuilt only when the windows or thumbnail change
+        self._preview: WorkspacePreview | None = None
+        self._preview_key: tuple | None = None
+
         super().__init__(
             id,
             label,
@@ -355,6 +332,42 @@ class WorkspaceButton(FabricWorkspaceButton):
             ),
         )
 
+        self.set_has_tooltip(True)
+        self.connect("query-tooltip", self._on_query_tooltip)
+
+    @property
+    def window_count(self) -> int:
+        return len(self._windows)
+
+    def set_windows(self, windows: list[dict]):
+        key = tuple(
+            (c["id"], c.get("name"), (c.get("window_properties") or {}).get("class"))
+            for c in windows
+        )
+        if key == self._windows_key:
+            return
+        self._windows_key = key
+        self._windows = windows
+
+        # on the shape too, which is what the occupancy colors style
+        self._update_style_class("single", len(windows) == 1)
+        self._update_style_class("multiple", len(windows) > 1)
+
+    def enable_thumbnails(self, thumbnails: WorkspaceThumbnails):
+        self._thumbnails = thumbnails
+
+    def _on_query_tooltip(self, _widget, _x, _y, _keyboard, tooltip: Gtk.Tooltip):
+        if not self._windows:
+            return False
+        thumbnail = self._thumbnails.get(self.id) if self._thumbnails else None
+        # query-tooltip fires on every pointer motion
+        key = (self._windows_key, thumbnail)
+        if self._preview is None or key != self._preview_key:
+            self._preview = WorkspacePreview(self.id, self._windows, thumbnail)
+            self._preview_key = key
+        tooltip.set_custom(self._preview)
+        return True
+
     def _update_style_class(self, class_name: str, value: bool):
         context = self.morphing_shape.get_style_context()
 
@@ -1,21 +1,21 @@
-import threading
-from i3ipc import Connection, Event
-
 from fabric.widgets.box import Box
+from fabric.widgets.label import Label
+from fabric.utils.helpers import truncate
 from fabric.i3.widgets import (
     # I3Language,
-    I3ActiveWindow,
+    # I3ActiveWindow,
     I3Workspaces,
     # WorkspaceButton,
 )
 
 from .workspace_button import WorkspaceButton
+from .preview import WorkspaceThumbnails
 from config.config import config
+from services.i3_service import I3Service, ShutdownEvent, WindowEvent, WorkspaceEvent
 
 
 class i3Connector:
     _instance = None
-    _thread = None
 
     @classmethod
     def _get_instance(cls, **kwargs):
@@ -26,56 +26,48 @@ class i3Connector:
     def __init__(self, **kwargs):
         self.workspace = kwargs.get("workspace", None)
         self.active_window = kwargs.get("active", None)
-        self.i3 = Connection(auto_reconnect=True)
+        # shared connection, events arrive on the main loop
+        self.i3 = I3Service()
         self.i3.command("gaps left all set 3px")
         self.i3.command("gaps top all set 3px")
         self.i3.command("gaps bottom all set 3px")
 
-        self.callbacks = {Event.WORKSPACE: []}
+        self.callbacks = {"workspace": []}
 
-        self.focused = self.i3.get_tree().find_focused()
+        # mirrored tree, no round trip
+        self.focused = self.i3.tree.get_focused()
         # print(self.focused.name, self.focused.workspace().name)
         # i3.command("focus left")
         # for con in self.i3.get_tree():
         #    print(con.name)
-        self.i3.on(Event.WORKSPACE_FOCUS, self.on_workspace_focus)
-        self.i3.on(Event.WINDOW_FOCUS, self.on_window_focus)
-        self.i3.on(Event.WINDOW_TITLE, self.on_window_title_change)
-        self.i3.on(Event.SHUTDOWN_RESTART, self.on_session_restart)
+        self.i3.subscribe("workspace", self.on_workspace_focus, changes=["focus"])
+        self.i3.subscribe("window", self.on_window_focus, changes=["focus"])
+        self.i3.subscribe("window", self.on_window_title_change, changes=["title"])
+        self.i3.subscribe("shutdown", self.on_session_restart, changes=["restart"])
 
-    def on_workspace_focus(self, i3, e):
+    def on_workspace_focus(self, e: WorkspaceEvent):
         if e.current:
-            # print("Window in workspace", e.current.num)
-            # for w in e.current.leaves():
-            #     #print(w)
-            # self.workspace.set_active_window(e.current.num)
-            for callback in self.callbacks[Event.WORKSPACE]:
-                callback(i3, e)
-
-    def on_window_focus(self, i3, e):
-        # focused = i3.get_tree().find_focused()
+            # print("Window in workspace", e.current["num"])
+            # self.workspace.set_active_window(e.current["num"])
+            for callback in self.callbacks["workspace"]:
+                callback(e)
+
+    def on_window_focus(self, e: WindowEvent):
         # ws_name = "%s %s" % (focused.workspace().num, focused.window_class)
-        # print(e.container.name)
-        # self.active_window.setter_label(focused.name)
-        self.active_window.setter_label(e.container.name)
+        self.active_window.setter_label(e.container.get("name") or "")
 
-    def on_window_title_change(self, i3, e):
-        self.active_window.setter_label(e.container.name)
+    def on_window_title_change(self, e: WindowEvent):
+        self.active_window.setter_label(e.container.get("name") or "")
 
-    def on_session_restart(self, i3, e):
+    def on_session_restart(self, e: ShutdownEvent):
         if config.VERTICAL:
-            i3.command("gaps left all set 44px")
-            i3.command("gaps top all set 3px")
+            self.i3.command("gaps left all set 44px")
+            self.i3.command("gaps top all set 3px")
         else:
             self.i3.command("gaps left all set 3px")
             self.i3.command("gaps top all set 3px")
             self.i3.command("gaps bottom all set 3px")
 
-    def start(self):
-        if self._thread is None or not self.thread.is_alive():
-            self._thread = threading.Thread(target=self.i3.main, daemon=True)
-            self._thread.start()
-
     def register_callback(self, event_type, callback):
         if event_type in self.callbacks:
             self.callbacks[event_type].append(callback)
@@ -95,23 +87,46 @@ class Workspaces(Box):
             h_align="fill",
         )
 
+        self._buttons: dict[int, WorkspaceButton] = {}
+        self._thumbnails = (
+            WorkspaceThumbnails() if config.workspaces.previews.enabled else None
+        )
+
         self.children = (
             I3Workspaces(
                 name="workspaces",
-                buttons=[
-                    WorkspaceButton(
-                        id=ws_id,
-                    )
-                    for ws_id in range(1, 11)
-                ],
+                buttons=[self._make_button(ws_id) for ws_id in range(1, 11)],
                 # for special workspaces (multi monitor, etc)
-                buttons_factory=lambda ws_id: WorkspaceButton(id=ws_id),
+                buttons_factory=self._make_button,
             ),
         )
 
+        # occupancy straight from the mirrored tree
+        self.i3 = I3Service()
+        self.i3.connect("tree-changed", self._on_tree_changed)
+        self._on_tree_changed()
+
         # self.i3_connector = i3Connector._get_instance(workspace=self)
-        # self.i3_connector.start()
-        # self.i3_connector.register_callback(Event.WORKSPACE, self.set_active_window)
+        # self.i3_connector.register_callback("workspace", self.set_active_window)
+
+    def _make_button(self, ws_id: int) -> WorkspaceButton:
+        button = WorkspaceButton(id=ws_id)
+        if self._thumbnails is not None:
+            button.enable_thumbnails(self._thumbnails)
+        self._buttons[ws_id] = button
+        button.connect(
+            "destroy",
+            lambda *_: self._buttons.get(ws_id) is button and self._buttons.pop(ws_id),
+        )
+        return button
+
+    def _on_tree_changed(self, *_):
+        windows = {
+            ws.get("num"): self.i3.tree.get_windows(ws.get("name"))
+            for ws in self.i3.tree.get_workspaces()
+        }
+        for ws_id, button in self._buttons.items():
+            button.set_windows(windows.get(ws_id, []))
 
         # self.all_workspaces = Box(name="workspace-container", orientation="v" if info.VERTICAL else "h", spacing=8, children = self.buttons())
         # self.children = Box(children=[self.all_workspaces])
@@ -175,10 +190,23 @@ class ActiveWindow(Box):
             v_align="center",
             **kwargs,
         )
-        self.active_window = I3ActiveWindow(name="active-window")
+        # fed from the mirrored tree instead of a GET_TREE per event
+        self.active_window = Label(label="Desktop", name="active-window")
+        self._title = None
+
+        self.i3 = I3Service()
+        self.i3.connect("tree-changed", self._on_tree_changed)
+        self._on_tree_changed()
 
-        # self.active_window = Label(label="", name="active-window")
         # self.i3_connector = i3Connector._get_instance(active=self)
 
+    def _on_tree_changed(self, *_):
+        focused = self.i3.tree.get_focused()
+        title = focused.get("name") if focused and focused.get("window") else None
+        if title == self._title:
+            return
+        self._title = title
+        self.active_window.set_label(truncate(title, 42) if title else "Desktop")
+
     # def setter_label(self, curr_window):
     #     self.active_window.set_label(curr_window)
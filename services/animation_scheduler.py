@@ -0,0 +1,210 @@
+from loguru import logger
+from typing import Callable
+
+from gi.repository import Gdk, GLib, Gtk
+
+from services.visibility import VisibilityTracker
+
+FALLBACK_INTERVAL = 16  # ms, only while no animated widget is on screen
+
+
+class _Animation:
+    __slots__ = ("tick", "widget", "redraw", "watch")
+
+    def __init__(
+        self, tick: Callable[[float], bool], widget: Gtk.Widget | None, redraw: bool
+    ):
+        self.tick = tick
+        self.widget = widget
+        self.redraw = redraw
+        self.watch: int | None = None
+
+
+class AnimationScheduler:
+    """
+    One clock for every animation in the shell.
+
+    Animations register a `tick(frame_time) -> keep_running` callback and,
+    optionally, the widget they draw into. All of them are stepped from a
+    single frame clock "update" signal (or one timer while nothing animated is
+    mapped), then each dirty widget gets exactly one `queue_draw` for the
+    frame. The clock is released as soon as the last animation finishes.
+
+    Animations that only redraw a widget are parked while that widget is off
+    screen (see `VisibilityTracker`) and pick up where the clock is on return.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self._animations: dict[int, _Animation] = {}
+        self._hidden: dict[int, _Animation] = {}  # parked, widget off screen
+        self._next_handle = 1
+
+        self._clock: Gdk.FrameClock | None = None
+        self._clock_owner: Gtk.Widget | None = None
+        self._clock_handlers: list[tuple[object, int]] = []
+        self._timer_id: int | None = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._animations or self._hidden)
+
+    def add(
+        self,
+        tick: Callable[[float], bool],
+        widget: Gtk.Widget | None = None,
+        redraw: bool = True,
+    ) -> int:
+        """
+        Step `tick` once per frame until it returns False. Unless `redraw` is
+        off, `widget` is redrawn after every frame it ticked in; its frame
+        clock may drive the scheduler. Returns a handle for `remove`.
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        animation = _Animation(tick, widget, redraw)
+
+        # state animations (redraw off) must finish even off screen
+        if redraw and widget is not None:
+            tracker = VisibilityTracker()
+            animation.watch = tracker.watch(
+                widget, lambda visible: self._on_visibility(handle, visible)
+            )
+            if not tracker.is_visible(widget):
+                self._hidden[handle] = animation
+                return handle
+
+        self._animations[handle] = animation
+        self._ensure_driver(widget)
+        return handle
+
+    def remove(self, handle: int | None) -> None:
+        if handle is None:
+            return
+        animation = self._animations.pop(handle, None) or self._hidden.pop(
+            handle, None
+        )
+        if animation is None:
+            return
+        VisibilityTracker().unwatch(animation.watch)
+        if not self._animations:
+            self._stop_driver()
+
+    def _on_visibility(self, handle: int, visible: bool):
+        if visible:
+            animation = self._hidden.pop(handle, None)
+            if animation is not None:
+                self._animations[handle] = animation
+                self._ensure_driver(animation.widget)
+            return
+
+        animation = self._animations.pop(handle, None)
+        if animation is not None:
+            self._hidden[handle] = animation
+            if not self._animations:
+                self._stop_driver()
+
+    # --- driving ---
+
+    def _on_frame(self, frame_time: float):
+        dirty: dict[int, Gtk.Widget] = {}
+        for handle, animation in list(self._animations.items()):
+            if handle not in self._animations:
+                continue  # removed by an earlier tick this frame
+            try:
+                keep = animation.tick(frame_time)
+            except Exception as e:
+                logger.exception(f"[Animations] tick failed: {e}")
+                keep = False
+
+            if not keep:
+                self._animations.pop(handle, None)
+                VisibilityTracker().unwatch(animation.watch)
+            if animation.redraw and animation.widget is not None:
+                dirty[id(animation.widget)] = animation.widget
+
+        # one redraw per widget per frame, however many animations it runs
+        for widget in dirty.values():
+            widget.queue_draw()
+
+        if not self._animations:
+            self._stop_driver()
+
+    def _on_clock_update(self, clock: Gdk.FrameClock):
+        self._on_frame(clock.get_frame_time() / 1_000_000)
+
+    def _on_timer(self) -> bool:
+        self._on_frame(GLib.get_monotonic_time() / 1_000_000)
+        if self._timer_id is None:
+            return False
+        # a widget may have been mapped since, prefer its clock
+        if self._attach_clock(self._find_clock_owner()):
+            self._timer_id = None
+            return False
+        return True
+
+    def _ensure_driver(self, widget: Gtk.Widget | None):
+        if self._clock is not None:
+            return
+        if self._attach_clock(widget) or self._attach_clock(self._find_clock_owner()):
+            if self._timer_id is not None:
+                GLib.source_remove(self._timer_id)
+                self._timer_id = None
+            return
+        if self._timer_id is None:
+            self._timer_id = GLib.timeout_add(FALLBACK_INTERVAL, self._on_timer)
+
+    def _find_clock_owner(self) -> Gtk.Widget | None:
+        return next(
+            (
+                a.widget
+                for a in self._animations.values()
+                if a.widget is not None and a.widget.get_mapped()
+            ),
+            None,
+        )
+
+    def _attach_clock(self, widget: Gtk.Widget | None) -> bool:
+        if widget is None or not widget.get_mapped():
+            return False
+        clock = widget.get_frame_clock()
+        if clock is None:
+            return False
+
+        self._clock = clock
+        self._clock_owner = widget
+        self._clock_handlers = [
+            (clock, clock.connect("update", self._on_clock_update)),
+            # a hidden window's clock freezes, move to another one
+            (widget, widget.connect("unmap", self._on_clock_owner_unmapped)),
+        ]
+        clock.begin_updating()
+        return True
+
+    def _detach_clock(self):
+        if self._clock is None:
+            return
+        for obj, handler_id in self._clock_handlers:
+            obj.disconnect(handler_id)
+        self._clock_handlers = []
+        self._clock.end_updating()
+        self._clock = None
+        self._clock_owner = None
+
+    def _on_clock_owner_unmapped(self, *_):
+        self._detach_clock()
+        if self._animations:
+            self._ensure_driver(None)
+
+    def _stop_driver(self):
+        self._detach_clock()
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
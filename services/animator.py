@@ -2,6 +2,8 @@ from typing import cast
 from fabric import Service, Signal, Property
 from gi.repository import GLib, Gtk
 
+from services.animation_scheduler import AnimationScheduler
+
 class Animator(Service):
   @Signal
   def finished(self) -> None: ...
@@ -98,6 +100,8 @@ class Animator(Service):
       return start + (end - start) * time
 
   def do_interpolate_cubic_bezier(self, time: float) -> float:
+      # a plain polynomial, cheaper than a table lookup; only solved curves
+      # (see utils.easing) are worth baking
       y_points = (0, self.bezier_curve[1], self.bezier_curve[3], 1)
       return (
           (1 - time) ** 3 * y_points[0]
@@ -139,10 +143,7 @@ class Animator(Service):
 
   def do_remove_tick_handlers(self):
       if self._tick_handler:
-          if self._tick_widget:
-              self._tick_widget.remove_tick_callback(self._tick_handler)
-          else:
-              GLib.source_remove(self._tick_handler)
+          AnimationScheduler().remove(self._tick_handler)
       self._tick_handler = None
       return
 
@@ -158,12 +159,10 @@ class Animator(Service):
       self._start_time = self.do_get_time_now()
 
       if not self._tick_handler:
-          if self._tick_widget:
-              self._tick_handler = self._tick_widget.add_tick_callback(
-                  self.do_handle_tick
-              )
-          else:
-              self._tick_handler = GLib.timeout_add(16, self.do_handle_tick)
+          # shared frame clock; listeners of `value` redraw themselves
+          self._tick_handler = AnimationScheduler().add(
+              self.do_handle_tick, self._tick_widget, redraw=False
+          )
 
       self.playing = True
       return
@@ -0,0 +1,153 @@
+import os
+import threading
+from collections import OrderedDict
+from loguru import logger
+
+import cairo
+import gi
+
+gi.require_version("Gdk", "3.0")
+from gi.repository import Gdk, GdkPixbuf, GLib
+
+# artwork is never shown larger than this, no point keeping 3000px covers around
+MAX_DECODE_SIZE = 512
+
+# files like the wallpaper preview are replaced in place, so the path alone
+# doesn't identify an image
+ArtworkKey = tuple[str, int]  # (path, mtime_ns)
+
+
+def artwork_key(path: str) -> ArtworkKey:
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return path, 0
+
+
+class ArtworkCache:
+    """
+    Process-wide cache of decoded artwork shared by every player view.
+
+    Each file is decoded once, off the main thread, and then cover-cropped
+    into a cairo surface per (size, scale) that is asked for. Widgets paint
+    those surfaces directly, so a track change costs no CSS re-resolution.
+    Entries are keyed by `artwork_key`, so a rewritten file is decoded again
+    and its stale version dropped.
+    """
+
+    _instance = None
+
+    MAX_SOURCES = 8
+    MAX_SURFACES = 32
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self._sources: OrderedDict[ArtworkKey, GdkPixbuf.Pixbuf] = OrderedDict()
+        self._surfaces: OrderedDict[tuple, cairo.ImageSurface] = OrderedDict()
+        self._loading: dict[ArtworkKey, list] = {}  # key -> callbacks
+
+    def load(self, key: ArtworkKey, callback=None) -> bool:
+        """
+        Make sure `key` is decoded. Returns True if it already is, otherwise
+        decodes in the background and calls `callback(key)` on the main loop.
+        """
+        if key in self._sources:
+            self._sources.move_to_end(key)
+            return True
+
+        waiters = self._loading.get(key)
+        if waiters is None:
+            waiters = self._loading[key] = []
+            threading.Thread(
+                target=self._decode, args=(key,), name="artwork-decode", daemon=True
+            ).start()
+        if callback:
+            waiters.append(callback)
+        return False
+
+    def _decode(self, key: ArtworkKey):
+        path = key[0]
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                path, MAX_DECODE_SIZE, MAX_DECODE_SIZE, True
+            )
+        except GLib.Error as e:
+            logger.warning(f"[Artwork] Failed to decode {path}: {e}")
+            pixbuf = None
+        GLib.idle_add(self._on_decoded, key, pixbuf)
+
+    def _on_decoded(self, key: ArtworkKey, pixbuf: GdkPixbuf.Pixbuf | None):
+        waiters = self._loading.pop(key, [])
+        if pixbuf is not None:
+            # older versions of a rewritten file will never be asked for again
+            for stale in [k for k in self._sources if k[0] == key[0]]:
+                del self._sources[stale]
+                self._drop_surfaces(stale)
+
+            self._sources[key] = pixbuf
+            while len(self._sources) > self.MAX_SOURCES:
+                evicted, _ = self._sources.popitem(last=False)
+                self._drop_surfaces(evicted)
+
+        for callback in waiters:
+            callback(key)
+        return False
+
+    def _drop_surfaces(self, key: ArtworkKey):
+        for surface_key in [k for k in self._surfaces if k[0] == key]:
+            del self._surfaces[surface_key]
+
+    def get_surface(
+        self, key: ArtworkKey, width: int, height: int, scale: int = 1
+    ) -> cairo.ImageSurface | None:
+        """Cover-cropped surface for `key`, or None if not decoded yet."""
+        if width <= 0 or height <= 0:
+            return None
+
+        surface_key = (key, width, height, scale)
+        surface = self._surfaces.get(surface_key)
+        if surface is not None:
+            self._surfaces.move_to_end(surface_key)
+            return surface
+
+        pixbuf = self._sources.get(key)
+        if pixbuf is None:
+            return None
+
+        surface = self._render_cover(pixbuf, width, height, scale)
+        self._surfaces[surface_key] = surface
+        while len(self._surfaces) > self.MAX_SURFACES:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def _render_cover(
+        pixbuf: GdkPixbuf.Pixbuf, width: int, height: int, scale: int
+    ) -> cairo.ImageSurface:
+        # same as `background-size: cover; background-position: center;`
+        px_width, px_height = width * scale, height * scale
+        src_width, src_height = pixbuf.get_width(), pixbuf.get_height()
+        factor = max(px_width / src_width, px_height / src_height)
+
+        scaled = pixbuf.scale_simple(
+            max(1, round(src_width * factor)),
+            max(1, round(src_height * factor)),
+            GdkPixbuf.InterpType.BILINEAR,
+        )
+
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, px_width, px_height)
+        cr = cairo.Context(surface)
+        Gdk.cairo_set_source_pixbuf(
+            cr,
+            scaled,
+            (px_width - scaled.get_width()) / 2,
+            (px_height - scaled.get_height()) / 2,
+        )
+        cr.paint()
+        surface.set_device_scale(scale, scale)
+        return surface
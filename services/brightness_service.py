@@ -1,19 +1,133 @@
 import os
+import re
+import time
+import shutil
+import threading
+import subprocess
 from loguru import logger
-from gi.repository import Gio
+from dataclasses import dataclass
+from typing import Callable, Literal
+from gi.repository import Gio, GLib
 
 from fabric.core.service import Service, Signal
-from fabric.utils.helpers import monitor_file, exec_shell_command_async
+from fabric.utils.helpers import monitor_file
 
 from config.config import config
 
+BACKLIGHT_DIR = "/sys/class/backlight"
+DDC_BRIGHTNESS_VCP = "10"
+
+# i2c round trips are slow (~50ms+ per command), so DDC writes wait longer
+# for the user to settle before hitting the bus
+BACKLIGHT_DEBOUNCE = 0.03
+DDC_DEBOUNCE = 0.15
+
+
+@dataclass
+class BrightnessDevice:
+    name: str
+    kind: Literal["backlight", "ddc"]
+    label: str
+    brightness: int = -1
+    max_brightness: int = -1
+    bus: int | None = None
+    # last requested percent; lets repeated increments stack up before the
+    # device has caught up
+    target: int | None = None
+
+    @property
+    def percent(self) -> int:
+        if self.max_brightness <= 0:
+            return 0
+        return round(100 * self.brightness / self.max_brightness)
+
+
+class _DeviceWorker:
+    """
+    Serializes writes to a single device on its own thread.
+
+    Only the most recent request is kept: anything submitted while the worker
+    is debouncing or still busy with the bus collapses into the latest value.
+    A slow monitor therefore never delays the main loop or the other outputs.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write: Callable[[int], None],
+        on_written: Callable[[int, bool], None],
+        debounce: float,
+    ):
+        self._write = write
+        self._on_written = on_written
+        self._debounce = debounce
+        self._pending: int | None = None
+        self._stopped = False
+        self._cond = threading.Condition()
+        threading.Thread(
+            target=self._run, name=f"brightness-{name}", daemon=True
+        ).start()
+
+    def submit(self, value: int):
+        with self._cond:
+            self._pending = value
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+
+            # let a drag/scroll burst settle, then take whatever is newest
+            time.sleep(self._debounce)
+
+            with self._cond:
+                value, self._pending = self._pending, None
+
+            try:
+                self._write(value)
+                ok = True
+            except Exception as e:
+                logger.warning(f"[Brightness] Write failed: {e}")
+                ok = False
+
+            GLib.idle_add(lambda v=value, ok=ok: self._on_written(v, ok) or False)
+
+
+def _run_command(cmd: list[str], timeout: float = 5) -> str:
+    return subprocess.run(
+        cmd, capture_output=True, text=True, check=True, timeout=timeout
+    ).stdout
+
+
+def _read_int(path: str) -> int:
+    with open(path) as f:
+        return int(f.readline().strip())
+
 
 class BrightnessService(Service):
     _instance = None
 
+    # primary device only, kept for the single-output widgets
     @Signal
     def value_changed(self, new_value: int, max_value: int) -> None: ...
 
+    @Signal
+    def device_value_changed(
+        self, device: str, new_value: int, max_value: int
+    ) -> None: ...
+
+    @Signal
+    def devices_changed(self) -> None: ...
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -23,56 +137,215 @@ class BrightnessService(Service):
     def _init_singleton(self):
         super().__init__()
 
-        self.brightness = -1
-        self.max_brightness = -1
-        self.brightness_monitor = None
-        self.backlight_path = f"/sys/class/backlight/{config.BRIGHTNESS_DEV}"
+        self._devices: dict[str, BrightnessDevice] = {}
+        self._workers: dict[str, _DeviceWorker] = {}
+        self._monitors: dict[str, Gio.FileMonitor] = {}
+        self._primary: str | None = None
+
+        self._discover_backlights()
+        self._resolve_primary()
+
+        # ddcutil detect probes every i2c bus and can take seconds
+        if shutil.which("ddcutil"):
+            threading.Thread(
+                target=self._discover_ddc, name="brightness-ddc-detect", daemon=True
+            ).start()
+
+    # --- discovery ---
 
+    def _discover_backlights(self):
         try:
-            self.brightness = self._read_brightness()
-            self.max_brightness = self._read_max_brightness()
-            self.brightness_monitor = monitor_file(self.backlight_path)
-            self.brightness_monitor.connect("changed", self._on_brightness_changed)
-            # emit
-            self.value_changed(self.brightness, self.max_brightness)
+            names = sorted(os.listdir(BACKLIGHT_DIR))
+        except OSError:
+            names = []
+
+        for name in names:
+            path = os.path.join(BACKLIGHT_DIR, name)
+            try:
+                device = BrightnessDevice(
+                    name=name,
+                    kind="backlight",
+                    label=name,
+                    brightness=_read_int(os.path.join(path, "brightness")),
+                    max_brightness=_read_int(os.path.join(path, "max_brightness")),
+                )
+            except Exception as e:
+                logger.error(f"Brightness device not found at {path}: {e}")
+                continue
+
+            monitor = monitor_file(path)
+            monitor.connect("changed", self._on_backlight_changed, name)
+            self._monitors[name] = monitor
+            self._add_device(device, BACKLIGHT_DEBOUNCE)
+
+    def _discover_ddc(self):
+        try:
+            output = _run_command(["ddcutil", "detect", "--brief"], timeout=30)
         except Exception as e:
-            logger.error(f"Brightness device not found at {self.backlight_path}: {e}")
-
-    def _read_brightness(self) -> int:
-        brightness_path = os.path.join(self.backlight_path, "brightness")
-        if os.path.exists(brightness_path):
-            with open(brightness_path) as f:
-                return int(f.readline().strip())
-        return -1
-
-    def _read_max_brightness(self) -> int:
-        max_path = os.path.join(self.backlight_path, "max_brightness")
-        if os.path.exists(max_path):
-            with open(max_path) as f:
-                return int(f.readline())
-        return -1
-
-    def _on_brightness_changed(self, monitor: Gio.FileMonitor, file: Gio.File, *args):
+            logger.warning(f"[Brightness] DDC detection failed: {e}")
+            return
+
+        found = []
+        for block in re.split(r"\n(?=Display \d+)", output):
+            bus = re.search(r"I2C bus:\s+/dev/i2c-(\d+)", block)
+            if not bus:
+                continue
+            connector = re.search(r"DRM connector:\s+\S+?-(\S+)", block)
+            model = re.search(r"Monitor:\s+(?:[^:]*:)?([^:\n]+)", block)
+
+            bus = int(bus.group(1))
+            try:
+                current, maximum = self._ddc_read(bus)
+            except Exception as e:
+                logger.warning(f"[Brightness] DDC bus {bus} unreadable: {e}")
+                continue
+
+            found.append(
+                BrightnessDevice(
+                    name=f"ddc-{bus}",
+                    kind="ddc",
+                    label=(
+                        model.group(1).strip()
+                        if model
+                        else connector.group(1) if connector else f"i2c-{bus}"
+                    ),
+                    brightness=current,
+                    max_brightness=maximum,
+                    bus=bus,
+                )
+            )
+
+        GLib.idle_add(lambda: self._register_ddc(found) or False)
+
+    def _register_ddc(self, devices: list[BrightnessDevice]):
+        for device in devices:
+            self._add_device(device, DDC_DEBOUNCE)
+            logger.info(f"[Brightness] DDC display: {device.label} (bus {device.bus})")
+
+        if devices:
+            self._resolve_primary()
+            self.devices_changed()
+
+    def _add_device(self, device: BrightnessDevice, debounce: float):
+        self._devices[device.name] = device
+        self._workers[device.name] = _DeviceWorker(
+            device.name,
+            write=lambda value, d=device: self._write(d, value),
+            on_written=lambda value, ok, d=device: self._on_written(d, value, ok),
+            debounce=debounce,
+        )
+
+    def _resolve_primary(self):
+        if self._primary in self._devices:
+            return
+
+        if config.BRIGHTNESS_DEV in self._devices:
+            self._primary = config.BRIGHTNESS_DEV
+        elif self._devices:
+            self._primary = next(iter(self._devices))
+        else:
+            logger.error(
+                f"Brightness device not found at {BACKLIGHT_DIR}/{config.BRIGHTNESS_DEV}"
+            )
+            return
+
+        device = self._devices[self._primary]
+        self.value_changed(device.brightness, device.max_brightness)
+
+    # --- backend io (worker threads) ---
+
+    @staticmethod
+    def _ddc_read(bus: int) -> tuple[int, int]:
+        # "VCP 10 C <current> <max>"
+        fields = _run_command(
+            ["ddcutil", "--bus", str(bus), "getvcp", DDC_BRIGHTNESS_VCP, "--brief"]
+        ).split()
+        return int(fields[3]), int(fields[4])
+
+    def _write(self, device: BrightnessDevice, percent: int):
+        if device.kind == "backlight":
+            _run_command(["brightnessctl", "-d", device.name, "set", f"{percent}%"])
+        else:
+            value = round(percent * device.max_brightness / 100)
+            _run_command(
+                [
+                    "ddcutil",
+                    "--bus",
+                    str(device.bus),
+                    "--noverify",
+                    "setvcp",
+                    DDC_BRIGHTNESS_VCP,
+                    str(value),
+                ]
+            )
+
+    # --- main loop ---
+
+    def _on_written(self, device: BrightnessDevice, percent: int, ok: bool):
+        # done with this request either way; a newer one keeps its target.
+        # coarse hardware may never read back the exact percent asked for
+        if device.target == percent:
+            device.target = None
+
+        # backlights report back through their file monitor
+        if not ok or device.kind != "ddc":
+            return
+        self._update_device(
+            device, round(percent * device.max_brightness / 100)
+        )
+
+    def _on_backlight_changed(
+        self, monitor: Gio.FileMonitor, file: Gio.File, other_file, event, name: str
+    ):
+        device = self._devices.get(name)
+        if device is None:
+            return
         try:
-            raw = file.load_bytes()[0].get_data()
-            new_value = round(int(raw))
-            self.brightness = new_value
-            self.value_changed(new_value, self.max_brightness)
+            new_value = _read_int(os.path.join(BACKLIGHT_DIR, name, "brightness"))
         except Exception as e:
             logger.warning(f"Failed to read brightness: {e}")
+            return
+        if new_value != device.brightness:
+            self._update_device(device, new_value)
+
+    def _update_device(self, device: BrightnessDevice, new_value: int):
+        device.brightness = new_value
+        self.device_value_changed(device.name, new_value, device.max_brightness)
+        if device.name == self._primary:
+            self.value_changed(new_value, device.max_brightness)
+
+    def _get_device(self, device: str | None) -> BrightnessDevice | None:
+        return self._devices.get(device or self._primary)
+
+    # --- public api ---
+
+    def get_devices(self) -> list[BrightnessDevice]:
+        return list(self._devices.values())
+
+    def get_primary_device(self) -> str | None:
+        return self._primary
 
-    def get_brightness(self) -> int:
-        return self.brightness
+    def get_brightness(self, device: str | None = None) -> int:
+        dev = self._get_device(device)
+        return dev.brightness if dev else -1
 
-    def get_max_brightness(self) -> int:
-        return self.max_brightness
+    def get_max_brightness(self, device: str | None = None) -> int:
+        dev = self._get_device(device)
+        return dev.max_brightness if dev else -1
 
-    def set_brightness(self, percent: int):
-        percent = max(0, min(100, int(percent)))
-        exec_shell_command_async(f"brightnessctl set {percent}%")
+    def set_brightness(self, percent: int, device: str | None = None):
+        dev = self._get_device(device)
+        if dev is None:
+            return
+        dev.target = max(0, min(100, int(percent)))
+        self._workers[dev.name].submit(dev.target)
 
-    def increment_brightness(self):
-        exec_shell_command_async(["brightnessctl", "set", "+5%"])
+    def increment_brightness(self, device: str | None = None, step: int = 5):
+        dev = self._get_device(device)
+        if dev is None:
+            return
+        base = dev.target if dev.target is not None else dev.percent
+        self.set_brightness(base + step, dev.name)
 
-    def decrement_brightness(self):
-        exec_shell_command_async(["brightnessctl", "set", "5%-"])
+    def decrement_brightness(self, device: str | None = None, step: int = 5):
+        self.increment_brightness(device, -step)
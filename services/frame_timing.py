@@ -0,0 +1,488 @@
+import os
+import sys
+import json
+import time
+import threading
+from collections import deque
+from loguru import logger
+
+from config.info import CACHE_DIR
+from services.main_loop_watchdog import (
+    SAMPLE_INTERVAL,
+    entry_frame,
+    call_site,
+    stack_above,
+)
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import GLib, GObject, Gtk
+
+FRAME_BUDGET = 16.0  # ms
+HISTORY = 600  # samples kept per window / widget
+MAX_EVENTS = 200
+WINDOW_POLL_INTERVAL = 1  # s, picks up windows created later
+REPORT_FILE = os.path.join(CACHE_DIR, "frame-timings.json")
+
+# GLib entry points whose callbacks get timed, with the index of the callback
+_SCHEDULERS = {"idle_add": 0, "timeout_add": 1, "timeout_add_seconds": 1}
+
+STALL_COVERAGE = (
+    "idle/timeout callbacks scheduled after start() are timed exactly; other "
+    "dispatches into Python (signal handlers, tick callbacks, raw or earlier "
+    f"sources) are sampled every {SAMPLE_INTERVAL * 1000:.0f} ms. Work GTK does "
+    "in C without calling into Python only shows up in the frame times."
+)
+
+
+def _now_ms() -> float:
+    return time.perf_counter() * 1000
+
+
+def describe_callable(func) -> str:
+    """`module.qualname (file:line)` of a callback, as precise as it allows."""
+    target = getattr(func, "__func__", func)
+    name = getattr(target, "__qualname__", None) or repr(target)
+    module = getattr(target, "__module__", None)
+    code = getattr(target, "__code__", None)
+    label = f"{module}.{name}" if module else name
+    if code is not None:
+        label += f" ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label
+
+
+def describe_frame(frame) -> str:
+    """Same label as `describe_callable`, for the function `frame` is running."""
+    code = frame.f_code
+    module = frame.f_globals.get("__name__")
+    name = getattr(code, "co_qualname", code.co_name)
+    label = f"{module}.{name}" if module else name
+    return f"{label} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def describe_widget(widget: Gtk.Widget) -> str:
+    kind = type(widget)
+    label = f"{kind.__module__}.{kind.__qualname__}"
+    name = widget.get_name()
+    # GTK falls back to the type name when none was set
+    if name and name != kind.__gtype__.name:
+        label += f"#{name}"
+    return label
+
+
+class _Stats:
+    __slots__ = ("count", "total", "worst", "over_budget", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.over_budget = 0
+        self.samples: deque[float] = deque(maxlen=HISTORY)
+
+    def add(self, ms: float):
+        self.count += 1
+        self.total += ms
+        self.worst = max(self.worst, ms)
+        self.over_budget += ms > FRAME_BUDGET
+        self.samples.append(ms)
+
+    def summary(self) -> dict:
+        recent = sorted(self.samples)
+        p95 = recent[int(len(recent) * 0.95) - 1] if recent else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p95_ms": round(p95, 3),
+            "max_ms": round(self.worst, 3),
+            "over_budget": self.over_budget,
+        }
+
+
+class _WindowTimings:
+    __slots__ = (
+        "label",
+        "frames",
+        "intervals",
+        "paint_start",
+        "last_frame",
+        "handlers",
+    )
+
+    def __init__(self, label: str):
+        self.label = label
+        self.frames = _Stats()  # before-paint -> after-paint
+        self.intervals = _Stats()  # frame to frame
+        self.paint_start: float | None = None
+        self.last_frame: int | None = None
+        self.handlers: list[tuple[object, int]] = []
+
+
+class FrameTimings:
+    """
+    Opt-in frame timing recorder for finding jank.
+
+    Records, while started:
+      - per window: how long each frame clock cycle takes to update, lay out
+        and paint, and the interval between frames
+      - per custom-drawn widget: time spent in its `draw` emission
+      - main-loop dispatches running longer than a frame, with the function
+        the loop called into and the innermost shell frame. Callbacks passed
+        to `GLib.idle_add`/`timeout_add*` after `start()` are timed exactly;
+        everything else (signal handlers, tick callbacks, raw `GLib.Source`s,
+        sources added before `start()`) is caught by sampling the main
+        thread's stack the way `MainLoopWatchdog` does, to within a sample
+        interval
+
+    Work GTK does in C without calling into Python (layout, CSS, native
+    drawing) can't be pinned on a callback; it only shows in the frame times.
+    `report()` summarizes everything, `dump()` writes it as JSON, e.g.
+    `fabric-cli exec zenith "frame_timings.dump()"`.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self.running = False
+        self.started_at: float | None = None
+
+        self._windows: dict[int, _WindowTimings] = {}
+        self._widgets: dict[str, _Stats] = {}
+        self._callbacks: dict[str, _Stats] = {}
+        self._events: deque[dict] = deque(maxlen=MAX_EVENTS)
+
+        self._draw_starts: dict[int, float] = {}
+        self._painting = False  # draws only run between before/after-paint
+        self._timed_widgets: dict[int, tuple[Gtk.Widget, int, int]] = {}
+        self._custom_types: dict[type, bool] = {}
+
+        self._originals: dict[str, object] = {}
+        self._hook_id: int | None = None
+        self._poll_id: int | None = None
+
+        self._sampler: threading.Thread | None = None
+        self._stop_sampling = threading.Event()
+        self._main_id = threading.main_thread().ident
+        self._base = None  # main thread's top frame while the loop is idle
+
+    # --- control ---
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.running = True
+        self.started_at = time.time()
+
+        self._patch_schedulers()
+        self._hook_id = GObject.add_emission_hook(
+            Gtk.Widget, "draw", self._on_draw_start
+        )
+        self._attach_windows()
+        # unpatched on purpose, the poll itself isn't interesting
+        self._poll_id = self._originals["timeout_add_seconds"](
+            WINDOW_POLL_INTERVAL, self._attach_windows
+        )
+        self._start_sampling()
+        logger.info("[FrameTimings] Recording frame timings")
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+        self._stop_sampling.set()
+        self._sampler.join()
+        self._sampler = None
+
+        if self._poll_id is not None:
+            GLib.source_remove(self._poll_id)
+            self._poll_id = None
+        if self._hook_id is not None:
+            GObject.remove_emission_hook(Gtk.Widget, "draw", self._hook_id)
+            self._hook_id = None
+        self._unpatch_schedulers()
+
+        for timings in self._windows.values():
+            for obj, handler_id in timings.handlers:
+                obj.disconnect(handler_id)
+        self._windows.clear()
+        for widget, after_id, destroy_id in self._timed_widgets.values():
+            widget.disconnect(after_id)
+            widget.disconnect(destroy_id)
+        self._timed_widgets.clear()
+        self._draw_starts.clear()
+        self._painting = False
+        logger.info("[FrameTimings] Stopped recording")
+
+    def reset(self) -> None:
+        self._widgets.clear()
+        self._callbacks.clear()
+        self._events.clear()
+        for timings in self._windows.values():
+            timings.frames = _Stats()
+            timings.intervals = _Stats()
+        self.started_at = time.time()
+
+    # --- reporting ---
+
+    def recent_events(self, count: int = 10) -> list[dict]:
+        return list(self._events)[-count:]
+
+    def report(self, top: int = 15) -> dict:
+        def ranked(stats: dict[str, _Stats]) -> list[dict]:
+            rows = sorted(stats.items(), key=lambda item: item[1].total, reverse=True)
+            return [
+                {"name": name, "total_ms": round(s.total, 1), **s.summary()}
+                for name, s in rows[:top]
+            ]
+
+        windows = []
+        for timings in self._windows.values():
+            interval = timings.intervals.summary()
+            windows.append(
+                {
+                    "window": timings.label,
+                    "fps": round(1000 / interval["mean_ms"], 1)
+                    if interval["mean_ms"]
+                    else 0.0,
+                    "frame": timings.frames.summary(),
+                    "interval": interval,
+                }
+            )
+
+        return {
+            "started_at": self.started_at,
+            "duration_s": round(time.time() - self.started_at, 1)
+            if self.started_at
+            else 0.0,
+            "budget_ms": FRAME_BUDGET,
+            "windows": windows,
+            "draws": ranked(self._widgets),
+            "callbacks": ranked(self._callbacks),
+            "stall_coverage": STALL_COVERAGE,
+            "jank": list(self._events),
+        }
+
+    def dump(self, path: str = REPORT_FILE) -> str:
+        """Write `report()` as JSON to `path` and return the path."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        logger.info(f"[FrameTimings] Report written to {path}")
+        return path
+
+    def _record_event(
+        self, kind: str, source: str, ms: float, site: str | None = None
+    ):
+        event = {
+            "time": round(time.time(), 3),
+            "kind": kind,
+            "source": source,
+            "ms": round(ms, 2),
+        }
+        if site is not None:
+            event["site"] = site
+        self._events.append(event)
+
+    # --- windows ---
+
+    def _attach_windows(self) -> bool:
+        for window in Gtk.Window.list_toplevels():
+            if id(window) in self._windows or not window.get_realized():
+                continue
+            clock = window.get_frame_clock()
+            if clock is None:
+                continue
+
+            label = window.get_name() or type(window).__qualname__
+            timings = self._windows[id(window)] = _WindowTimings(label)
+            timings.handlers = [
+                (clock, clock.connect("before-paint", self._on_before_paint, timings)),
+                (clock, clock.connect("after-paint", self._on_after_paint, timings)),
+                (window, window.connect("unrealize", self._on_window_gone)),
+            ]
+        return True
+
+    def _on_window_gone(self, window: Gtk.Window):
+        timings = self._windows.pop(id(window), None)
+        if timings is not None:
+            for obj, handler_id in timings.handlers:
+                obj.disconnect(handler_id)
+
+    def _on_before_paint(self, clock, timings: _WindowTimings):
+        self._painting = True
+        timings.paint_start = _now_ms()
+
+        frame_time = clock.get_frame_time()
+        if timings.last_frame is not None:
+            interval = (frame_time - timings.last_frame) / 1000
+            # an idle window has no frames, that gap isn't jank
+            if interval < 1000:
+                timings.intervals.add(interval)
+        timings.last_frame = frame_time
+
+    def _on_after_paint(self, clock, timings: _WindowTimings):
+        self._painting = False
+        if timings.paint_start is None:
+            return
+        ms = _now_ms() - timings.paint_start
+        timings.paint_start = None
+        timings.frames.add(ms)
+        if ms > FRAME_BUDGET:
+            self._record_event("frame", timings.label, ms)
+
+    # --- widgets ---
+
+    def _is_custom_drawn(self, widget: Gtk.Widget) -> bool:
+        kind = type(widget)
+        custom = self._custom_types.get(kind)
+        if custom is None:
+            custom = isinstance(widget, (Gtk.DrawingArea, Gtk.GLArea)) or any(
+                "do_draw" in vars(c)
+                for c in kind.__mro__
+                if not c.__module__.startswith("gi.")
+            )
+            self._custom_types[kind] = custom
+        return custom
+
+    def _on_draw_start(self, widget: Gtk.Widget, *_) -> bool:
+        if not self._is_custom_drawn(widget):
+            return True
+
+        # a handler returning True stops the emission before `_on_draw_end`.
+        # draws nest, so a start that isn't an ancestor of this one is over
+        for other_key in list(self._draw_starts):
+            other = self._timed_widgets.get(other_key)
+            if other is None or not widget.is_ancestor(other[0]):
+                del self._draw_starts[other_key]
+
+        key = id(widget)
+        if key not in self._timed_widgets:
+            self._timed_widgets[key] = (
+                widget,
+                widget.connect_after("draw", self._on_draw_end),
+                widget.connect("destroy", self._on_widget_destroyed),
+            )
+        self._draw_starts[key] = _now_ms()
+        return True  # keep the hook installed
+
+    def _on_draw_end(self, widget: Gtk.Widget, _cr):
+        # never reached when a handler stops the emission; that draw is dropped
+        # once the next one starts
+        start = self._draw_starts.pop(id(widget), None)
+        if start is None:
+            return False
+        ms = _now_ms() - start
+        label = describe_widget(widget)
+        self._widgets.setdefault(label, _Stats()).add(ms)
+        if ms > FRAME_BUDGET:
+            self._record_event("draw", label, ms)
+        return False
+
+    def _on_widget_destroyed(self, widget: Gtk.Widget):
+        self._timed_widgets.pop(id(widget), None)
+        self._draw_starts.pop(id(widget), None)
+
+    # --- main loop callbacks ---
+
+    def _patch_schedulers(self):
+        for name, callback_index in _SCHEDULERS.items():
+            original = self._originals[name] = getattr(GLib, name)
+            setattr(GLib, name, self._make_scheduler(original, callback_index))
+
+    def _unpatch_schedulers(self):
+        for name, original in self._originals.items():
+            setattr(GLib, name, original)
+        self._originals.clear()
+
+    def _make_scheduler(self, original, callback_index: int):
+        def schedule(*args, **kwargs):
+            if len(args) > callback_index and callable(args[callback_index]):
+                args = list(args)
+                args[callback_index] = self._timed(args[callback_index])
+            return original(*args, **kwargs)
+
+        return schedule
+
+    def _timed(self, callback):
+        label = None
+
+        def run(*args):
+            nonlocal label
+            start = _now_ms()
+            try:
+                return callback(*args)
+            finally:
+                ms = _now_ms() - start
+                if ms > FRAME_BUDGET and self.running:
+                    if label is None:
+                        label = describe_callable(callback)
+                    self._callbacks.setdefault(label, _Stats()).add(ms)
+                    self._record_event("stall", label, ms)
+
+        return run
+
+    # --- sampled dispatches ---
+
+    def _start_sampling(self):
+        # a raw source, so nothing sits between the loop and the callback
+        source = GLib.Idle()
+        source.set_callback(self._mark_base)
+        source.attach(None)
+
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(
+            target=self._sample, name="frame-timing-sampler", daemon=True
+        )
+        self._sampler.start()
+
+    def _mark_base(self, *_) -> bool:
+        self._base = sys._getframe().f_back
+        return False
+
+    def _sample(self):
+        entry = None
+        since = 0.0
+        skip = False
+        sites: dict[str, int] = {}
+
+        while not self._stop_sampling.wait(SAMPLE_INTERVAL):
+            base = self._base
+            if base is None:
+                continue  # main loop not running yet
+
+            frame = sys._current_frames().get(self._main_id)
+            now = time.monotonic()
+            current = entry_frame(frame, base)
+
+            if current is not entry:
+                ms = (now - since) * 1000
+                if entry is not None and not skip and sites and ms > FRAME_BUDGET:
+                    site = max(sites, key=sites.get)
+                    GLib.idle_add(
+                        self._on_sampled_stall, describe_frame(entry), site, ms
+                    )
+                entry = current
+                since = now
+                sites = {}
+                # timed callbacks, and draws (the only Python a paint calls
+                # into), are measured exactly elsewhere
+                skip = current is not None and (
+                    self._painting or current.f_code.co_filename == __file__
+                )
+            if current is not None and not skip:
+                site = call_site(stack_above(frame, base))
+                sites[site] = sites.get(site, 0) + 1
+            del frame, current
+
+    def _on_sampled_stall(self, label: str, site: str, ms: float) -> bool:
+        if self.running:
+            self._callbacks.setdefault(label, _Stats()).add(ms)
+            self._record_event("stall", label, ms, site)
+        return False
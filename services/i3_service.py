@@ -0,0 +1,496 @@
+from loguru import logger
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from fabric.core.service import Service, Signal
+from fabric.i3.service import I3MessageType
+from fabric.i3.widgets import get_i3_connection
+
+from gi.repository import GLib
+
+TREE_REFETCH_DELAY = 50  # ms, moves arrive as a burst of events
+
+
+@dataclass(frozen=True)
+class WorkspaceEvent:
+    change: str
+    current: dict | None
+    old: dict | None
+
+
+@dataclass(frozen=True)
+class WindowEvent:
+    change: str
+    container: dict
+
+
+@dataclass(frozen=True)
+class OutputEvent:
+    change: str
+
+
+@dataclass(frozen=True)
+class ShutdownEvent:
+    change: str  # "restart" or "exit"
+
+
+_EVENT_TYPES = {
+    "workspace": lambda d: WorkspaceEvent(
+        d.get("change", ""), d.get("current"), d.get("old")
+    ),
+    "window": lambda d: WindowEvent(d.get("change", ""), d.get("container") or {}),
+    "output": lambda d: OutputEvent(d.get("change", "")),
+    "shutdown": lambda d: ShutdownEvent(d.get("change", "")),
+}
+
+
+class I3Tree:
+    """
+    Mirror of the i3 layout tree, fetched once and then patched from events.
+
+    Containers are kept as the dicts i3 sends, indexed by con id, X11 window
+    id and workspace name. Leaf windows are also tracked per workspace, so
+    occupancy and window counts are plain lookups.
+    """
+
+    def __init__(self):
+        self._cons: dict[int, dict] = {}
+        self._parents: dict[int, int] = {}
+        self._by_window: dict[int, int] = {}  # X11 window id -> con id
+        self._workspaces: dict[str, int] = {}  # name -> con id
+        self._window_workspace: dict[int, str] = {}  # leaf con id -> ws name
+        self._workspace_windows: dict[str, set[int]] = {}
+        self._focused: int | None = None
+
+    # --- lookups ---
+
+    def get_con(self, con_id: int) -> dict | None:
+        return self._cons.get(con_id)
+
+    def get_con_by_window(self, window_id: int) -> dict | None:
+        con_id = self._by_window.get(window_id)
+        return self._cons.get(con_id) if con_id is not None else None
+
+    def get_workspace(self, name: str) -> dict | None:
+        con_id = self._workspaces.get(name)
+        return self._cons.get(con_id) if con_id is not None else None
+
+    def get_workspaces(self) -> list[dict]:
+        return [self._cons[c] for c in self._workspaces.values()]
+
+    def get_workspace_of(self, con_id: int) -> str | None:
+        return self._window_workspace.get(con_id)
+
+    def get_windows(self, workspace: str) -> list[dict]:
+        return [self._cons[c] for c in self._workspace_windows.get(workspace, ())]
+
+    def window_count(self, workspace: str) -> int:
+        return len(self._workspace_windows.get(workspace, ()))
+
+    def get_focused(self) -> dict | None:
+        return self._cons.get(self._focused) if self._focused is not None else None
+
+    # --- building ---
+
+    def load(self, root: dict) -> None:
+        self.__init__()
+        self._index(root, None, None)
+
+    def _index(self, con: dict, parent: int | None, workspace: str | None) -> None:
+        con_id = con["id"]
+        self._cons[con_id] = con
+        if parent is not None:
+            self._parents[con_id] = parent
+
+        if con.get("type") == "workspace":
+            workspace = con.get("name")
+            self._workspaces[workspace] = con_id
+            self._workspace_windows.setdefault(workspace, set())
+
+        if con.get("window"):
+            self._by_window[con["window"]] = con_id
+            if workspace is not None:
+                self._window_workspace[con_id] = workspace
+                self._workspace_windows[workspace].add(con_id)
+
+        if con.get("focused"):
+            self._focused = con_id
+
+        for child in con.get("nodes", []) + con.get("floating_nodes", []):
+            self._index(child, con_id, workspace)
+
+    def _remove(self, con_id: int) -> None:
+        con = self._cons.pop(con_id, None)
+        if con is None:
+            return
+        for child in con.get("nodes", []) + con.get("floating_nodes", []):
+            self._remove(child["id"])
+
+        parent = self._cons.get(self._parents.pop(con_id, None))
+        if parent is not None:
+            for key in ("nodes", "floating_nodes"):
+                parent[key] = [c for c in parent.get(key, []) if c["id"] != con_id]
+
+        if con.get("window"):
+            self._by_window.pop(con["window"], None)
+        workspace = self._window_workspace.pop(con_id, None)
+        if workspace is not None:
+            self._workspace_windows.get(workspace, set()).discard(con_id)
+        if con.get("type") == "workspace":
+            self._workspaces.pop(con.get("name"), None)
+            self._workspace_windows.pop(con.get("name"), None)
+        if self._focused == con_id:
+            self._focused = None
+
+    def _set_focused(self, con_id: int | None) -> None:
+        if (old := self._cons.get(self._focused)) is not None:
+            old["focused"] = False
+        self._focused = con_id
+        if (new := self._cons.get(con_id)) is not None:
+            new["focused"] = True
+
+    # --- patching, returns False when the event needs a refetch ---
+
+    def apply_window_event(self, event: "WindowEvent") -> bool:
+        con = event.container
+        con_id = con.get("id")
+        if con_id is None:
+            return True
+
+        match event.change:
+            case "new":
+                # i3 opens windows on the focused workspace; assignments
+                # follow up with a "move", which refetches
+                workspace = self.get_workspace_of(self._focused) or next(
+                    (n for n, c in self._workspaces.items() if self._cons[c].get("focused")),
+                    None,
+                )
+                ws_con = self.get_workspace(workspace) if workspace else None
+                if ws_con is None:
+                    return False
+                ws_con.setdefault("nodes", []).append(con)
+                self._index(con, ws_con["id"], workspace)
+            case "close":
+                self._remove(con_id)
+            case "focus":
+                if con_id not in self._cons:
+                    return False
+                self._set_focused(con_id)
+            case "title" | "urgent" | "mark" | "fullscreen_mode":
+                existing = self._cons.get(con_id)
+                if existing is None:
+                    return False
+                # keep the existing children, take the refreshed fields
+                for key, value in con.items():
+                    if key not in ("nodes", "floating_nodes"):
+                        existing[key] = value
+            case _:
+                # move, floating: structure changed in ways the event omits
+                return False
+        return True
+
+    def apply_workspace_event(self, event: "WorkspaceEvent") -> bool:
+        current = event.current or {}
+        match event.change:
+            case "focus":
+                ws_id = current.get("id")
+                if ws_id not in self._cons:
+                    return False
+                # the focused window inside the workspace follows as a
+                # window::focus event, unless the workspace is empty
+                if not self._workspace_windows.get(current.get("name")):
+                    self._set_focused(ws_id)
+            case "empty":
+                self._remove(current.get("id"))
+            case "init":
+                # new workspaces are empty, their output is in the old tree
+                output = next(
+                    (
+                        c
+                        for c in self._cons.values()
+                        if c.get("type") == "output" and c.get("name") == current.get("output")
+                    ),
+                    None,
+                )
+                content = next(
+                    (
+                        c
+                        for c in (output or {}).get("nodes", [])
+                        if c.get("type") == "con"
+                    ),
+                    None,
+                )
+                if content is None:
+                    return False
+                content.setdefault("nodes", []).append(current)
+                self._index(current, content["id"], None)
+            case "urgent" | "reload" | "restored" | "rename" | "move":
+                return False
+        return True
+
+
+class I3Service(Service):
+    """
+    The one i3 IPC client of the shell.
+
+    Rides on fabric's shared connection, whose event socket is read on the
+    GLib main loop, so fabric's own i3 widgets and the rest of the shell use
+    the same socket and no thread. Raw events are parsed once into typed
+    events and only handed to subscribers that asked for that change.
+    Workspaces, outputs and the layout tree are cached and patched from
+    events.
+    """
+
+    _instance = None
+
+    @Signal
+    def workspaces_changed(self) -> None: ...
+
+    @Signal
+    def outputs_changed(self) -> None: ...
+
+    @Signal
+    def tree_changed(self) -> None: ...
+
+    @Signal
+    def command_failed(self, command: str, error: str) -> None: ...
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        super().__init__()
+
+        self.connection = get_i3_connection()
+        # (event type, change or None) -> callbacks
+        self._subscribers: dict[tuple[str, str | None], list[Callable]] = {}
+
+        self._workspaces: dict[str, dict] = {}  # by name
+        self._outputs: list[dict] = []
+        self.tree = I3Tree()
+        self._tree_refetch_id: int | None = None
+        self._queued: list[tuple[tuple[str, ...], Callable | None]] = []
+        self._run_id: int | None = None
+
+        self.connection.connect("event", self._on_event)
+        self._fetch_workspaces()
+        self._fetch_outputs()
+        self._fetch_tree()
+
+    # --- subscriptions ---
+
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callable[[object], None],
+        changes: Iterable[str] | None = None,
+    ) -> Callable[[], None]:
+        """
+        Call `callback(event)` for `event_type` ("workspace", "window",
+        "output" or "shutdown"), optionally only for the given `changes`.
+        Returns a function that undoes the subscription.
+        """
+        keys = [(event_type, c) for c in changes] if changes else [(event_type, None)]
+        for key in keys:
+            self._subscribers.setdefault(key, []).append(callback)
+
+        def unsubscribe():
+            for key in keys:
+                if callback in self._subscribers.get(key, []):
+                    self._subscribers[key].remove(callback)
+
+        return unsubscribe
+
+    def _on_event(self, _, raw_event):
+        event_type = raw_event.name.split("::", 1)[0]
+        parse = _EVENT_TYPES.get(event_type)
+        if parse is None:
+            return
+
+        data = raw_event.data if isinstance(raw_event.data, dict) else {}
+        event = parse(data)
+
+        if event_type == "workspace":
+            self._apply_workspace_event(event)
+            self._apply_tree_event(self.tree.apply_workspace_event(event))
+        elif event_type == "window":
+            self._apply_tree_event(self.tree.apply_window_event(event))
+        elif event_type == "output":
+            self._fetch_outputs()
+            self._schedule_tree_refetch()
+
+        for key in ((event_type, event.change), (event_type, None)):
+            for callback in self._subscribers.get(key, ())[:]:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.exception(f"[i3] {event_type} subscriber failed: {e}")
+
+    # --- cached state ---
+
+    def get_workspaces(self) -> list[dict]:
+        return list(self._workspaces.values())
+
+    def get_focused_workspace(self) -> dict | None:
+        return next((w for w in self._workspaces.values() if w.get("focused")), None)
+
+    def get_outputs(self, active_only: bool = True) -> list[dict]:
+        return [
+            o
+            for o in self._outputs
+            if not active_only
+            or (o.get("active") and not o["name"].startswith("xroot"))
+        ]
+
+    def _apply_workspace_event(self, event: WorkspaceEvent):
+        current = event.current or {}
+        name = current.get("name")
+
+        match event.change:
+            case "focus":
+                for ws in self._workspaces.values():
+                    ws["focused"] = ws.get("name") == name
+                if name in self._workspaces:
+                    self._workspaces[name]["urgent"] = current.get("urgent", False)
+            case "init" if name:
+                self._workspaces[name] = self._as_workspace(current)
+            case "empty" if name:
+                self._workspaces.pop(name, None)
+            case "urgent" if name in self._workspaces:
+                self._workspaces[name]["urgent"] = current.get("urgent", False)
+            case "rename" | "move" | "reload" | "restored":
+                # rare, just ask again
+                self._fetch_workspaces()
+                return
+            case _:
+                return
+
+        self.workspaces_changed()
+
+    @staticmethod
+    def _as_workspace(con: dict) -> dict:
+        # workspace events carry the con, GET_WORKSPACES uses a smaller shape
+        return {
+            "id": con.get("id"),
+            "num": con.get("num", -1),
+            "name": con.get("name"),
+            "focused": con.get("focused", False),
+            "urgent": con.get("urgent", False),
+            "output": con.get("output"),
+            "rect": con.get("rect"),
+        }
+
+    def _fetch_workspaces(self):
+        reply = self.send_query(I3MessageType.GET_WORKSPACES)
+        if reply is None:
+            return
+        self._workspaces = {ws["name"]: ws for ws in reply}
+        self.workspaces_changed()
+
+    def _fetch_outputs(self):
+        reply = self.send_query(I3MessageType.GET_OUTPUTS)
+        if reply is None:
+            return
+        self._outputs = reply
+        self.outputs_changed()
+
+    def _apply_tree_event(self, patched: bool):
+        if patched:
+            self.tree_changed()
+        else:
+            self._schedule_tree_refetch()
+
+    def _schedule_tree_refetch(self):
+        if self._tree_refetch_id is None:
+            self._tree_refetch_id = GLib.timeout_add(
+                TREE_REFETCH_DELAY, self._fetch_tree
+            )
+
+    def _fetch_tree(self) -> bool:
+        self._tree_refetch_id = None
+        reply = self.send_query(I3MessageType.GET_TREE)
+        if reply is not None:
+            self.tree.load(reply)
+            self.tree_changed()
+        return False
+
+    # --- requests ---
+
+    def send_query(self, message_type: I3MessageType):
+        try:
+            return self.connection.send_command("", message_type).reply
+        except Exception as e:
+            logger.error(f"[i3] {message_type.name} failed: {e}")
+            return None
+
+    def command(self, cmd: str) -> bool:
+        try:
+            reply = self.connection.send_command(cmd).reply
+        except Exception as e:
+            logger.error(f"[i3] '{cmd}' failed: {e}")
+            return False
+
+        success = all(r.get("success", False) for r in reply if isinstance(r, dict))
+        if not success:
+            logger.error(f"[i3] '{cmd}' failed: {reply}")
+        return success
+
+    def run(self, *commands: str, callback: Callable[[bool], None] | None = None):
+        """
+        Queue `commands` for the next main loop iteration. Commands queued
+        back to back go out as a single message; `callback(success)` gets the
+        outcome of its own commands only, and failures are also reported
+        through `command-failed`.
+        """
+        self._queued.append((commands, callback))
+        if self._run_id is None:
+            self._run_id = GLib.idle_add(self._run_queued)
+
+    def _run_queued(self) -> bool:
+        self._run_id = None
+        batch, self._queued = self._queued, []
+        payload = "; ".join(cmd for commands, _ in batch for cmd in commands)
+        try:
+            reply = self.connection.send_command(payload).reply
+        except Exception as e:
+            for commands, callback in batch:
+                self._finish_commands(commands, callback, [str(e)])
+            return False
+
+        results = [r for r in reply or [] if isinstance(r, dict)]
+        if len(results) != sum(len(commands) for commands, _ in batch):
+            # a command with its own `;` answers more than once, can't split
+            errors = self._errors(results) or ([] if results else ["no reply"])
+            for commands, callback in batch:
+                self._finish_commands(commands, callback, errors)
+            return False
+
+        # i3 answers each `;`-separated command in order
+        for commands, callback in batch:
+            own, results = results[: len(commands)], results[len(commands) :]
+            self._finish_commands(commands, callback, self._errors(own))
+        return False
+
+    @staticmethod
+    def _errors(results: list[dict]) -> list[str]:
+        return [
+            r.get("error", "unknown error")
+            for r in results
+            if not r.get("success", False)
+        ]
+
+    def _finish_commands(
+        self, commands: tuple[str, ...], callback: Callable | None, errors: list[str]
+    ):
+        if errors:
+            cmd, error = "; ".join(commands), "; ".join(errors)
+            logger.error(f"[i3] '{cmd}' failed: {error}")
+            self.command_failed(cmd, error)
+        if callback is not None:
+            try:
+                callback(not errors)
+            except Exception as e:
+                logger.exception(f"[i3] command callback failed: {e}")
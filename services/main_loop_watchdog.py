@@ -0,0 +1,248 @@
+import os
+import sys
+import json
+import time
+import threading
+from collections import deque
+from loguru import logger
+
+from config.info import CACHE_DIR, ROOT_DIR
+
+from gi.repository import GLib
+
+THRESHOLD_MS = 50  # an iteration longer than this is a stall
+SAMPLE_INTERVAL = 0.01  # s
+MAX_STACK = 40  # frames kept per sampled stack
+MAX_RECENT = 50
+REPORT_FILE = os.path.join(CACHE_DIR, "main-loop-stalls.json")
+
+_ROOT = str(ROOT_DIR)
+
+Stack = tuple[tuple[str, int, str], ...]  # (file, line, function), outermost first
+
+
+def stack_above(frame, base) -> Stack:
+    """The frames between `base` and `frame`, outermost first."""
+    frames = []
+    while frame is not None and frame is not base and len(frames) < MAX_STACK:
+        code = frame.f_code
+        frames.append((code.co_filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back
+    frames.reverse()
+    return tuple(frames)
+
+
+def entry_frame(frame, base):
+    """The frame the main loop dispatched into, or None while it's idle."""
+    entry = None
+    while frame is not None and frame is not base:
+        entry = frame
+        frame = frame.f_back
+    return entry
+
+
+def call_site(stack: Stack) -> str:
+    """`file:line in function` of the innermost shell frame in `stack`."""
+    # the innermost shell frame is what to fix, even if it blocks in a library
+    for filename, line, function in reversed(stack):
+        if filename.startswith(_ROOT):
+            return f"{os.path.relpath(filename, _ROOT)}:{line} in {function}"
+    filename, line, function = stack[-1]
+    return f"{filename}:{line} in {function}"
+
+
+def _format(stack: Stack) -> list[str]:
+    return [
+        f"{os.path.relpath(f, _ROOT) if f.startswith(_ROOT) else f}:{line} in {fn}"
+        for f, line, fn in stack
+    ]
+
+
+class _Site:
+    __slots__ = ("samples", "stalls", "worst_ms", "stack")
+
+    def __init__(self, stack: Stack):
+        self.samples = 0
+        self.stalls = 0
+        self.worst_ms = 0.0
+        self.stack = stack  # first one seen, as an example
+
+
+class MainLoopWatchdog:
+    """
+    Samples the main thread's Python stack while the GTK main loop is stuck.
+
+    A daemon thread peeks at the main thread every `SAMPLE_INTERVAL`. Once a
+    single dispatch (a callback, signal handler or draw) has run longer than
+    the threshold, each sample's innermost shell frame is charged with the
+    interval - a sampling profiler that only looks at stalls. `report()`
+    ranks those call sites, `dump()` writes it as JSON, e.g.
+    `fabric-cli exec zenith "watchdog.dump()"`.
+
+    Work GTK does in C without calling back into Python looks idle here.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self.threshold_ms = THRESHOLD_MS
+        self.started_at: float | None = None
+
+        self._lock = threading.Lock()
+        self._sites: dict[str, _Site] = {}
+        self._recent: deque[dict] = deque(maxlen=MAX_RECENT)
+        self._stall_count = 0
+        self._stalled_ms = 0.0
+
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._main_id = threading.main_thread().ident
+        self._base = None  # main thread's top frame while the loop is idle
+
+        # current dispatch, touched by the watchdog thread only
+        self._entry = None
+        self._since = 0.0
+        self._samples: list[Stack] = []
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, threshold_ms: float = THRESHOLD_MS) -> None:
+        if self.running:
+            return
+        self.threshold_ms = threshold_ms
+        self.started_at = time.time()
+
+        # a raw source, so nothing sits between the loop and the callback
+        source = GLib.Idle()
+        source.set_callback(self._mark_base)
+        source.attach(None)
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="main-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[Watchdog] Watching for main loop stalls > {threshold_ms} ms")
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._entry = None
+        self._samples = []
+
+    def _mark_base(self, *_) -> bool:
+        self._base = sys._getframe().f_back
+        return False
+
+    # --- sampling (watchdog thread) ---
+
+    def _run(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            base = self._base
+            if base is None:
+                continue  # main loop not running yet
+
+            frame = sys._current_frames().get(self._main_id)
+            now = time.monotonic()
+            entry = entry_frame(frame, base)
+
+            if entry is not self._entry:
+                self._finish_dispatch(now)
+                self._entry = entry
+                self._since = now
+            elif entry is not None and (now - self._since) * 1000 >= self.threshold_ms:
+                self._samples.append(stack_above(frame, base))
+            del frame, entry
+
+    def _finish_dispatch(self, now: float):
+        samples, self._samples = self._samples, []
+        if not samples:
+            return
+
+        duration = (now - self._since) * 1000
+        sample_ms = SAMPLE_INTERVAL * 1000
+        hits: dict[str, int] = {}
+
+        with self._lock:
+            for stack in samples:
+                site_name = call_site(stack)
+                site = self._sites.get(site_name)
+                if site is None:
+                    site = self._sites[site_name] = _Site(stack)
+                site.samples += 1
+                hits[site_name] = hits.get(site_name, 0) + 1
+
+            for site_name in hits:
+                site = self._sites[site_name]
+                site.stalls += 1
+                site.worst_ms = max(site.worst_ms, duration)
+
+            worst = max(hits, key=hits.get)
+            self._stall_count += 1
+            self._stalled_ms += duration
+            self._recent.append(
+                {
+                    "time": round(time.time(), 3),
+                    "ms": round(duration, 1),
+                    "site": worst,
+                    "sampled_ms": round(hits[worst] * sample_ms, 1),
+                }
+            )
+
+        logger.warning(f"[Watchdog] Main loop blocked for {duration:.0f} ms in {worst}")
+
+    # --- reporting ---
+
+    def report(self, top: int = 20) -> dict:
+        sample_ms = SAMPLE_INTERVAL * 1000
+        with self._lock:
+            ranked = sorted(
+                self._sites.items(), key=lambda item: item[1].samples, reverse=True
+            )
+            sites = [
+                {
+                    "site": name,
+                    "sampled_ms": round(site.samples * sample_ms, 1),
+                    "samples": site.samples,
+                    "stalls": site.stalls,
+                    "max_stall_ms": round(site.worst_ms, 1),
+                    "stack": _format(site.stack),
+                }
+                for name, site in ranked[:top]
+            ]
+            return {
+                "started_at": self.started_at,
+                "threshold_ms": self.threshold_ms,
+                "sample_interval_ms": sample_ms,
+                "stalls": self._stall_count,
+                "stalled_ms": round(self._stalled_ms, 1),
+                "sites": sites,
+                "recent": list(self._recent),
+            }
+
+    def dump(self, path: str = REPORT_FILE) -> str:
+        """Write `report()` as JSON to `path` and return the path."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        logger.info(f"[Watchdog] Report written to {path}")
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sites.clear()
+            self._recent.clear()
+            self._stall_count = 0
+            self._stalled_ms = 0.0
+        self.started_at = time.time()
@@ -15,6 +15,7 @@ except ValueError:
 
 class NetworkConstants:
     SCAN_DEBOUNCE_MS = 500
+    STRENGTH_UPDATE_MS = 500
     CLEANUP_DELAY_MS = 500
     CONNECTION_TIMEOUT_SECONDS = 30
     MAX_SSID_LENGTH = 32
@@ -52,18 +52,41 @@ class NetworkInfo:
             "last_seen": self.last_seen,
         }
 
+    def same_as(self, other: "NetworkInfo") -> bool:
+        """Equal for display purposes; last_seen ticks on every scan."""
+        return self._display_key() == other._display_key()
+
+    def strength_only_change(self, other: "NetworkInfo") -> bool:
+        return self._display_key()[1:] == other._display_key()[1:]
+
+    def _display_key(self) -> tuple:
+        return (
+            self.strength,
+            self.bssid,
+            self.active,
+            self.frequency,
+            self.flags,
+            self.wpa_flags,
+            self.rsn_flags,
+        )
+
 
 class NetworkInfoFactory:
     @staticmethod
     def from_access_point(
-        ap: NM.AccessPoint, active_ssid: Optional[str] = None
+        ap: NM.AccessPoint,
+        active_ssid: Optional[str] = None,
+        ssid: Optional[str] = None,
     ) -> Optional[NetworkInfo]:
         """Create NetworkInfo from NM.AccessPoint"""
         try:
-            if not ap or not ap.get_ssid():
+            if not ap:
                 return None
 
-            ssid = NM.utils_ssid_to_utf8(ap.get_ssid().get_data())
+            if ssid is None:
+                if not ap.get_ssid():
+                    return None
+                ssid = NM.utils_ssid_to_utf8(ap.get_ssid().get_data())
             strength = ap.get_strength()
 
             return NetworkInfo(
@@ -107,25 +130,60 @@ class PendingConnection:
     timestamp: int
 
 
+@dataclass
+class NetworkDelta:
+    added: list[NetworkInfo]
+    removed: list[str]  # ssids
+    updated: list[NetworkInfo]
+    strength_updated: list[NetworkInfo]
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added or self.removed or self.updated or self.strength_updated
+        )
+
+
 class AccessPointManager:
+    """Keyed model of visible networks, one entry per SSID (strongest BSSID)."""
+
     def __init__(self):
         self.ap_list: list[NM.AccessPoint] = []
+        self.networks: dict[str, NetworkInfo] = {}
+        # AP object path -> decoded SSID; an AP's SSID never changes
+        self._ssids: dict[str, Optional[str]] = {}
 
-    def update(self, new_list: list[NM.AccessPoint]) -> None:
+    def get_ssid(self, ap: NM.AccessPoint) -> Optional[str]:
+        path = ap.get_path()
+        if path in self._ssids:
+            return self._ssids[path]
+
+        ssid = None
+        try:
+            if ap.get_ssid():
+                ssid = NM.utils_ssid_to_utf8(ap.get_ssid().get_data())
+        except Exception as e:
+            logger.debug(f"Error decoding SSID: {e}")
+        self._ssids[path] = ssid
+        return ssid
+
+    def update(
+        self, new_list: list[NM.AccessPoint], active_ssid: Optional[str] = None
+    ) -> NetworkDelta:
         self.ap_list = new_list
 
-    def get_unique_networks(
-        self, active_ssid: Optional[str] = None
-    ) -> list[NetworkInfo]:
         # deduplicate by SSID
         ap_dict: dict[str, NM.AccessPoint] = {}
+        live_paths = set()
 
         for ap in self.ap_list:
             try:
-                if not ap or not ap.get_ssid():
+                if not ap:
                     continue
+                live_paths.add(ap.get_path())
 
-                ssid = NM.utils_ssid_to_utf8(ap.get_ssid().get_data())
+                ssid = self.get_ssid(ap)
+                if not ssid:
+                    continue
 
                 # keep the strongest signal for each SSID
                 if (
@@ -137,25 +195,40 @@ class AccessPointManager:
                 logger.debug(f"Error processing AP: {e}")
                 continue
 
-        # convert to NetworkInfo objects
-        networks = []
-        for ap in ap_dict.values():
-            if network := NetworkInfoFactory.from_access_point(ap, active_ssid):
-                networks.append(network)
+        for path in self._ssids.keys() - live_paths:
+            del self._ssids[path]
 
-        # sort by signal strength
-        networks.sort(key=lambda x: x.strength, reverse=True)
+        networks: dict[str, NetworkInfo] = {}
+        for ssid, ap in ap_dict.items():
+            if network := NetworkInfoFactory.from_access_point(ap, active_ssid, ssid):
+                networks[ssid] = network
+
+        delta = NetworkDelta(
+            added=[n for ssid, n in networks.items() if ssid not in self.networks],
+            removed=[ssid for ssid in self.networks if ssid not in networks],
+            updated=[],
+            strength_updated=[],
+        )
+        for ssid, network in networks.items():
+            old = self.networks.get(ssid)
+            if old is None or old.same_as(network):
+                continue
+            if old.strength_only_change(network):
+                delta.strength_updated.append(network)
+            else:
+                delta.updated.append(network)
+
+        self.networks = networks
+        return delta
 
-        return networks
+    def get_unique_networks(self) -> list[NetworkInfo]:
+        # sort by signal strength
+        return sorted(self.networks.values(), key=lambda x: x.strength, reverse=True)
 
     def find_by_ssid(self, ssid: str) -> Optional[NM.AccessPoint]:
         for ap in self.ap_list:
             try:
-                if not ap or not ap.get_ssid():
-                    continue
-
-                ap_ssid = NM.utils_ssid_to_utf8(ap.get_ssid().get_data())
-                if ap_ssid == ssid:
+                if ap and self.get_ssid(ap) == ssid:
                     return ap
             except Exception as e:
                 logger.debug(f"Error checking AP SSID: {e}")
@@ -444,6 +517,16 @@ class WifiDevice(NetworkDevice):
         """Emitted when access points list changes"""
         ...
 
+    @Signal
+    def networks_changed(
+        self, added: object, removed: object, updated: object
+    ) -> None:
+        """
+        Keyed deltas of the network list: dicts for added/updated networks,
+        SSIDs for removed ones. Strength-only changes are batched.
+        """
+        ...
+
     @Signal
     def connection_result(
         self, ssid: str, result: object, message: str = ""
@@ -458,6 +541,8 @@ class WifiDevice(NetworkDevice):
         self.client = client
 
         self.ap_manager = AccessPointManager()
+        self._pending_strength: set[str] = set()
+        self._strength_flush_id: Optional[int] = None
         self.connection_state = ConnectionStateMachine(self)
         self.profile_manager = ConnectionProfileManager(self.client)
         self.scan_manager = ScanManager(device, on_complete=self._on_scan_complete)
@@ -489,10 +574,7 @@ class WifiDevice(NetworkDevice):
             logger.warning("Cannot get WiFi list: no device")
             return []
 
-        active_ap = self.device.get_active_access_point()
-        active_ssid = self._extract_ssid_from_ap(active_ap)
-
-        networks = self.ap_manager.get_unique_networks(active_ssid)
+        networks = self.ap_manager.get_unique_networks()
         return [network.to_dict() for network in networks]
 
     def get_access_points(self) -> list[NM.AccessPoint]:
@@ -781,11 +863,46 @@ class WifiDevice(NetworkDevice):
 
         try:
             aps = self.get_access_points()
-            self.ap_manager.update(aps)
+            active_ssid = self._extract_ssid_from_ap(self.get_active_access_point())
+            delta = self.ap_manager.update(aps, active_ssid)
+            self._emit_delta(delta)
             self.ap_change()
         except Exception as e:
             logger.error(f"Error updating AP list: {e}")
 
+    def _emit_delta(self, delta: NetworkDelta) -> None:
+        if not delta:
+            return
+
+        # structural changes go out now and supersede queued strength updates
+        for network in delta.added + delta.updated:
+            self._pending_strength.discard(network.ssid)
+        self._pending_strength.difference_update(delta.removed)
+
+        if delta.added or delta.removed or delta.updated:
+            self.networks_changed(
+                [n.to_dict() for n in delta.added],
+                delta.removed,
+                [n.to_dict() for n in delta.updated],
+            )
+
+        self._pending_strength.update(n.ssid for n in delta.strength_updated)
+        if self._pending_strength and self._strength_flush_id is None:
+            self._strength_flush_id = GLib.timeout_add(
+                NetworkConstants.STRENGTH_UPDATE_MS, self._flush_strength_updates
+            )
+
+    def _flush_strength_updates(self) -> bool:
+        self._strength_flush_id = None
+        networks = self.ap_manager.networks
+        updated = [
+            networks[ssid].to_dict() for ssid in self._pending_strength if ssid in networks
+        ]
+        self._pending_strength.clear()
+        if updated:
+            self.networks_changed([], [], updated)
+        return False
+
     @staticmethod
     def _extract_ssid_from_ap(ap: Optional[NM.AccessPoint]) -> Optional[str]:
         if not ap or not ap.get_ssid():
@@ -6,9 +6,9 @@ import urllib.parse
 import urllib.request
 from pathlib import Path
 from loguru import logger
+from dataclasses import dataclass, replace
 from PIL import Image, ImageFilter, ImageOps
 
-from fabric import Fabricator
 from fabric.core.service import Service, Signal, Property
 
 from config.config import config
@@ -19,31 +19,67 @@ import gi
 gi.require_version("Playerctl", "2.0")
 from gi.repository import Playerctl, GLib, Gio
 
-
-def check_shuffle_strictly(bus_name):
-    # setup D-Bus proxy
-    connection = Gio.bus_get_sync(Gio.BusType.SESSION, None)
-
-    # We call 'Get' on the standard Properties interface
-    # Param 1: interface name ('org.mpris.MediaPlayer2.Player')
-    # Param 2: property name ('Shuffle')
-    params = GLib.Variant("(ss)", ("org.mpris.MediaPlayer2.Player", "Shuffle"))
-
-    try:
-        connection.call_sync(
-            bus_name,
-            "/org/mpris/MediaPlayer2",
-            "org.freedesktop.DBus.Properties",
-            "Get",
-            params,
-            None,
-            Gio.DBusCallFlags.NONE,
-            -1,
-            None,
-        )
-        return True
-    except Exception:
-        return False
+MPRIS_BUS_PREFIX = "org.mpris.MediaPlayer2."
+MPRIS_OBJECT_PATH = "/org/mpris/MediaPlayer2"
+MPRIS_PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
+
+
+def _now() -> float:
+    # same clock as Gdk.FrameClock.get_frame_time, in seconds
+    return GLib.get_monotonic_time() / 1_000_000
+
+
+@dataclass(frozen=True)
+class TrackClock:
+    """
+    Where the track was at `anchor` and how fast it is moving. MPRIS only
+    reports discrete positions; everything in between is extrapolated locally
+    so per-frame consumers never touch D-Bus.
+    """
+
+    position: float = 0.0  # seconds, at anchor
+    length: float = 0.0  # seconds, 0 if unknown
+    rate: float = 1.0
+    playing: bool = False
+    anchor: float = 0.0  # monotonic seconds
+
+    def position_at(self, now: float) -> float:
+        if not self.playing:
+            return self.position
+        pos = self.position + (now - self.anchor) * self.rate
+        if self.length > 0:
+            pos = min(pos, self.length)
+        return max(0.0, pos)
+
+    def fraction_at(self, now: float) -> float:
+        if self.length <= 0:
+            return 0.0
+        return self.position_at(now) / self.length
+
+
+@dataclass(frozen=True)
+class PlayerSnapshot:
+    """
+    Immutable view of a player's metadata and capabilities. Rebuilt by the
+    service on bus events; widgets read it instead of querying D-Bus.
+    """
+
+    player_name: str = ""
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+    art_url: str = ""
+    track_id: str | None = None
+    length: float = 0.0  # seconds
+    playing: bool = False
+    shuffle: bool = False
+    can_go_next: bool = False
+    can_go_previous: bool = False
+    can_play: bool = False
+    can_pause: bool = False
+    can_seek: bool = False
+    can_control: bool = False
+    can_shuffle: bool = False
 
 
 class PlayerService(Service):
@@ -51,7 +87,7 @@ class PlayerService(Service):
     def shuffle_toggle(self, player: Playerctl.Player, status: bool) -> None: ...
 
     @Signal
-    def meta_change(self, metadata: GLib.Variant, player: Playerctl.Player) -> None: ...
+    def snapshot_changed(self, snapshot: object) -> None: ...
 
     @Signal
     def artwork_change(self, local_path: str, blurred_local_path: str) -> None: ...
@@ -70,31 +106,31 @@ class PlayerService(Service):
 
     @Property(bool, "readable", default_value=False)
     def can_go_previous(self) -> bool:
-        return self._player.get_property("can_go_previous")
+        return self._snapshot.can_go_previous
 
     @Property(bool, "readable", default_value=False)
     def can_go_next(self) -> bool:
-        return self._player.get_property("can_go_next")
+        return self._snapshot.can_go_next
 
     @Property(bool, "readable", default_value=False)
     def can_pause(self) -> bool:
-        return self._player.get_property("can_pause")
+        return self._snapshot.can_pause
 
     @Property(bool, "readable", default_value=False)
     def can_play(self) -> bool:
-        return self._player.get_property("can_play")
+        return self._snapshot.can_play
 
     @Property(bool, "readable", default_value=False)
     def can_seek(self) -> bool:
-        return self._player.get_property("can_seek")
+        return self._snapshot.can_seek
 
     @Property(bool, "readable", default_value=False)
     def can_control(self) -> bool:
-        return self._player.get_property("can_control")
+        return self._snapshot.can_control
 
     @Property(bool, "readable", default_value=False)
     def can_shuffle(self) -> bool:
-        return check_shuffle_strictly(self._player.get_property("player_instance"))
+        return self._snapshot.can_shuffle
 
     def __init__(self, player: Playerctl.Player, **kwargs):
         super().__init__(**kwargs)
@@ -106,6 +142,15 @@ class PlayerService(Service):
         self._theme_cache = {}
         self._is_cleaning_up = False
         self._signal_ids = []  # track signal connection IDs
+        self._bus = None
+        self._properties_subscription = None
+        self._track_id = None
+        # Shuffle is optional in MPRIS, only known once GetAll answers
+        self._has_shuffle = False
+
+        self.status = self._player.props.playback_status
+        self._clock = TrackClock(playing=self._is_playing(), anchor=_now())
+        self._snapshot = PlayerSnapshot(player_name=player.props.player_name)
 
         if player.props.player_name in config.ALLOWED_PLAYERS:
             # store signal IDs for proper disconnection
@@ -121,28 +166,162 @@ class PlayerService(Service):
             logger.info(
                 f"Connected {len(self._signal_ids)} signals for {player.props.player_name}"
             )
-
-        self.status = self._player.props.playback_status
-        self.pos_fabricator = Fabricator(
-            interval=1000,  # 1s
-            poll_from=lambda f, *_: self.get_position(),
-            on_changed=lambda f, *_: self.fabricating(),
-        )
-        self.poll_progress()
+            # playerctl doesn't expose Rate, listen for it on the bus directly
+            self._subscribe_properties()
 
         try:
             metadata = self._player.props.metadata
             if metadata:
-                self.meta_change(metadata, self._player)
+                self._update_track(metadata, metadata.keys())
                 self._handle_artwork(metadata, metadata.keys())
+            self._refresh_snapshot(metadata)
         except Exception as e:
             logger.warning(f"Failed to initialize metadata: {e}")
 
+        self._resync_position()
+
+    def _is_playing(self) -> bool:
+        return self.status.value_name == "PLAYERCTL_PLAYBACK_STATUS_PLAYING"
+
+    def _subscribe_properties(self):
+        bus_name = MPRIS_BUS_PREFIX + self._player.props.player_instance
+        try:
+            self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        except GLib.Error as e:
+            logger.warning(f"Could not reach session bus: {e}")
+            return
+
+        self._properties_subscription = self._bus.signal_subscribe(
+            bus_name,
+            "org.freedesktop.DBus.Properties",
+            "PropertiesChanged",
+            MPRIS_OBJECT_PATH,
+            None,
+            Gio.DBusSignalFlags.NONE,
+            self._on_properties_changed,
+        )
+
+        # initial Rate/Shuffle, without blocking on a slow player
+        self._bus.call(
+            bus_name,
+            MPRIS_OBJECT_PATH,
+            "org.freedesktop.DBus.Properties",
+            "GetAll",
+            GLib.Variant("(s)", (MPRIS_PLAYER_IFACE,)),
+            GLib.VariantType("(a{sv})"),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            self._on_properties_fetched,
+        )
+
+    def _on_properties_fetched(self, bus, result):
+        try:
+            (props,) = bus.call_finish(result).unpack()
+        except GLib.Error as e:
+            logger.warning(f"Could not fetch player properties: {e}")
+            return
+        self._apply_properties(props)
+
+    def _on_properties_changed(
+        self, connection, sender, path, iface, signal, params
+    ):
+        interface, changed, _ = params.unpack()
+        if interface == MPRIS_PLAYER_IFACE:
+            self._apply_properties(changed)
+
+    def _apply_properties(self, props: dict):
+        if self._is_cleaning_up:
+            return
+        if "Rate" in props:
+            self._set_rate(props["Rate"])
+        if "Shuffle" in props:
+            self._has_shuffle = True
+        # Can* and Shuffle are also mirrored by playerctl's proxy cache
+        self._refresh_snapshot()
+
+    def _refresh_snapshot(self, metadata=None):
+        """Rebuild the snapshot from cached proxy state. Never hits the bus."""
+        player = self._player
+        if metadata is None:
+            metadata = player.props.metadata
+        keys = metadata.keys() if metadata else []
+
+        def meta(key, default):
+            return metadata[key] if key in keys else default
+
+        artists = meta("xesam:artist", [])
+        snapshot = PlayerSnapshot(
+            player_name=player.props.player_name,
+            title=meta("xesam:title", ""),
+            artist=artists[0] if artists else "",
+            album=meta("xesam:album", ""),
+            art_url=meta("mpris:artUrl", ""),
+            track_id=meta("mpris:trackid", None),
+            length=meta("mpris:length", 0) / 1_000_000,
+            playing=self._is_playing(),
+            shuffle=player.props.shuffle,
+            can_go_next=player.props.can_go_next,
+            can_go_previous=player.props.can_go_previous,
+            can_play=player.props.can_play,
+            can_pause=player.props.can_pause,
+            can_seek=player.props.can_seek,
+            can_control=player.props.can_control,
+            can_shuffle=self._has_shuffle,
+        )
+        if snapshot != self._snapshot:
+            self._snapshot = snapshot
+            self.snapshot_changed(snapshot)
+
+    def _set_rate(self, rate: float):
+        if self._is_cleaning_up or rate == self._clock.rate:
+            return
+        now = _now()
+        self._clock = replace(
+            self._clock, position=self._clock.position_at(now), rate=rate, anchor=now
+        )
+        self._emit_track_position()
+
+    def _update_track(self, metadata, keys):
+        length = metadata["mpris:length"] / 1_000_000 if "mpris:length" in keys else 0
+        track_id = metadata["mpris:trackid"] if "mpris:trackid" in keys else None
+
+        track_changed = track_id != self._track_id
+        self._track_id = track_id
+        if length != self._clock.length:
+            self._clock = replace(self._clock, length=length)
+            if not track_changed:
+                self._emit_track_position()
+
+        # not every player sends Seeked when a new track starts
+        if track_changed:
+            self._resync_position()
+
+    def _resync_position(self):
+        """Re-anchor the local clock from MPRIS. Only called on discrete events."""
+        if self._is_cleaning_up:
+            return
+        try:
+            position = self._player.get_position() / 1_000_000
+        except Exception as e:
+            logger.warning(f"Could not get position: {e}")
+            position = self._clock.position_at(_now())
+        self._anchor(position)
+
+    def _anchor(self, position: float):
+        self._clock = replace(
+            self._clock, position=position, playing=self._is_playing(), anchor=_now()
+        )
+        self._emit_track_position()
+
+    def _emit_track_position(self):
+        self.track_position(self._clock.position, self._clock.length)
+
     def on_seeked(self, player, position):
         if self._is_cleaning_up:
             return
-        if self.status.value_name == "PLAYERCTL_PLAYBACK_STATUS_PLAYING":
-            self.pos_fabricator.start()
+        # the signal carries the new position, no need to ask
+        self._anchor(position / 1_000_000)
 
     def get_artwork(self) -> str:
         return self._current_artwork_path
@@ -153,56 +332,37 @@ class PlayerService(Service):
     def get_theme(self):
         return self._current_theme
 
-    def get_position(self):
-        if self._is_cleaning_up:
-            return 0
-        try:
-            position = self._player.get_position()
-        except Exception as e:
-            logger.warning(f"Could not get position: {e}")
-            position = 0
-        return position
+    def get_track_clock(self) -> TrackClock:
+        return self._clock
+
+    def get_snapshot(self) -> PlayerSnapshot:
+        return self._snapshot
+
+    def get_position(self) -> float:
+        """Extrapolated position in seconds (no D-Bus round trip)."""
+        return self._clock.position_at(_now())
 
     def set_position(self, pos: float):
         if self._is_cleaning_up:
             return
         logger.debug("Seeking in the service")
-        self.pos_fabricator.stop()
         micro_pos = int(pos * 1_000_000)
         try:
             self._player.set_position(micro_pos)
             logger.debug(f"Set position to {micro_pos}")
         except GLib.Error as e:
             logger.error(f"Failed to seek: {e}")
-
-    def poll_progress(self):
-        if self._is_cleaning_up:
             return
-        if self.status.value_name == "PLAYERCTL_PLAYBACK_STATUS_PLAYING":
-            self.pos_fabricator.start()
-        else:
-            self.pos_fabricator.stop()
-
-    def fabricating(self):
-        if self._is_cleaning_up:
-            return
-        try:
-            pos = self._player.get_position() / 1_000_000  # seconds
-            keys = self._player.props.metadata.keys()
-            if "mpris:length" in keys:
-                dur = self._player.props.metadata["mpris:length"] / 1_000_000  # seconds
-            else:
-                dur = 0
-            self.track_position(pos, dur)
-        except GLib.Error as e:
-            logger.warning(f"Failed to get position in fabricating: {e}")
+        # optimistic, corrected by the following Seeked
+        self._anchor(pos)
 
     def on_play(self, player, status):
         if self._is_cleaning_up:
             return
         logger.debug(f"Player is playing: {player.props.player_name}")
         self.status = player.props.playback_status
-        self.poll_progress()
+        self._resync_position()
+        self._refresh_snapshot()
         self.play()
 
     def on_pause(self, player, status):
@@ -210,13 +370,16 @@ class PlayerService(Service):
             return
         logger.debug(f"Player is paused: {player.props.player_name}")
         self.status = player.props.playback_status
-        self.poll_progress()
+        self._resync_position()
+        self._refresh_snapshot()
         self.pause()
 
     def on_shuffle(self, player, status):
         if self._is_cleaning_up:
             return
         logger.debug(f"Shuffle status changed for: {player.props.player_name}")
+        self._has_shuffle = True
+        self._refresh_snapshot()
         self.shuffle_toggle(player, status)
 
     def on_metadata(self, player, metadata):
@@ -225,7 +388,8 @@ class PlayerService(Service):
         keys = metadata.keys()
         if "xesam:artist" in keys and "xesam:title" in keys:
             logger.info(f"{metadata['xesam:artist'][0]} - {metadata['xesam:title']}")
-        self.meta_change(metadata, player)
+        self._update_track(metadata, keys)
+        self._refresh_snapshot(metadata)
         self._handle_artwork(metadata, keys)
 
     def _handle_artwork(self, metadata, keys):
@@ -397,13 +561,9 @@ class PlayerService(Service):
         self._is_cleaning_up = True
         logger.info(f"Cleaning up PlayerService for {self._player.props.player_name}")
 
-        # stop the fabricator
-        try:
-            if hasattr(self, "pos_fabricator") and self.pos_fabricator:
-                logger.debug("Stopping fabricator")
-                self.pos_fabricator.stop()
-        except Exception as e:
-            logger.error(f"Error stopping fabricator: {e}")
+        if self._properties_subscription is not None:
+            self._bus.signal_unsubscribe(self._properties_subscription)
+            self._properties_subscription = None
 
         # disconnect signals using stored IDs
         if self._signal_ids:
@@ -443,28 +603,104 @@ class PlayerManager(Service):
 
     def _init_singleton(self):
         super().__init__()
-        self._manager = Playerctl.PlayerManager()
         self._services = {}  # map player_name -> PlayerService
         self._player_objects = {}  # map player_name -> Playerctl.Player
-
-        self._manager.connect("name-appeared", self._on_name_appeared, self._manager)
-        self._manager.connect(
-            "player-vanished", self._on_player_vanished, self._manager
+        self._instances = {}  # map bus name -> player_name, allowed players only
+        self._owners = {}  # map player_name -> bus name backing its service
+        self._pending = []  # bus names waiting for a Playerctl.Player
+        self._pending_source = None
+
+        # track MPRIS names ourselves instead of Playerctl.PlayerManager, which
+        # lists and probes every name synchronously on construction
+        self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        self._bus.signal_subscribe(
+            "org.freedesktop.DBus",
+            "org.freedesktop.DBus",
+            "NameOwnerChanged",
+            "/org/freedesktop/DBus",
+            MPRIS_BUS_PREFIX.rstrip("."),
+            Gio.DBusSignalFlags.MATCH_ARG0_NAMESPACE,
+            self._on_name_owner_changed,
         )
         self.init_all_players()
         logger.info("PlayerManager initialized")
 
     def init_all_players(self):
         logger.info("Initializing all existing players")
-        for player_obj in self._manager.props.player_names:
-            name_str = player_obj.name
-            if name_str in config.ALLOWED_PLAYERS:
-                logger.info(f"Initializing existing player: {name_str}")
-                self._create_and_register_player(player_obj)
+        self._bus.call(
+            "org.freedesktop.DBus",
+            "/org/freedesktop/DBus",
+            "org.freedesktop.DBus",
+            "ListNames",
+            None,
+            GLib.VariantType("(as)"),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            self._on_names_listed,
+        )
+
+    def _on_names_listed(self, bus, result):
+        try:
+            (names,) = bus.call_finish(result).unpack()
+        except GLib.Error as e:
+            logger.error(f"Failed to list bus names: {e}")
+            return
+
+        for bus_name in names:
+            if bus_name.startswith(MPRIS_BUS_PREFIX):
+                self._on_name_appeared(bus_name)
+
+    def _on_name_owner_changed(self, connection, sender, path, iface, signal, params):
+        bus_name, old_owner, new_owner = params.unpack()
+        if new_owner and not old_owner:
+            self._on_name_appeared(bus_name)
+        elif old_owner and not new_owner:
+            self._on_name_vanished(bus_name)
+
+    @staticmethod
+    def _player_name_of(bus_name: str) -> str:
+        # org.mpris.MediaPlayer2.firefox.instance_1_42 -> firefox
+        return bus_name[len(MPRIS_BUS_PREFIX) :].split(".", 1)[0]
+
+    def _on_name_appeared(self, bus_name: str):
+        if bus_name in self._instances:
+            return
+
+        name_str = self._player_name_of(bus_name)
+        logger.info(f"Player appeared: {name_str}")
 
-    def _create_and_register_player(self, name_obj):
+        if name_str not in config.ALLOWED_PLAYERS:
+            logger.debug(f"Player {name_str} not in allowed list")
+            return
+
+        self._instances[bus_name] = name_str
+        if name_str not in self._services:
+            self._queue_player(bus_name)
+
+    def _queue_player(self, bus_name: str):
+        # build at most one player per main loop iteration, so a burst of
+        # media sessions never stalls startup
+        if bus_name not in self._pending:
+            self._pending.append(bus_name)
+        if self._pending_source is None:
+            self._pending_source = GLib.idle_add(self._create_next_player)
+
+    def _create_next_player(self):
+        while self._pending:
+            bus_name = self._pending.pop(0)
+            if bus_name in self._instances:
+                self._create_and_register_player(bus_name)
+                break
+
+        if self._pending:
+            return True
+        self._pending_source = None
+        return False
+
+    def _create_and_register_player(self, bus_name: str):
         """Create PlayerService and register it"""
-        name_str = name_obj.name
+        name_str = self._instances[bus_name]
 
         # avoid duplicate registration
         if name_str in self._services:
@@ -472,8 +708,9 @@ class PlayerManager(Service):
             return
 
         try:
-            player = Playerctl.Player.new_from_name(name_obj)
-            self._manager.manage_player(player)
+            player = Playerctl.Player.new_for_source(
+                bus_name[len(MPRIS_BUS_PREFIX) :], Playerctl.Source.DBUS_SESSION
+            )
 
             # create service instance
             player_service = PlayerService(player)
@@ -481,6 +718,7 @@ class PlayerManager(Service):
             # store references
             self._services[name_str] = player_service
             self._player_objects[name_str] = player
+            self._owners[name_str] = bus_name
 
             logger.info(f"Registered player service for {name_str}")
             # emit signal
@@ -489,18 +727,17 @@ class PlayerManager(Service):
         except Exception as e:
             logger.error(f"Failed to create player service for {name_str}: {e}")
 
-    def _on_name_appeared(self, sender, name, manager):
-        name_str = name.name
-        logger.info(f"Player appeared: {name_str}")
-
-        if name_str in config.ALLOWED_PLAYERS:
-            self._create_and_register_player(name)
-        else:
-            logger.debug(f"Player {name_str} not in allowed list")
+    def _on_name_vanished(self, bus_name: str):
+        player_name = self._instances.pop(bus_name, None)
+        if player_name is None:
+            return
+        if bus_name in self._pending:
+            self._pending.remove(bus_name)
+        if self._owners.get(player_name) != bus_name:
+            return
 
-    def _on_player_vanished(self, sender, player, manager):
-        player_name = player.props.player_name
         logger.info(f"Player vanished: {player_name}")
+        del self._owners[player_name]
 
         # clean up the service
         if player_name in self._services:
@@ -519,6 +756,12 @@ class PlayerManager(Service):
         # emit signal
         self.player_vanish(player_name)
 
+        # hand over to another instance of the same player, if any
+        for other, name in self._instances.items():
+            if name == player_name:
+                self._queue_player(other)
+                break
+
     def get_player_service(self, player_name: str) -> PlayerService | None:
         return self._services.get(player_name)
 
@@ -535,4 +778,5 @@ class PlayerManager(Service):
 
         self._services.clear()
         self._player_objects.clear()
+        self._owners.clear()
         logger.info("All players cleaned up")
@@ -0,0 +1,84 @@
+import re
+from loguru import logger
+
+from fabric.core.service import Service, Signal
+
+from config.info import ROOT_DIR
+from utils.colors import hex_to_rgb01
+
+COLORS_CSS = f"{ROOT_DIR}/styles/colors.css"
+FALLBACK_COLOR = (1.0, 1.0, 1.0)
+
+_VARIABLE = re.compile(r"(--[\w-]+)\s*:\s*(#[0-9a-fA-F]{6})")
+
+RGB = tuple[float, float, float]
+
+
+class ThemeColors(Service):
+    """
+    The theme's CSS color variables, parsed once into RGB tuples.
+
+    Lookups are dict reads, cheap enough for draw handlers. `reload` re-reads
+    the file (hooked to the styles monitor) and emits `colors-changed` only if
+    something actually changed, so widgets redraw once per theme switch.
+    """
+
+    _instance = None
+    _initialized = False
+
+    @Signal
+    def colors_changed(self) -> None: ...
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        super().__init__()
+        self._initialized = True
+
+        self._hex: dict[str, str] = {}
+        self._rgb: dict[str, RGB] = {}
+        self._load()
+
+    def get(self, name: str, fallback: RGB = FALLBACK_COLOR) -> RGB:
+        """RGB (0-1) of the `--name` variable."""
+        return self._rgb.get(name, fallback)
+
+    def get_hex(self, name: str) -> str | None:
+        return self._hex.get(name)
+
+    def reload(self, *_) -> None:
+        if self._load():
+            self.colors_changed()
+
+    def redraw_on_change(self, widget, refresh=None) -> None:
+        """
+        Queue a redraw of `widget` on every theme change, for its lifetime.
+        `refresh(colors)` runs first, to re-cache whatever the widget keeps.
+        """
+
+        def on_change(colors):
+            if refresh is not None:
+                refresh(colors)
+            widget.queue_draw()
+
+        handler_id = self.connect("colors-changed", on_change)
+        widget.connect("destroy", lambda *_: self.disconnect(handler_id))
+
+    def _load(self) -> bool:
+        try:
+            with open(COLORS_CSS) as f:
+                colors = dict(_VARIABLE.findall(f.read()))
+        except OSError as e:
+            logger.warning(f"[Theme] Failed to read colors: {e}")
+            return False
+
+        if colors == self._hex:
+            return False
+        self._hex = colors
+        self._rgb = {name: hex_to_rgb01(value) for name, value in colors.items()}
+        return True
@@ -0,0 +1,291 @@
+from loguru import logger
+from typing import Callable
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+from gi.repository import GLib, Gtk
+
+# containers that can hide a mapped child, and what to listen to on them
+_CONTAINER_SIGNALS = (
+    (Gtk.Stack, ("notify::visible-child",)),
+    (Gtk.Revealer, ("notify::reveal-child", "notify::child-revealed")),
+)
+
+
+class _Job:
+    """Something that only runs while its widget is on screen."""
+
+    def __init__(self):
+        self.on_done: Callable[[], None] | None = None
+
+    def set_active(self, active: bool):
+        if active:
+            self.resume()
+        else:
+            self.suspend()
+
+    def resume(self): ...
+
+    def suspend(self): ...
+
+    def _finish(self):
+        self.suspend()
+        if self.on_done is not None:
+            self.on_done()
+
+
+class _Tick(_Job):
+    def __init__(self, widget: Gtk.Widget, callback: Callable):
+        super().__init__()
+        self.widget = widget
+        self.callback = callback
+        self.id: int | None = None
+
+    def _tick(self, widget, frame_clock) -> bool:
+        if self.callback(widget, frame_clock):
+            return True
+        self.id = None  # GTK drops it as we return False
+        self._finish()
+        return False
+
+    def resume(self):
+        if self.id is None:
+            self.id = self.widget.add_tick_callback(self._tick)
+
+    def suspend(self):
+        if self.id is not None:
+            self.widget.remove_tick_callback(self.id)
+            self.id = None
+
+
+class _Timeout(_Job):
+    def __init__(self, interval: int, callback: Callable[[], bool]):
+        super().__init__()
+        self.interval = interval
+        self.callback = callback
+        self.id: int | None = None
+
+    def _fire(self) -> bool:
+        if self.callback():
+            return True
+        self.id = None
+        self._finish()
+        return False
+
+    def resume(self):
+        if self.id is None:
+            self.id = GLib.timeout_add(self.interval, self._fire)
+
+    def suspend(self):
+        if self.id is not None:
+            GLib.source_remove(self.id)
+            self.id = None
+
+
+class _Subscription(_Job):
+    def __init__(self, obj, signal: str, handler: Callable):
+        super().__init__()
+        self.obj = obj
+        self.signal = signal
+        self.handler = handler
+        self.id: int | None = None
+
+    def resume(self):
+        if self.id is None:
+            self.id = self.obj.connect(self.signal, self.handler)
+
+    def suspend(self):
+        if self.id is not None:
+            self.obj.disconnect(self.id)
+            self.id = None
+
+
+class _Watch:
+    __slots__ = ("widget", "callback", "visible", "job")
+
+    def __init__(self, widget, callback, visible, job):
+        self.widget = widget
+        self.callback = callback
+        self.visible = visible
+        self.job = job
+
+
+class VisibilityTracker:
+    """
+    Tells widgets when they are actually on screen.
+
+    A widget counts as visible while it is mapped, every `Stack` above it
+    shows the page it lives in and every `Revealer` above it is open (or
+    still opening/closing). Watchers are called with the new state on every
+    change; the `add_*` helpers run tick callbacks, timers and signal
+    handlers only while their widget is visible, so a collapsed player or a
+    closed popup stops costing frames.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self._watches: dict[int, _Watch] = {}
+        self._next_handle = 1
+        # id(widget) -> (widget, signal handler ids, watch handles)
+        self._widgets: dict[int, tuple[Gtk.Widget, list[int], set[int]]] = {}
+        # id(container) -> (container, signal handler ids)
+        self._containers: dict[int, tuple[Gtk.Widget, list[int]]] = {}
+
+    @staticmethod
+    def is_visible(widget: Gtk.Widget) -> bool:
+        if not widget.get_mapped():
+            return False
+        child, parent = widget, widget.get_parent()
+        while parent is not None:
+            if isinstance(parent, Gtk.Stack):
+                if parent.get_visible_child() is not child:
+                    return False
+            elif isinstance(parent, Gtk.Revealer):
+                if not (parent.get_reveal_child() or parent.get_child_revealed()):
+                    return False
+            child, parent = parent, parent.get_parent()
+        return True
+
+    # --- watching ---
+
+    def watch(
+        self, widget: Gtk.Widget, callback: Callable[[bool], None] | None = None
+    ) -> int:
+        """
+        Call `callback(visible)` whenever `widget` shows or hides. Returns a
+        handle for `unwatch`; watches end with the widget.
+        """
+        return self._add(widget, callback, None)
+
+    def unwatch(self, handle: int | None) -> None:
+        watch = self._watches.pop(handle, None) if handle is not None else None
+        if watch is None:
+            return
+        if watch.job is not None:
+            watch.job.suspend()
+
+        entry = self._widgets.get(id(watch.widget))
+        if entry is not None:
+            entry[2].discard(handle)
+            if not entry[2]:
+                self._forget_widget(watch.widget)
+
+    def add_tick_callback(self, widget: Gtk.Widget, callback: Callable) -> int:
+        """`widget.add_tick_callback(callback)`, installed only while visible."""
+        return self._add(widget, None, _Tick(widget, callback))
+
+    def add_timeout(
+        self, widget: Gtk.Widget, interval: int, callback: Callable[[], bool]
+    ) -> int:
+        """`GLib.timeout_add(interval, callback)`, running only while visible."""
+        return self._add(widget, None, _Timeout(interval, callback))
+
+    def connect(self, widget: Gtk.Widget, obj, signal: str, handler: Callable) -> int:
+        """`obj.connect(signal, handler)`, connected only while `widget` is visible."""
+        return self._add(widget, None, _Subscription(obj, signal, handler))
+
+    def _add(self, widget: Gtk.Widget, callback, job: _Job | None) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+
+        self._track_widget(widget)
+        visible = self.is_visible(widget)
+        self._watches[handle] = _Watch(widget, callback, visible, job)
+        self._widgets[id(widget)][2].add(handle)
+
+        if job is not None:
+            job.on_done = lambda: self.unwatch(handle)
+            if visible:
+                job.resume()
+        return handle
+
+    # --- tracking ---
+
+    def _track_widget(self, widget: Gtk.Widget):
+        if id(widget) in self._widgets:
+            return
+        handlers = [
+            widget.connect("map", self._on_widget_mapped),
+            widget.connect("unmap", self._on_widget_changed),
+            widget.connect("destroy", self._on_widget_destroyed),
+        ]
+        self._widgets[id(widget)] = (widget, handlers, set())
+        if widget.get_mapped():
+            self._track_containers(widget)
+
+    def _forget_widget(self, widget: Gtk.Widget):
+        entry = self._widgets.pop(id(widget), None)
+        if entry is None:
+            return
+        for handler_id in entry[1]:
+            widget.disconnect(handler_id)
+
+    def _track_containers(self, widget: Gtk.Widget):
+        # the hierarchy is settled once mapped; hook every container that
+        # could hide the widget without unmapping it first
+        parent = widget.get_parent()
+        while parent is not None:
+            if id(parent) not in self._containers:
+                for kind, signals in _CONTAINER_SIGNALS:
+                    if isinstance(parent, kind):
+                        handlers = [
+                            parent.connect(signal, self._on_container_changed)
+                            for signal in signals
+                        ]
+                        handlers.append(
+                            parent.connect("destroy", self._on_container_destroyed)
+                        )
+                        self._containers[id(parent)] = (parent, handlers)
+                        break
+            parent = parent.get_parent()
+
+    def _on_widget_mapped(self, widget: Gtk.Widget):
+        self._track_containers(widget)
+        self._refresh(widget)
+
+    def _on_widget_changed(self, widget: Gtk.Widget):
+        self._refresh(widget)
+
+    def _on_widget_destroyed(self, widget: Gtk.Widget):
+        entry = self._widgets.get(id(widget))
+        if entry is None:
+            return
+        for handle in list(entry[2]):
+            self.unwatch(handle)
+        self._forget_widget(widget)
+
+    def _on_container_changed(self, *_):
+        for widget, _, _ in list(self._widgets.values()):
+            self._refresh(widget)
+
+    def _on_container_destroyed(self, container: Gtk.Widget):
+        entry = self._containers.pop(id(container), None)
+        if entry is not None:
+            for handler_id in entry[1]:
+                container.disconnect(handler_id)
+
+    def _refresh(self, widget: Gtk.Widget):
+        entry = self._widgets.get(id(widget))
+        if entry is None:
+            return
+        visible = self.is_visible(widget)
+        for handle in list(entry[2]):
+            watch = self._watches.get(handle)
+            if watch is None or watch.visible == visible:
+                continue
+            watch.visible = visible
+            try:
+                if watch.job is not None:
+                    watch.job.set_active(visible)
+                if watch.callback is not None:
+                    watch.callback(visible)
+            except Exception as e:
+                logger.exception(f"[Visibility] watcher failed: {e}")
@@ -3,6 +3,7 @@ from fabric.utils import get_relative_path, monitor_file
 
 from config.info import SHELL_NAME, ROOT_DIR
 from settings.window import SettingsWindow
+from services.theme_colors import ThemeColors
 
 from gi.repository import GLib
 
@@ -41,6 +42,7 @@ def main():
                 ),
             },
         )
+        ThemeColors().reload()
 
     app.style_monitor = monitor_file(get_relative_path("../styles"))
     app.style_monitor.connect("changed", load_css)
@@ -102,17 +102,9 @@ def get_screen_resolution_gdk() -> tuple[int, int]:
 
 
 def get_screen_resolution_i3() -> tuple[int, int]:
-    from fabric.i3.service import I3MessageType
-    from fabric.i3.widgets import get_i3_connection
+    from services.i3_service import I3Service
 
-    i3_conn = get_i3_connection()
-    i3_response = i3_conn.send_command("", I3MessageType.GET_OUTPUTS)
-
-    active = [
-        o
-        for o in i3_response.reply
-        if o.get("active") and not o["name"].startswith("xroot")
-    ]
+    active = I3Service().get_outputs()
 
     if not active:
         raise RuntimeError("No active i3 outputs")
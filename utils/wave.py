@@ -0,0 +1,157 @@
+"""
+Sine wave geometry shared by the wiggly bars, the wavy clock and the wavy
+circular scales.
+
+Horizontal waves look their samples up in one precomputed period: the column
+positions of a (start, end, frequency) are turned into table indices once,
+and a frame only shifts those indices by its phase. Ring waves whose caller
+marks them static (a clock face) replay a cached `cairo.Path`; animated ones
+are built fresh, so they neither pay for the copy nor evict static entries.
+Uses NumPy when installed, plain `math` otherwise.
+"""
+
+import math
+import cairo
+from collections import OrderedDict
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TABLE_SIZE = 4096  # samples per period, ~0.0015 rad of phase resolution
+_TO_INDEX = TABLE_SIZE / math.tau
+
+if NUMPY_AVAILABLE:
+    _SINE = np.sin(np.arange(TABLE_SIZE) * (math.tau / TABLE_SIZE))
+
+
+class _LRU(OrderedDict):
+    def __init__(self, size: int):
+        super().__init__()
+        self._size = size
+
+    def get(self, key):
+        value = super().get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self[key] = value
+        self.move_to_end(key)
+        if len(self) > self._size:
+            self.popitem(last=False)
+
+
+# (start, end, frequency) -> (columns, table index of each column at phase 0)
+_columns = _LRU(32)
+_ring_paths = _LRU(64)
+
+
+def _wave_columns(start: int, end: int, frequency: float):
+    key = (start, end, frequency)
+    cached = _columns.get(key)
+    if cached is None:
+        xs = np.arange(start, end, dtype=np.float64)
+        cached = (xs.tolist(), xs * (frequency * _TO_INDEX))
+        _columns.put(key, cached)
+    return cached
+
+
+def sine_wave(
+    cr: cairo.Context,
+    start: int,
+    end: int,
+    center_y: float,
+    amplitude: float,
+    frequency: float,
+    phase: float,
+) -> tuple[float, float] | None:
+    """
+    `line_to` a horizontal sine wave through the integer columns in
+    [start, end), continuing the current path. Returns the last point drawn,
+    or None if the range is empty.
+    """
+    if end <= start:
+        return None
+
+    if not NUMPY_AVAILABLE:
+        y = center_y
+        for x in range(start, end):
+            y = center_y + amplitude * math.sin(x * frequency + phase)
+            cr.line_to(x, y)
+        return end - 1, y
+
+    xs, base = _wave_columns(start, end, frequency)
+    # the phase is only an offset into the one precomputed period
+    shift = (phase % math.tau) * _TO_INDEX + 0.5  # round, not floor
+    index = (base + shift).astype(np.intp) % TABLE_SIZE
+    ys = (_SINE[index] * amplitude + center_y).tolist()
+
+    for x, y in zip(xs, ys):
+        cr.line_to(x, y)
+    return xs[-1], ys[-1]
+
+
+def ring_wave(
+    cr: cairo.Context,
+    cx: float,
+    cy: float,
+    radius: float,
+    start_angle: float,
+    end_angle: float,
+    amplitude: float,
+    frequency: float,
+    phase: float = 0.0,
+    steps: int = 200,
+    cache: bool = False,
+) -> None:
+    """
+    Start a new path along a circle of `radius` whose radius wobbles by a
+    sine wave, from `start_angle` to `end_angle` in `steps` segments.
+    `cache=True` is for geometry that is drawn again unchanged.
+    """
+    cr.new_path()
+    if cache:
+        key = (
+            round(cx, 2),
+            round(cy, 2),
+            round(radius, 2),
+            round(start_angle, 5),
+            round(end_angle, 5),
+            round(amplitude, 3),
+            frequency,
+            round(phase, 5),
+            steps,
+        )
+        path = _ring_paths.get(key)
+        if path is not None:
+            cr.append_path(path)
+            return
+
+    total = end_angle - start_angle
+    if NUMPY_AVAILABLE:
+        t = np.linspace(0.0, 1.0, steps + 1)
+        theta = start_angle + total * t
+        r = radius + amplitude * np.sin(frequency * total * t + phase)
+        xs = (cx + np.cos(theta) * r).tolist()
+        ys = (cy + np.sin(theta) * r).tolist()
+    else:
+        xs, ys = [], []
+        for i in range(steps + 1):
+            t = i / steps
+            theta = start_angle + total * t
+            r = radius + amplitude * math.sin(frequency * total * t + phase)
+            xs.append(cx + math.cos(theta) * r)
+            ys.append(cy + math.sin(theta) * r)
+
+    cr.move_to(xs[0], ys[0])
+    for i in range(1, steps + 1):
+        cr.line_to(xs[i], ys[i])
+
+    if cache:
+        _ring_paths.put(key, cr.copy_path())
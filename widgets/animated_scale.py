@@ -9,6 +9,8 @@ from fabric.widgets.circularscale import CircularScale as FabricCircularScale
 from fabric.utils.helpers import clamp
 
 from services.animator import Animator
+from utils.wave import ring_wave
+from widgets.layer_cache import LayerCache
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gdk, Gtk, GObject, GLib
@@ -39,7 +41,7 @@ class AnimatedScale(Scale):
         return
 
 
-class CircularScale(CircularProgressBar):
+class CircularScale(LayerCache, CircularProgressBar):
     def __init__(
         self,
         cap_delta: float = 0.01,
@@ -136,6 +138,7 @@ class CircularScale(CircularProgressBar):
         # TODO: add independent state support for each sub-node
         context.set_state(self.get_state_flags())
 
+        self.invalidate_layers()
         self.queue_draw()
 
     def do_get_border_width(
@@ -363,16 +366,8 @@ class CircularScale(CircularProgressBar):
 
         cr.close_path()
 
-    def do_draw(self, cr: cairo.Context) -> None:
-        state = self.get_state_flags()
-        style_context = self.get_style_context()
-
-        background_color = style_context.get_background_color(state)  # type: ignore
-
-        width = self.get_allocated_width()
-        height = self.get_allocated_height()
-        center_x = width / 2
-        center_y = height / 2
+    def do_read_style(self, state: Gtk.StateFlags) -> tuple:
+        background_color = self.get_style_context().get_background_color(state)  # type: ignore
 
         # slider properties
         slider_color = self._slider_ctx.get_background_color(state)  # type: ignore
@@ -390,6 +385,57 @@ class CircularScale(CircularProgressBar):
         trough_color = self._trough_ctx.get_background_color(state)  # type: ignore
         trough_thickness = self.do_get_border_width(self._trough_ctx, state)
 
+        return (
+            background_color,
+            slider_color,
+            slider_height,
+            slider_thickness,
+            left_gap,
+            right_gap,
+            corner_radius,
+            progress_color,
+            progress_thickness,
+            trough_color,
+            trough_thickness,
+        )
+
+    def do_draw_background(
+        self, cr: cairo.Context, radius: float, background_color: Gdk.RGBA
+    ) -> None:
+        cr.set_line_width(0)
+        Gdk.cairo_set_source_rgba(cr, background_color)
+        cr.arc(
+            self.get_allocated_width() / 2,
+            self.get_allocated_height() / 2,
+            radius,
+            0,
+            2 * math.pi,
+        )
+        cr.fill()
+
+    def do_draw(self, cr: cairo.Context) -> None:
+        state = self.get_state_flags()
+
+        width = self.get_allocated_width()
+        height = self.get_allocated_height()
+        center_x = width / 2
+        center_y = height / 2
+
+        # gadget lookups only change with the style, not per frame
+        (
+            background_color,
+            slider_color,
+            slider_height,
+            slider_thickness,
+            left_gap,
+            right_gap,
+            corner_radius,
+            progress_color,
+            progress_thickness,
+            trough_color,
+            trough_thickness,
+        ) = self.cached_style(("gadgets", int(state)), lambda: self.do_read_style(state))
+
         # calculate radius
         radius = self.do_calculate_radius()
         safe_radius = self.do_calculate_safe_radius(
@@ -400,15 +446,18 @@ class CircularScale(CircularProgressBar):
                 self.propagate_draw(child, cr)
             return
 
+        # background fill, a static layer
+        if background_color.alpha > 0:
+            self.paint_layer(
+                cr,
+                "background",
+                lambda cr, *_: self.do_draw_background(cr, radius, background_color),
+                key=(radius, background_color.to_string()),
+            )
+
         cr.save()
         cr.set_line_cap(self._line_style)
 
-        # background fill
-        cr.set_line_width(0)
-        Gdk.cairo_set_source_rgba(cr, background_color)
-        cr.arc(center_x, center_y, radius, 0, 2 * math.pi)
-        cr.fill()
-
         # angles (S = r*theta)
         left_gap_angle = left_gap / safe_radius
         right_gap_angle = right_gap / safe_radius
@@ -578,20 +627,15 @@ class WigglyCircularScale(AnimatedCircularScale):
         phase=0.0,
         steps=200,
     ):
-        total = end_angle - start_angle
-        cr.new_path()
-
-        for i in range(steps + 1):
-            t = i / steps
-            theta = start_angle + total * t
-
-            wobble = amplitude * math.sin(frequency * (theta - start_angle) + phase)
-
-            r = base_radius + wobble
-            x = cx + math.cos(theta) * r
-            y = cy + math.sin(theta) * r
-
-            if i == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
+        ring_wave(
+            cr,
+            cx,
+            cy,
+            base_radius,
+            start_angle,
+            end_angle,
+            amplitude,
+            frequency,
+            phase=phase,
+            steps=steps,
+        )
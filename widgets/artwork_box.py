@@ -0,0 +1,78 @@
+from typing import cast
+
+import cairo
+from fabric.widgets.box import Box
+
+from widgets.clipping_box import ClippingBox
+from services.artwork_cache import ArtworkCache, ArtworkKey, artwork_key
+
+
+class ArtworkBox(Box):
+    """
+    A `Box` that paints its background image from the shared `ArtworkCache`
+    instead of a CSS `background-image`. Swapping artwork only queues a redraw;
+    the previous image stays up until the new one has been decoded. Setting
+    the same path again picks up the file if it was rewritten since.
+    """
+
+    def __init__(
+        self, artwork: str | None = None, overlay: str | None = None, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self._cache = ArtworkCache()
+        self._layers: tuple[ArtworkKey | None, ArtworkKey | None] = (None, None)
+        self._shown: list[cairo.ImageSurface | None] = [None, None]
+        self.set_artwork(artwork, overlay)
+
+    def set_artwork(self, artwork: str | None, overlay: str | None = None):
+        """`overlay` is painted on top of `artwork`, e.g. a gradient."""
+        layers = (
+            artwork_key(str(artwork)) if artwork else None,
+            artwork_key(str(overlay)) if overlay else None,
+        )
+        if layers == self._layers:
+            return
+
+        self._layers = layers
+        for key in layers:
+            if key:
+                self._cache.load(key, self._on_loaded)
+        self.queue_draw()
+
+    def _on_loaded(self, key: ArtworkKey):
+        if key in self._layers:
+            self.queue_draw()
+
+    def do_draw(self, cr: cairo.Context):
+        width, height = self.get_allocated_width(), self.get_allocated_height()
+        scale = self.get_scale_factor()
+
+        cr.save()
+        ClippingBox.render_shape(
+            cr,
+            width,
+            height,
+            cast(
+                int,
+                self.get_style_context().get_property(
+                    "border-radius", self.get_state_flags()
+                ),
+            ),
+        )
+        cr.clip()
+
+        for i, key in enumerate(self._layers):
+            surface = (
+                self._cache.get_surface(key, width, height, scale) if key else None
+            )
+            if surface is not None or not key:
+                self._shown[i] = surface
+            if self._shown[i] is not None:
+                cr.set_source_surface(self._shown[i], 0, 0)
+                cr.paint()
+
+        # css background-color, borders and children on top
+        Box.do_draw(self, cr)
+
+        cr.restore()
+        return True
@@ -3,13 +3,14 @@ import cairo
 from typing import cast
 from fabric.widgets.box import Box
 from services.animator import Animator
+from widgets.layer_cache import LayerCache
 import gi
 
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk  # noqa: E402
 
 
-class ClippingBox(Box):
+class ClippingBox(LayerCache, Box):
     """A regular `Box` that replicates the CSS behaviour of `overflow: hidden` because GTK failed at it."""
 
     @staticmethod
@@ -33,17 +34,21 @@ class ClippingBox(Box):
         return cr.close_path()
 
     def do_draw(self, cr: cairo.Context):
+        state = self.get_state_flags()
+        radius = self.cached_style(
+            ("border-radius", int(state)),
+            lambda: cast(
+                int, self.get_style_context().get_property("border-radius", state)
+            ),
+        )
+        width, height = self.get_allocated_width(), self.get_allocated_height()
+
         cr.save()
-        ClippingBox.render_shape(
+        self.append_cached_path(
             cr,
-            self.get_allocated_width(),
-            self.get_allocated_height(),
-            cast(
-                int,
-                self.get_style_context().get_property(
-                    "border-radius", self.get_state_flags()
-                ),
-            ),
+            "clip",
+            lambda cr: ClippingBox.render_shape(cr, width, height, radius),
+            key=radius,
         )
         cr.clip()
 
@@ -53,7 +58,7 @@ class ClippingBox(Box):
         return True
 
 
-class TrueClippingBox(Box):
+class TrueClippingBox(LayerCache, Box):
     """Adds max-height/width support"""
 
     def __init__(self, max_width: int = -1, max_height: int = -1, **kwargs):
@@ -113,12 +118,20 @@ class TrueClippingBox(Box):
         Box.do_size_allocate(self, alloc)
 
     def do_draw(self, cr: cairo.Context) -> bool:
-        radius = self.get_style_context().get_property(
-            "border-radius", self.get_state_flags()
+        state = self.get_state_flags()
+        radius = self.cached_style(
+            ("border-radius", int(state)),
+            lambda: self.get_style_context().get_property("border-radius", state),
         )
+        width, height = self.get_allocated_width(), self.get_allocated_height()
+
         cr.save()
-        self._rounded_rect(
-            cr, self.get_allocated_width(), self.get_allocated_height(), radius
+        # re-recorded on every step of a height animation, replayed otherwise
+        self.append_cached_path(
+            cr,
+            "clip",
+            lambda cr: self._rounded_rect(cr, width, height, radius),
+            key=radius,
         )
         cr.clip()
         Box.do_draw(self, cr)
@@ -3,8 +3,9 @@ import time
 import cairo
 from collections import deque
 
-from config.info import ROOT_DIR
-from utils.colors import hex_to_rgb01, get_css_variable
+from services.theme_colors import ThemeColors
+from services.animation_scheduler import AnimationScheduler
+from services.visibility import VisibilityTracker
 
 import gi
 
@@ -36,8 +37,11 @@ class AnimatedBarGraph(Gtk.DrawingArea):
 
         self.data: deque[dict] = deque()
 
+        self._refresh_colors(ThemeColors())
+        ThemeColors().redraw_on_change(self, self._refresh_colors)
+
         self.connect("draw", self._on_draw)
-        self.add_tick_callback(self._tick)
+        VisibilityTracker().add_tick_callback(self, self._tick)
         self.show_all()
 
     def add_value(self, value: float) -> None:
@@ -64,6 +68,9 @@ class AnimatedBarGraph(Gtk.DrawingArea):
 
         self.bar_width = max(2.0, min(50.0, calculated_width))
 
+    def _refresh_colors(self, colors: ThemeColors) -> None:
+        self._bar_color = colors.get("--surface-bright")
+
     def _trim_data(self) -> None:
         cutoff = time.time() - self._history_seconds - 1  # keep one extra
         while self.data and self.data[0]["time"] < cutoff:
@@ -110,17 +117,14 @@ class AnimatedBarGraph(Gtk.DrawingArea):
         cr.line_to(x, y + h)
         cr.close_path()
 
-        hr_r, hr_g, hr_b = hex_to_rgb01(
-            get_css_variable(f"{ROOT_DIR}/styles/colors.css", "--surface-bright")
-        )
-        cr.set_source_rgba(hr_r, hr_g, hr_b, 1.0)
-
+        cr.set_source_rgba(*self._bar_color, 1.0)
         cr.fill()
 
 
 class CircularGraph(Gtk.DrawingArea):
     EPSILON = 0.001
-    LERP_SPEED = 0.1
+    LERP_SPEED = 0.1  # share of the distance covered per LERP_STEP
+    LERP_STEP = 0.033  # seconds
     INNER_RADIUS = 70
     MAX_EXTRA_RAD = 100
 
@@ -133,11 +137,18 @@ class CircularGraph(Gtk.DrawingArea):
         self.current_usage = [0.0] * self.bar_count
         self.target_usage = [0.0] * self.bar_count
         self.is_animating = False
+        self._last_time = 0.0
+
+        self._refresh_colors(ThemeColors())
+        ThemeColors().redraw_on_change(self, self._refresh_colors)
 
         self.connect("draw", self._on_draw)
         
         self.show_all()
 
+    def _refresh_colors(self, colors: ThemeColors) -> None:
+        self._bar_color = colors.get("--surface-bright")
+
     def _update_targets(self, targets: list) -> bool:
         self.target_usage = targets
 
@@ -145,23 +156,28 @@ class CircularGraph(Gtk.DrawingArea):
         # the middle due to fast updates
         if not self.is_animating:
             self.is_animating = True
-            GLib.timeout_add(33, self._animate)
+            self._last_time = GLib.get_monotonic_time() / 1_000_000
+            AnimationScheduler().add(self._animate, self)
         return True
 
-    def _animate(self) -> bool:
+    def _animate(self, frame_time: float) -> bool:
         still_moving = False
-        
+
+        # same exponential approach as one LERP_SPEED step per 33 ms,
+        # whatever the actual frame rate
+        elapsed = max(0.0, frame_time - self._last_time)
+        self._last_time = frame_time
+        factor = 1 - (1 - self.LERP_SPEED) ** (elapsed / self.LERP_STEP)
+
         for i in range(self.bar_count):
             diff = self.target_usage[i] - self.current_usage[i]
             
             if abs(diff) > self.EPSILON:
-                self.current_usage[i] += diff * self.LERP_SPEED
+                self.current_usage[i] += diff * factor
                 still_moving = True
             else:
                 self.current_usage[i] = self.target_usage[i]
 
-        self.queue_draw()
-
         if not still_moving:
             self.is_animating = False
             return False 
@@ -182,10 +198,7 @@ class CircularGraph(Gtk.DrawingArea):
             r_inner = self.INNER_RADIUS
             r_outer = r_inner + usage / 100.0 * self.MAX_EXTRA_RAD
 
-            hr_r, hr_g, hr_b = hex_to_rgb01(
-                get_css_variable(f"{ROOT_DIR}/styles/colors.css", "--surface-bright")
-            )
-            cr.set_source_rgba(hr_r, hr_g, hr_b, 1.0)
+            cr.set_source_rgba(*self._bar_color, 1.0)
 
             cr.move_to(math.cos(angle) * r_inner, math.sin(angle) * r_inner)
             cr.line_to(math.cos(angle) * r_outer, math.sin(angle) * r_outer)
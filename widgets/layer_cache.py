@@ -0,0 +1,104 @@
+import cairo
+from typing import Callable, Hashable
+
+from services.theme_colors import ThemeColors
+
+from gi.repository import Gtk
+
+
+class LayerCache:
+    """
+    Mixin for custom-drawn widgets whose frames are mostly static.
+
+    Static pixels (backgrounds, troughs, masks) are rendered once into a
+    surface similar to the widget's window with `paint_layer`, static shapes
+    (rounded clip paths) are recorded once with `append_cached_path`, and
+    style lookups are memoized with `cached_style`. Everything is keyed by
+    allocation size and scale and dropped on style or theme changes, so a
+    frame only composites the cache and draws what actually moves.
+    """
+
+    def _layers(self) -> dict:
+        layers = getattr(self, "_layer_entries", None)
+        if layers is None:
+            layers = self._layer_entries = {}
+            self.connect("style-updated", lambda *_: self.invalidate_layers())
+            ThemeColors().redraw_on_change(self, lambda *_: self.invalidate_layers())
+        return layers
+
+    def invalidate_layers(self) -> None:
+        layers = getattr(self, "_layer_entries", None)
+        if layers:
+            layers.clear()
+
+    def cached_style(self, name: Hashable, compute: Callable[[], object]):
+        """`compute()`, remembered until the widget's style changes."""
+        layers = self._layers()
+        key = ("style", name)
+        if key not in layers:
+            layers[key] = compute()
+        return layers[key]
+
+    def paint_layer(
+        self,
+        cr: cairo.Context,
+        name: str,
+        render: Callable[[cairo.Context, int, int], None],
+        key: Hashable = (),
+    ) -> None:
+        """
+        Paint the static layer `name`, calling `render(cr, width, height)` on
+        an offscreen surface only when the size, scale or `key` changed.
+        """
+        width = self.get_allocated_width()
+        height = self.get_allocated_height()
+        layer_key = (width, height, self.get_scale_factor(), key)
+
+        layers = self._layers()
+        entry = layers.get(name)
+        if entry is None or entry[0] != layer_key:
+            window = _realized_window(self)
+            if window is None or width <= 0 or height <= 0:
+                render(cr, width, height)  # nothing to cache against yet
+                return
+            # scaled like the window, so HiDPI layers stay sharp
+            surface = window.create_similar_surface(
+                cairo.Content.COLOR_ALPHA, width, height
+            )
+            layer_cr = cairo.Context(surface)
+            render(layer_cr, width, height)
+            surface.flush()
+            entry = layers[name] = (layer_key, surface)
+
+        cr.save()
+        cr.set_source_surface(entry[1], 0, 0)
+        cr.paint()
+        cr.restore()
+
+    def append_cached_path(
+        self,
+        cr: cairo.Context,
+        name: str,
+        build: Callable[[cairo.Context], None],
+        key: Hashable = (),
+    ) -> None:
+        """
+        Replace the current path with the static path `name`, built by
+        `build(cr)` only when the size or `key` changed.
+        """
+        path_key = (self.get_allocated_width(), self.get_allocated_height(), key)
+
+        layers = self._layers()
+        entry = layers.get(name)
+        cr.new_path()
+        if entry is not None and entry[0] == path_key:
+            cr.append_path(entry[1])
+            return
+
+        build(cr)
+        layers[name] = (path_key, cr.copy_path())
+
+
+def _realized_window(widget: Gtk.Widget):
+    # no-window widgets draw into their parent's window, which is fine here
+    return widget.get_window() if widget.get_realized() else None
@@ -5,8 +5,10 @@ import cairo
 from fabric.widgets.image import Image
 from gi.repository import Gtk
 
+from widgets.layer_cache import LayerCache
 
-class RoundedImage(Image):
+
+class RoundedImage(LayerCache, Image):
     def do_render_rectangle(
         self, cr: cairo.Context, width: int, height: int, radius: int = 0
     ):
@@ -22,15 +24,23 @@ class RoundedImage(Image):
         cr.close_path()
 
     def do_draw(self, cr: cairo.Context):
-        context = self.get_style_context()
         width, height = self.get_allocated_width(), self.get_allocated_height()
+        radius = self.cached_style(
+            "border-radius",
+            lambda: cast(
+                int,
+                self.get_style_context().get_property(
+                    "border-radius", Gtk.StateFlags.NORMAL
+                ),
+            ),
+        )
         cr.save()
 
-        self.do_render_rectangle(
+        self.append_cached_path(
             cr,
-            width,
-            height,
-            cast(int, context.get_property("border-radius", Gtk.StateFlags.NORMAL)),
+            "clip",
+            lambda cr: self.do_render_rectangle(cr, width, height, radius),
+            key=radius,
         )
         cr.clip()
         Image.do_draw(self, cr)
@@ -8,6 +8,8 @@ from OpenGL.GL.shaders import compileShader, compileProgram
 from fabric import Application, Signal, Property
 from fabric.widgets.widget import Widget
 
+from services.visibility import VisibilityTracker
+
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
 
@@ -146,8 +148,10 @@ class Shadertoy(Gtk.GLArea, Widget):
         self._frame_count = 0
 
         # to avoid a constant framerate we tell
-        # gtk to render a frame whenever possible
-        self._tick_id = self.add_tick_callback(lambda *_: (self.queue_draw(), True)[1])
+        # gtk to render a frame whenever possible (while on screen)
+        self._tick_id = VisibilityTracker().add_tick_callback(
+            self, lambda *_: (self.queue_draw(), True)[1]
+        )
         self.set_has_alpha(True)
         GL.glEnable(GL.GL_BLEND)
         GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
@@ -237,7 +241,7 @@ class Shadertoy(Gtk.GLArea, Widget):
     def do_render(self, ctx: Gdk.GLContext):
         if not self._program:
             if self._tick_id:
-                self.remove_tick_callback(self._tick_id)
+                VisibilityTracker().unwatch(self._tick_id)
             self._tick_id = 0
             return False
 
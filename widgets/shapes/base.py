@@ -1,7 +1,6 @@
 from typing import Tuple
 
-from config.info import ROOT_DIR
-from utils.colors import get_css_variable, hex_to_rgb01
+from services.theme_colors import ThemeColors
 
 import gi
 gi.require_version("Gtk", "3.0")
@@ -17,6 +16,7 @@ class Shape(Gtk.DrawingArea):
         self.dark = dark
         self._override_color: Tuple[float, float, float] | None = override_color
         self.connect("draw", self.on_draw)
+        ThemeColors().redraw_on_change(self)
         self.show()
 
     def _get_color(self) -> Tuple[float, float, float]:
@@ -24,11 +24,7 @@ class Shape(Gtk.DrawingArea):
         if self._override_color is not None:
             return self._override_color
 
-        hex_color = get_css_variable(
-            f"{ROOT_DIR}/styles/colors.css",
-            "--on-primary" if self.dark else "--primary",
-        )
-        return hex_to_rgb01(hex_color)
+        return ThemeColors().get("--on-primary" if self.dark else "--primary")
 
     def set_color(self, rgb: Tuple[float, float, float] | None, redraw: bool = True):
         """Override the shape color and optionally trigger a redraw."""
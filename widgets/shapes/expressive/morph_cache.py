@@ -0,0 +1,231 @@
+import os
+import json
+import hashlib
+import threading
+from loguru import logger
+
+import expressive_shapes
+from expressive_shapes.morph.bezier_morph import Morph
+from expressive_shapes.geometry.bezier_geometry import Cubic, Point
+from expressive_shapes.geometry.rounded_polygon import RoundedPolygon
+
+from config.info import CACHE_DIR
+
+from .morph_path import MorphPath
+
+from gi.repository import GLib
+
+MORPH_CACHE_FILE = os.path.join(
+    CACHE_DIR, f"morphs-{expressive_shapes.__version__}.json"
+)
+SAVE_DELAY = 2  # seconds, a prefetch finishes many pairs at once
+
+# flat floats per matched pair: start then end cubic, 4 points each
+_PAIR_STRIDE = 16
+
+Shape = list  # preset unit data: [((x, y), CornerRounding), ...]
+MatchedPairs = list[tuple[Cubic, Cubic]]
+
+
+def create_rounded_polygon(unit_data: Shape) -> RoundedPolygon:
+    verts = []
+    per_vertex = []
+    for (ux, uy), rounding_preset in unit_data:
+        verts.extend([ux, uy])
+        per_vertex.append(rounding_preset)
+
+    return RoundedPolygon.create(vertices=verts, per_vertex_rounding=per_vertex)
+
+
+def _pack(pairs: MatchedPairs) -> list[float]:
+    flat = []
+    for pair in pairs:
+        for c in pair:
+            for p in (c.p0, c.p1, c.p2, c.p3):
+                flat.append(round(p.x, 6))
+                flat.append(round(p.y, 6))
+    return flat
+
+
+def _unpack(flat: list[float]) -> MatchedPairs:
+    pairs = []
+    for i in range(0, len(flat), _PAIR_STRIDE):
+        v = flat[i : i + _PAIR_STRIDE]
+        start = Cubic(*(Point(v[j], v[j + 1]) for j in range(0, 8, 2)))
+        end = Cubic(*(Point(v[j], v[j + 1]) for j in range(8, 16, 2)))
+        pairs.append((start, end))
+    return pairs
+
+
+class MorphCache:
+    """
+    Process-wide `Morph.match` results for pairs of shape presets.
+
+    Pairs are keyed by a digest of both shapes' data, so presets don't need
+    names and an edited preset simply misses. Matches are computed on a
+    worker thread via `prefetch`, kept packed as flat float lists and written
+    to the cache dir per library version; `get` only falls back to matching
+    on the calling thread for a pair nobody asked for in advance. Callers that
+    must never block check `has` first, or wait with `notify_ready`.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._init_singleton()
+        return cls._instance
+
+    def _init_singleton(self):
+        self._packed: dict[str, list[float]] = self._load()
+        self._decoded: dict[str, MatchedPairs] = {}
+        self._paths: dict[str, MorphPath] = {}
+        # by content: each button builds its own lists, and ids get reused
+        self._digests: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+        self._queued: set[str] = set()
+        self._jobs: list[tuple[str, Shape, Shape]] = []
+        self._waiters: dict[str, list] = {}  # key -> callbacks
+        self._worker: threading.Thread | None = None
+        self._save_id: int | None = None
+        self._write_lock = threading.Lock()
+
+    # --- lookups ---
+
+    def get(self, start: Shape, end: Shape) -> MatchedPairs:
+        key = self._key(start, end)
+        if (pairs := self._decoded.get(key)) is not None:
+            return pairs
+
+        with self._lock:
+            packed = self._packed.get(key)
+        if packed is None:
+            logger.debug("[Shapes] morph pair not prefetched, matching inline")
+            packed = self._match(key, start, end)
+
+        pairs = self._decoded[key] = _unpack(packed)
+        return pairs
+
+    def get_path(self, start: Shape, end: Shape) -> MorphPath:
+        """Drawable form of `get`, shared by every widget morphing this pair."""
+        key = self._key(start, end)
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = MorphPath(self.get(start, end))
+        return path
+
+    def has(self, start: Shape, end: Shape) -> bool:
+        """Whether `get` would return without matching."""
+        key = self._key(start, end)
+        if key in self._decoded:
+            return True
+        with self._lock:
+            return key in self._packed
+
+    def notify_ready(self, start: Shape, end: Shape, callback) -> None:
+        """Call `callback()` on the main loop once the pair has been matched."""
+        key = self._key(start, end)
+        with self._lock:
+            if key not in self._packed:
+                self._waiters.setdefault(key, []).append(callback)
+                return
+        GLib.idle_add(lambda: callback() or False)
+
+    def prefetch(self, pairs) -> None:
+        """Match every `(start, end)` in `pairs` that isn't cached yet, off-thread."""
+        with self._lock:
+            for start, end in pairs:
+                key = self._key(start, end)
+                if key in self._packed or key in self._queued:
+                    continue
+                self._queued.add(key)
+                self._jobs.append((key, start, end))
+
+            if self._jobs and self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_jobs, name="morph-cache", daemon=True
+                )
+                self._worker.start()
+
+    # --- matching ---
+
+    def _key(self, start: Shape, end: Shape) -> str:
+        return f"{self._digest(start)}>{self._digest(end)}"
+
+    def _digest(self, shape: Shape) -> str:
+        data = tuple(
+            (x, y, rounding.radius, rounding.smoothing) for (x, y), rounding in shape
+        )
+        digest = self._digests.get(data)
+        if digest is None:
+            # same text as the old list repr, so saved keys stay valid
+            text = repr(list(data)).encode()
+            digest = hashlib.blake2b(text, digest_size=8).hexdigest()
+            self._digests[data] = digest
+        return digest
+
+    def _match(self, key: str, start: Shape, end: Shape) -> list[float]:
+        packed = _pack(
+            Morph.match(create_rounded_polygon(start), create_rounded_polygon(end))
+        )
+        with self._lock:
+            self._packed[key] = packed
+            waiters = self._waiters.pop(key, [])
+        GLib.idle_add(self._schedule_save)
+        for callback in waiters:
+            GLib.idle_add(lambda callback=callback: callback() or False)
+        return packed
+
+    def _run_jobs(self):
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    self._worker = None
+                    return
+                key, start, end = self._jobs.pop(0)
+            try:
+                self._match(key, start, end)
+            except Exception as e:
+                logger.warning(f"[Shapes] Failed to match morph pair: {e}")
+            finally:
+                with self._lock:
+                    self._queued.discard(key)
+
+    # --- persistence ---
+
+    @staticmethod
+    def _load() -> dict[str, list[float]]:
+        try:
+            with open(MORPH_CACHE_FILE) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Shapes] Ignoring unreadable morph cache: {e}")
+            return {}
+
+    def _schedule_save(self) -> bool:
+        if self._save_id is None:
+            self._save_id = GLib.timeout_add_seconds(SAVE_DELAY, self._save)
+        return False
+
+    def _save(self) -> bool:
+        self._save_id = None
+        with self._lock:
+            snapshot = dict(self._packed)
+        threading.Thread(
+            target=self._write, args=(snapshot,), name="morph-cache", daemon=True
+        ).start()
+        return False
+
+    def _write(self, snapshot: dict[str, list[float]]):
+        with self._write_lock:
+            tmp = MORPH_CACHE_FILE + ".tmp"
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(tmp, "w") as f:
+                    json.dump(snapshot, f, separators=(",", ":"))
+                os.replace(tmp, MORPH_CACHE_FILE)
+            except OSError as e:
+                logger.warning(f"[Shapes] Failed to write morph cache: {e}")
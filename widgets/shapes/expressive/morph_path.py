@@ -0,0 +1,95 @@
+import cairo
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from expressive_shapes.geometry.bezier_geometry import Cubic
+
+# one row per cubic: p0, p1, p2, p3 as x, y pairs
+_ROW = 8
+
+
+def _rows(pairs: list[tuple[Cubic, Cubic]], side: int) -> list[list[float]]:
+    rows = []
+    for pair in pairs:
+        c = pair[side]
+        rows.append([c.p0.x, c.p0.y, c.p1.x, c.p1.y, c.p2.x, c.p2.y, c.p3.x, c.p3.y])
+    return rows
+
+
+class MorphPath:
+    """
+    A matched morph kept as flat start/end control points, so a frame is one
+    lerp and a run of `curve_to`s instead of a list of new `Cubic`s.
+
+    Same outline as `Morph.as_cubics`. The resting shapes (alpha 0 and 1) are
+    recorded once as `cairo.Path`s and replayed with `append_path`. Uses NumPy
+    when installed, a preallocated list otherwise.
+    """
+
+    def __init__(self, pairs: list[tuple[Cubic, Cubic]]):
+        start = _rows(pairs, 0)
+        end = _rows(pairs, 1)
+        self._count = len(start)
+        self._resting: dict[float, cairo.Path] = {}
+
+        if NUMPY_AVAILABLE:
+            self._start = np.asarray(start, dtype=np.float64).reshape(-1, _ROW)
+            self._delta = np.asarray(end, dtype=np.float64).reshape(-1, _ROW)
+            self._delta -= self._start
+            self._out = np.empty_like(self._start)
+            # flat float view of `_out`, read without building a list a frame
+            self._values = memoryview(self._out.reshape(-1))
+        else:
+            self._start = [v for row in start for v in row]
+            self._delta = [
+                e - s for e, s in zip((v for row in end for v in row), self._start)
+            ]
+            self._out = [0.0] * len(self._start)
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def _interpolate(self, alpha: float):
+        if NUMPY_AVAILABLE:
+            np.multiply(self._delta, alpha, out=self._out)
+            self._out += self._start
+            return self._values
+
+        out = self._out
+        for i, (s, d) in enumerate(zip(self._start, self._delta)):
+            out[i] = s + d * alpha
+        return out
+
+    def append_to(self, ctx: cairo.Context, alpha: float) -> None:
+        """Add the outline at `alpha` to the current path, in unit coordinates."""
+        if not self._count:
+            return
+
+        # only a path drawn from scratch can be replayed on its own
+        resting = alpha in (0.0, 1.0) and not ctx.has_current_point()
+        if resting:
+            path = self._resting.get(alpha)
+            if path is not None:
+                ctx.append_path(path)
+                return
+
+        v = self._interpolate(alpha)
+        ctx.move_to(v[0], v[1])
+        last = (self._count - 1) * _ROW
+        for i in range(0, last, _ROW):
+            ctx.curve_to(v[i + 2], v[i + 3], v[i + 4], v[i + 5], v[i + 6], v[i + 7])
+        # close onto the first anchor, like `Morph.as_cubics`
+        ctx.curve_to(
+            v[last + 2], v[last + 3], v[last + 4], v[last + 5], v[0], v[1]
+        )
+        ctx.close_path()
+
+        if resting:
+            # user space coordinates, valid for any later scale
+            self._resting[alpha] = ctx.copy_path()
@@ -41,6 +41,11 @@ from expressive_shapes.shapes.shape_presets import (
 
 from fabric.widgets.container import Container
 
+from services.animation_scheduler import AnimationScheduler
+from utils.easing import material_emphasized
+
+from .morph_cache import MorphCache
+
 import gi
 
 gi.require_version("Gtk", "3.0")
@@ -315,103 +320,56 @@ class AnimateShapeMorph(Gtk.DrawingArea):
         self.current_idx = 0
 
         self.progress = 0.0
-        self.animation_speed = 0.032
-        self.pause_frames = 20
-        self.pause_counter = 0
-
+        self.duration = 0.5  # seconds per morph
+        self.pause = 0.32  # seconds between morphs
+        self._last_time = 0.0
+        self._anim_id = None
+        self._pause_id = None
+
+        MorphCache().prefetch(
+            (shape, self.presets[(i + 1) % len(self.presets)])
+            for i, shape in enumerate(self.presets)
+        )
         self._prepare_next_morph()
 
         self.connect("draw", self.on_draw)
-        GLib.timeout_add(16, self.update_animation)  # ~60 fps
+        self.connect("destroy", self._on_destroy)
+        self._start_morph()
         self.show_all()
 
-    def _prepare_next_morph(self):
-        next_idx = (self.current_idx + 1) % len(self.presets)
-
-        poly_start = self.create_rounded_polygon(self.presets[self.current_idx])
-        poly_end = self.create_rounded_polygon(self.presets[next_idx])
-
-        self.mappings = Morph.match(poly_start, poly_end)
+    def _start_morph(self) -> bool:
+        self._pause_id = None
+        self._last_time = GLib.get_monotonic_time() / 1_000_000
+        self._anim_id = AnimationScheduler().add(self.update_animation, self)
+        return False
 
-    @staticmethod
-    def _cubic_bezier(x1, y1, x2, y2):
-        def _sample_x(t):
-            return 3.0 * x1 * t * (1 - t) ** 2 + 3.0 * x2 * t**2 * (1 - t) + t**3
-
-        def _sample_y(t):
-            return 3.0 * y1 * t * (1 - t) ** 2 + 3.0 * y2 * t**2 * (1 - t) + t**3
-
-        def _dx_dt(t):
-            return (
-                3.0 * x1 * (1 - t) ** 2
-                + 6.0 * (x2 - x1) * t * (1 - t)
-                + 3.0 * (1 - x2) * t**2
-            )
-
-        def easing(x):
-            if x <= 0.0:
-                return 0.0
-            if x >= 1.0:
-                return 1.0
-
-            # Newton-Raphson: solve _sample_x(t) = x for t
-            t = x  # initial guess
-            for _ in range(8):
-                dx = _dx_dt(t)
-                if abs(dx) < 1e-12:
-                    break
-                t -= (_sample_x(t) - x) / dx
-                t = max(0.0, min(1.0, t))
-
-            # Bisection fallback if Newton didn't converge
-            if abs(_sample_x(t) - x) > 1e-6:
-                lo, hi = 0.0, 1.0
-                for _ in range(20):
-                    t = (lo + hi) / 2.0
-                    if _sample_x(t) < x:
-                        lo = t
-                    else:
-                        hi = t
-
-            return _sample_y(t)
-
-        return easing
-
-    def material_easing(self, t):
-        if not hasattr(self, "_m3_ease_in"):
-            self._m3_ease_in = self._cubic_bezier(0.05, 0.0, 0.133333, 0.06)
-            self._m3_ease_out = self._cubic_bezier(0.208333, 0.82, 0.25, 1.0)
-
-        if t < 0.4:
-            return self._m3_ease_in(t / 0.4) * 0.2
-        else:
-            return 0.2 + self._m3_ease_out((t - 0.4) / 0.6) * 0.8
+    def _on_destroy(self, *_):
+        AnimationScheduler().remove(self._anim_id)
+        if self._pause_id is not None:
+            GLib.source_remove(self._pause_id)
+            self._pause_id = None
 
-    def update_animation(self):
-        # handle the pause between shapes
-        if self.pause_counter > 0:
-            self.pause_counter -= 1
-            return True
+    def _prepare_next_morph(self):
+        next_idx = (self.current_idx + 1) % len(self.presets)
+        self.morph_path = MorphCache().get_path(
+            self.presets[self.current_idx], self.presets[next_idx]
+        )
 
-        self.progress += self.animation_speed
+    def update_animation(self, frame_time: float) -> bool:
+        self.progress += max(0.0, frame_time - self._last_time) / self.duration
+        self._last_time = frame_time
 
         if self.progress >= 1.0:
             self.progress = 0.0
             self.current_idx = (self.current_idx + 1) % len(self.presets)
-            self.pause_counter = self.pause_frames
             self._prepare_next_morph()
 
-        self.queue_draw()
-        return True
-
-    def create_rounded_polygon(self, unit_data):
-        verts = []
-        per_vertex = []
-        for (ux, uy), rounding_preset in unit_data:
-            verts.extend([ux, uy])
-            per_vertex.append(rounding_preset)
+            # nothing moves during the pause, so nothing ticks either
+            self._anim_id = None
+            self._pause_id = GLib.timeout_add(int(self.pause * 1000), self._start_morph)
+            return False
 
-        return RoundedPolygon.create(vertices=verts, per_vertex_rounding=per_vertex)
+        return True
 
     def on_draw(self, widget, ctx: cairo.Context):
         width = self.get_allocated_width()
@@ -428,17 +386,12 @@ class AnimateShapeMorph(Gtk.DrawingArea):
         scale_factor = side
         ctx.scale(scale_factor, scale_factor)
 
-        alpha = self.material_easing(self.progress)
+        alpha = material_emphasized(self.progress)
 
-        curves = Morph.as_cubics(self.mappings, alpha)
-        if not curves:
+        if not self.morph_path:
             return False
 
-        ctx.move_to(curves[0].p0.x, curves[0].p0.y)
-        for c in curves:
-            ctx.curve_to(c.p1.x, c.p1.y, c.p2.x, c.p2.y, c.p3.x, c.p3.y)
-
-        ctx.close_path()
+        self.morph_path.append_to(ctx, alpha)
 
         ctx.set_line_width(0)
         ctx.stroke_preserve()